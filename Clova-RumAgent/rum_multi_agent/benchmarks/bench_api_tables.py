@@ -0,0 +1,78 @@
+"""
+정기보고서 API 데이터 프롬프트 압축 벤치마크
+
+사용법 (rum_multi_agent 디렉토리에서, 그래프 실행과 같은 API 키 환경변수 필요):
+    python -m benchmarks.bench_api_tables [출판물 검색 결과 JSON]
+
+pub_searcher/pub_search_result.json 의 정기보고서마다 API 데이터를 DART JSON 행(raw_data) 또는
+마크다운 표(processed_data) 그대로 넣을 때와 한글 머리글 TSV 로 변환했을 때의 근사 토큰 수,
+변환 시간(첫 파싱/메모이즈 조회)을 비교합니다.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rum_multi_agent.api_tables import _format_text, format_api_data  # noqa: E402
+from rum_multi_agent.nodes import DEFAULT_API_KEYS  # noqa: E402
+from rum_multi_agent.routing import estimate_tokens  # noqa: E402
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "pub_searcher" / "pub_search_result.json"
+
+
+def load_reports(path: Path) -> list:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return [
+        report for report in (data.get("regular_results") or {}).get("available_reports", [])
+        if (report.get("processed_data") or {}).get("api_data")
+    ]
+
+
+def measure(reports: list, api_keys=None) -> dict:
+    """보고서 전체의 원문/TSV 토큰 수와 변환 시간 (api_keys 가 None 이면 모든 API)"""
+    json_tokens = raw_tokens = tsv_tokens = 0
+    first_ms = cached_ms = 0.0
+    _format_text.cache_clear()
+    for report in reports:
+        api_data = report["processed_data"]["api_data"]
+        json_rows = (report.get("raw_data") or {}).get("api_data") or {}
+        for api_key in api_keys or api_data:
+            data = api_data.get(api_key)
+            if data is None:
+                continue
+            started = time.perf_counter()
+            text = format_api_data(api_key, data)
+            first_ms += (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            format_api_data(api_key, data)
+            cached_ms += (time.perf_counter() - started) * 1000
+            raw_tokens += estimate_tokens(data)
+            tsv_tokens += estimate_tokens(text)
+            json_tokens += estimate_tokens(json.dumps(json_rows.get(api_key), ensure_ascii=False))
+    return {"json": json_tokens, "raw": raw_tokens, "tsv": tsv_tokens, "first_ms": first_ms, "cached_ms": cached_ms}
+
+
+def main(path: Path = DEFAULT_PATH):
+    """결과 출력"""
+    reports = load_reports(path)
+    print(f"=== API 데이터 프롬프트 압축 벤치마크 (정기보고서 {len(reports)}건) ===")
+    for name, api_keys in [(f"기본 API ({', '.join(DEFAULT_API_KEYS)})", DEFAULT_API_KEYS), ("전체 API", None)]:
+        result = measure(reports, api_keys)
+        print(name)
+        tsv = max(result['tsv'], 1)
+        print(
+            f"  토큰 JSON 행 {result['json']:,} / 마크다운 {result['raw']:,} → TSV {result['tsv']:,} "
+            f"({result['json'] / tsv:.1f}배 / {result['raw'] / tsv:.1f}배 감소)"
+        )
+        print(
+            f"  변환 시간 보고서당 첫 파싱 {result['first_ms'] / len(reports):.2f}ms, "
+            f"메모이즈 {result['cached_ms'] / len(reports) * 1000:.1f}µs"
+        )
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH)
@@ -0,0 +1,63 @@
+"""
+블롭 저장소 체크포인트 크기 벤치마크
+
+사용법 (rum_multi_agent 디렉토리에서, langgraph 필요):
+    python -m benchmarks.bench_blob_store
+
+뉴스 수/본문 길이별로 state 에 값을 직접 넣을 때와 블롭 핸들을 넣을 때의
+체크포인트 직렬화(JsonPlusSerializer) 크기와 시간을 비교합니다.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer  # noqa: E402
+
+from blob_store import BlobStore  # noqa: E402
+
+CASES = ((20, 20), (100, 20), (100, 200), (500, 200))  # (뉴스 수, 본문 반복 수)
+REPEAT = 20
+
+
+def news_item(i: int, body_chars: int) -> dict:
+    return {
+        "title": f"하이브 방시혁 관련 기사 {i}",
+        "date": "2025-10-01 12:00",
+        "link": f"https://n.news.naver.com/article/{i}",
+        "description": ("하이브 매출과 방시혁 의장 관련 보도 내용 " * body_chars)[:body_chars * 10],
+        "outlet_count": 1,
+    }
+
+
+def measure(serde, state) -> tuple:
+    """직렬화 크기(bytes)와 1회 평균 시간(ms)"""
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        _, data = serde.dumps_typed(state)
+    return len(data), (time.perf_counter() - started) * 1000 / REPEAT
+
+
+def main():
+    """결과 출력"""
+    serde = JsonPlusSerializer()
+    store = BlobStore(tempfile.mkdtemp(), ttl_seconds=None, max_bytes=None)
+
+    print(f"{'뉴스 수':>6} {'본문(자)':>8} {'직접 저장':>18} {'핸들':>18}")
+    for count, body in CASES:
+        items = [news_item(i, body) for i in range(count)]
+        inline_state = {"news_results": {"items": items}, "searched_list": {"news": items}}
+        handle_state = {
+            "news_results": store.put({"items": items}),
+            "searched_list": {"news": [dict(item, description=store.put(item["description"])) for item in items]},
+        }
+        inline_size, inline_ms = measure(serde, inline_state)
+        handle_size, handle_ms = measure(serde, handle_state)
+        print(f"{count:>6} {body * 10:>8} {inline_size / 1024:8.1f}KB {inline_ms:6.2f}ms {handle_size / 1024:8.1f}KB {handle_ms:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
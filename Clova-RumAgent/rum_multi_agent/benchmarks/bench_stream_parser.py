@@ -0,0 +1,58 @@
+"""
+출판물 응답 파싱 벤치마크
+
+사용법 (rum_multi_agent 디렉토리에서):
+    python -m benchmarks.bench_stream_parser [출판물 검색 결과 JSON]
+
+저장된 응답(pub_searcher/pub_search_result.json)으로 전체 로드, object_hook, 스트리밍 프로젝션(기본),
+메타데이터 전용 파싱의 시간/peak 메모리(tracemalloc)/결과 크기를 비교합니다.
+tracemalloc 이 할당마다 비용을 더하므로 시간은 실제보다 크게 나오며, 방식 간 비교용입니다.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pub_searcher.stream_parser import _ijson_backend, parse_publication_stream  # noqa: E402
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "pub_searcher" / "pub_search_result.json"
+
+
+def measure(label: str, path: Path, loader):
+    """loader(파일 객체) 실행 시간/peak 메모리 출력 후 결과 반환"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    with open(path, "rb") as f:
+        result = loader(f)
+    elapsed = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = len(json.dumps(result, ensure_ascii=False))
+    print(f"{label:<24} {elapsed:8.1f} ms  peak {peak / 1024 / 1024:6.2f} MB  결과 {size / 1024:8.1f} KB")
+    return result
+
+
+def main(path: Path = DEFAULT_PATH):
+    """결과 출력"""
+    print(f"=== 출판물 응답 파싱 ({os.path.getsize(path) / 1024 / 1024:.2f} MB, ijson={_ijson_backend.backend if _ijson_backend else '없음'}) ===")
+    full = measure("json.load (전체)", path, json.load)
+    hooked = measure("object_hook", path, lambda f: parse_publication_stream(f, streaming=False))
+    projected = measure("스트리밍 프로젝션 (기본)", path, lambda f: parse_publication_stream(f, streaming=True))
+    metadata_only = measure(
+        "메타데이터 전용", path, lambda f: parse_publication_stream(f, api_keys=frozenset(), streaming=True)
+    )
+
+    report = projected["regular_results"]["available_reports"][0]
+    assert hooked == projected
+    assert "raw_data" not in report and "api_data" in report["processed_data"]
+    assert len(projected["regular_results"]["available_reports"]) == len(full["regular_results"]["available_reports"])
+    assert all(value is None for value in metadata_only["regular_results"]["available_reports"][0]["processed_data"]["api_data"].values())
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH)
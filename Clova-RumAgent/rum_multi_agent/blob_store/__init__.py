@@ -0,0 +1,6 @@
+"""
+블롭 저장소 패키지
+"""
+from .blob_store import BlobStore, get_blob_store, is_handle, put_blob, resolve_blob
+
+__all__ = ["BlobStore", "get_blob_store", "is_handle", "put_blob", "resolve_blob"]
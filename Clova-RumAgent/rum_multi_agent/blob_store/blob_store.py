@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+내용 주소 기반 블롭 저장소
+
+그래프 state 에는 큰 값(뉴스 본문, 검색 원본 응답, API 데이터 등) 대신 "blob:<sha256>" 핸들만 넣고,
+실제 값은 프로세스 메모리(LRU)와 디스크(zlib 압축 파일)에 저장합니다.
+같은 내용은 같은 핸들이 되므로 중복 저장되지 않고, 체크포인트 크기는 값의 크기와 무관해집니다.
+디스크 계층이 있어 체크포인트를 다른 프로세스에서 재개해도 핸들을 풀 수 있습니다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+HANDLE_PREFIX = "blob:"
+BLOB_STORE_DIR = os.getenv(
+    "BLOB_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "blobs")
+)
+BLOB_MEMORY_ITEMS = int(os.getenv("BLOB_MEMORY_ITEMS", "2048"))
+# 디스크 보관 기간/용량 (마지막으로 저장(put)된 시각 기준, 넘으면 오래된 것부터 삭제)
+BLOB_TTL_HOURS = float(os.getenv("BLOB_TTL_HOURS", "72"))
+BLOB_MAX_DISK_MB = float(os.getenv("BLOB_MAX_DISK_MB", "512"))
+BLOB_PURGE_INTERVAL_SECONDS = 600  # put 중 정리를 시작하는 최소 간격
+
+
+def is_handle(value):
+    """블롭 핸들 여부"""
+    return isinstance(value, str) and value.startswith(HANDLE_PREFIX)
+
+
+def _encode(value):
+    """결정적 JSON 직렬화 (같은 값 → 같은 바이트)"""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class BlobStore:
+    """메모리 LRU + 디스크 2계층 블롭 저장소
+
+    Args:
+        directory: 디스크 저장 위치 (빈 값이면 메모리만 사용)
+        max_items: 메모리에 유지할 최대 항목 수
+        ttl_seconds: 디스크 보관 기간 (None 이면 기간 제한 없음)
+        max_bytes: 디스크 최대 용량 (None 이면 용량 제한 없음)
+
+    디스크 정리는 put 중에 BLOB_PURGE_INTERVAL_SECONDS 마다 백그라운드 스레드에서 진행합니다.
+    """
+
+    def __init__(
+        self,
+        directory=BLOB_STORE_DIR,
+        max_items=BLOB_MEMORY_ITEMS,
+        ttl_seconds=BLOB_TTL_HOURS * 3600,
+        max_bytes=BLOB_MAX_DISK_MB * 1024 * 1024
+    ):
+        self.directory = directory or None
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._purged_at = 0.0
+        self._purging = False
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, digest):
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _remember(self, handle, value):
+        with self._lock:
+            self._memory[handle] = value
+            self._memory.move_to_end(handle)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def put(self, value):
+        """값 저장 후 핸들 반환 (JSON 직렬화 가능한 값)"""
+        data = _encode(value)
+        digest = hashlib.sha256(data).hexdigest()
+        handle = HANDLE_PREFIX + digest
+
+        if self.directory:
+            path = self._path(digest)
+            try:
+                # 이미 있는 블롭은 보관 기간이 다시 시작되도록 수정 시각만 갱신
+                os.utime(path)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(zlib.compress(data, 6))
+                os.replace(temp_path, path)
+            self._maybe_purge()
+
+        self._remember(handle, value)
+        return handle
+
+    def _maybe_purge(self):
+        """마지막 정리 후 BLOB_PURGE_INTERVAL_SECONDS 가 지났으면 백그라운드에서 디스크 정리"""
+        if self.ttl_seconds is None and self.max_bytes is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._purging or now - self._purged_at < BLOB_PURGE_INTERVAL_SECONDS:
+                return
+            self._purging = True
+            self._purged_at = now
+
+        def run():
+            try:
+                deleted = self.purge(self.ttl_seconds, self.max_bytes)
+                if deleted:
+                    print(f"[DEBUG] Blob store purged {deleted} files")
+            except OSError as e:
+                print(f"[DEBUG] Blob store purge failed: {e}")
+            finally:
+                self._purging = False
+
+        threading.Thread(target=run, name="blob-purge", daemon=True).start()
+
+    def get(self, handle, default=None):
+        """핸들로 값 조회 (핸들이 아니면 값을 그대로 반환, 없으면 default)"""
+        if not is_handle(handle):
+            return handle if handle is not None else default
+
+        with self._lock:
+            if handle in self._memory:
+                self._memory.move_to_end(handle)
+                return self._memory[handle]
+
+        if self.directory:
+            try:
+                with open(self._path(handle[len(HANDLE_PREFIX):]), "rb") as f:
+                    value = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+            except FileNotFoundError:
+                return default
+            self._remember(handle, value)
+            return value
+        return default
+
+    def purge(self, max_age_seconds=None, max_bytes=None):
+        """디스크에서 max_age_seconds 보다 오래된 블롭을 지우고, 남은 용량이 max_bytes 를 넘으면 오래된 것부터 삭제 (삭제 수 반환)
+
+        여러 프로세스가 같은 디렉토리를 정리해도 되도록 이미 지워진 파일은 건너뜁니다.
+        """
+        if not self.directory:
+            return 0
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        cutoff = time.time() - max_age_seconds if max_age_seconds is not None else None
+        total = sum(size for _, size, _ in files)
+        deleted = 0
+        for mtime, size, path in files:
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and (max_bytes is None or total <= max_bytes):
+                break
+            try:
+                os.remove(path)
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        return deleted
+
+    def purge_older_than(self, seconds):
+        """디스크에서 seconds 보다 오래된 블롭 삭제 (삭제 수 반환)"""
+        return self.purge(max_age_seconds=seconds)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store():
+    """프로세스 공유 블롭 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BlobStore()
+        return _store
+
+
+def put_blob(value):
+    """공유 저장소에 값 저장 후 핸들 반환"""
+    return get_blob_store().put(value)
+
+
+def resolve_blob(value, default=None):
+    """핸들이면 값으로 풀고, 아니면 그대로 반환"""
+    return get_blob_store().get(value, default)
@@ -0,0 +1,6 @@
+"""
+LLM 응답 캐시 패키지
+"""
+from .llm_cache import LLMResponseCache, cache_key, get_llm_cache
+
+__all__ = ["LLMResponseCache", "cache_key", "get_llm_cache"]
@@ -0,0 +1,158 @@
+"""
+검색 키워드 로컬 확장 모듈
+키워드 생성 프롬프트의 참고 패턴(금액/규모형, 인물 영향형, 실적형, 사건형)에 맞는 질문은
+LLM 없이 질문에서 뽑은 개체(회사, 인물, 사건, 기간)로 템플릿을 채워 검색 키워드를 만듦
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# 자주 쓰는 줄임말/영문명 → 정식 회사명 (회사명 추출 프롬프트의 정규화 규칙과 동일)
+COMPANY_ALIASES = {
+    "삼전": "삼성전자",
+    "엘지엔솔": "LG에너지솔루션",
+    "lg엔솔": "LG에너지솔루션",
+    "현대차": "현대자동차",
+    "sk하이닉스": "SK하이닉스",
+    "하닉": "SK하이닉스",
+    "네이버": "NAVER",
+    "naver": "NAVER",
+    "kakao": "카카오",
+}
+# 접미사 없이 쓰이는 주요 회사명
+KNOWN_COMPANIES = (
+    "삼성전자", "SK하이닉스", "LG에너지솔루션", "현대자동차", "기아", "NAVER", "카카오", "카카오뱅크",
+    "하이브", "셀트리온", "포스코홀딩스", "한화에어로스페이스", "미래에셋증권", "LG전자", "LG화학",
+    "삼성바이오로직스", "삼성SDI", "KB금융", "신한지주", "현대모비스", "크래프톤", "엔씨소프트",
+    "에코프로", "두산에너빌리티", "HD현대중공업", "JYP", "SM", "YG",
+)
+# 소문자 단어 → 정식 회사명
+_COMPANY_NAMES = {**{name.lower(): name for name in KNOWN_COMPANIES}, **COMPANY_ALIASES}
+# 회사명으로 볼 단어 접미사
+COMPANY_SUFFIXES = (
+    "전자", "증권", "은행", "화학", "바이오", "제약", "건설", "중공업", "조선", "금융", "지주",
+    "홀딩스", "카드", "생명", "화재", "물산", "모비스", "자동차", "엔터", "에너지", "반도체", "통신",
+)
+# 인물 뒤에 오는 직함/영향 표현
+PERSON_MARKERS = ("의장", "회장", "부회장", "대표", "사장", "창업자", "때문", "탓", "덕분")
+
+# 단어 끝 조사 (긴 것부터)
+_PARTICLES = ("에서는", "으로는", "에게서", "께서", "에서", "으로", "에게", "까지", "부터", "이랑",
+              "은", "는", "이", "가", "을", "를", "의", "에", "도", "와", "과", "로", "랑", "만")
+
+_AMOUNT_RE = re.compile(r"규모|금액|얼마|몇\s*(조|억|천억|만\s*주)|[0-9,.]+\s*(조|억|만\s*주)")
+_PERFORMANCE_RE = re.compile(r"실적|매출|영업이익|순이익|영업손실|적자|흑자|이익")
+_INFLUENCE_RE = re.compile(r"때문|탓|덕분|영향")
+_PERIOD_RE = re.compile(r"(20\d{2})\s*년?(?:\s*([1-4])\s*분기)?|([1-4])\s*분기|상반기|하반기")
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 사건형/금액형 주제어 (질문에 있는 그대로 사용, 긴 것부터 찾음)
+EVENT_TERMS = (
+    "자사주 소각", "자사주 매입", "자사주", "유상증자", "무상증자", "인수합병", "인수", "합병", "분할",
+    "상장폐지", "상장", "소송", "압수수색", "제재", "파업", "리콜", "화재", "횡령", "배당", "투자",
+    "공급계약", "수주", "감자", "매각", "구조조정", "희망퇴직",
+)
+
+
+def _strip_particle(token: str) -> str:
+    """단어 끝 조사 제거 (남는 글자가 2자 이상일 때만)"""
+    for particle in _PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[:-len(particle)]
+    return token
+
+
+def _find_company(tokens: List[str], text: str) -> Optional[str]:
+    """질문 속 회사명 (단어 단위로 별칭/주요 회사와 정확히 일치, 없으면 접미사로 판단)
+
+    "카카오뱅크"를 "카카오"로, "SMR"을 "SM"으로 읽지 않도록 단어 일부만 일치하는 경우는 회사명으로 보지 않습니다.
+    붙여 쓰지 않은 별칭("lg 엔솔")을 위해 이웃한 두 단어를 이은 것도 먼저 확인합니다.
+    """
+    words = [_strip_particle(token) for token in tokens]
+    candidates = []
+    for index, token in enumerate(tokens):
+        if index + 1 < len(tokens):
+            candidates.extend([token + tokens[index + 1], tokens[index] + words[index + 1]])
+        candidates.extend([token, words[index]])
+    for candidate in candidates:
+        name = _COMPANY_NAMES.get(candidate.lower())
+        if name:
+            return name
+    for word in words:
+        if len(word) > 2 and word.endswith(COMPANY_SUFFIXES):
+            return word
+    return None
+
+
+def _find_person(tokens: List[str], company: str) -> Optional[str]:
+    """직함/영향 표현 앞의 2~4자 한글 이름"""
+    for index, token in enumerate(tokens):
+        word = _strip_particle(token)
+        for marker in PERSON_MARKERS:
+            name = None
+            if word.endswith(marker) and 2 <= len(word) - len(marker) <= 4:
+                name = word[:-len(marker)]
+            elif word == marker and index > 0:
+                name = _strip_particle(tokens[index - 1])
+            if name and re.fullmatch(r"[가-힣]{2,4}", name) and name not in company:
+                return name
+    return None
+
+
+def _find_term(text: str) -> Optional[str]:
+    for term in EVENT_TERMS:
+        if term in text:
+            return term
+    return None
+
+
+def extract_entities(query: str) -> Dict[str, Optional[str]]:
+    """질문에서 회사, 인물, 사건/주제어, 실적 지표, 기간 추출"""
+    tokens = _TOKEN_RE.findall(query)
+    company = _find_company(tokens, query)
+    period = _PERIOD_RE.search(query)
+    metric = _PERFORMANCE_RE.search(query)
+    return {
+        "company": company,
+        "person": _find_person(tokens, company or "") if company else None,
+        "term": _find_term(query),
+        "metric": metric.group(0) if metric else None,
+        "period": " ".join(period.group(0).split()) if period else None,
+    }
+
+
+def classify_query(query: str, entities: Dict[str, Optional[str]]) -> Optional[str]:
+    """참고 패턴 분류 (맞는 패턴이 없으면 None)"""
+    if not entities["company"]:
+        return None
+    if entities["term"] and _AMOUNT_RE.search(query):
+        return "amount"
+    if entities["person"] and _INFLUENCE_RE.search(query):
+        return "person_influence"
+    if entities["metric"]:
+        return "performance"
+    if entities["term"]:
+        return "event"
+    return None
+
+
+def expand_keywords(query: str) -> Optional[List[str]]:
+    """패턴에 맞으면 검색 키워드 3개, 맞지 않으면 None (LLM 키워드 생성 대상)"""
+    entities = extract_entities(query)
+    pattern = classify_query(query, entities)
+    if pattern is None:
+        return None
+
+    company, person, term = entities["company"], entities["person"], entities["term"]
+    metric = entities["metric"] or "실적"
+    period = f" {entities['period']}" if entities["period"] else ""
+
+    if pattern == "amount":
+        keywords = [f"{company} {term} 규모", f"{company} {term} 금액", f"{company} {term} 금액 최근"]
+    elif pattern == "person_influence":
+        keywords = [f"{person} {company} {metric} 영향", f"{company} {metric} 변화 이유", f"{person} {company} 최근 뉴스"]
+    elif pattern == "performance":
+        keywords = [f"{company}{period} 실적", f"{company}{period} 매출", f"{company} 영업이익 최근"]
+    else:
+        keywords = [f"{company} {term} 배경", f"{company} {term} 영향", f"{company} {term} 최근"]
+    return keywords
@@ -0,0 +1,193 @@
+"""
+로컬 뉴스 코퍼스 모듈
+네이버 뉴스 API 에서 받은 모든 기사를 정규화해 SQLite FTS5 로 색인합니다.
+검색어에 맞는 기사가 시간 창(NEWS_CORPUS_WINDOW_HOURS) 안에 요청 건수만큼 있고 최근에도 네이버 응답에서
+본 적이 있으면(NEWS_CORPUS_FRESH_SECONDS) 네이버를 호출하지 않고 코퍼스에서 바로 응답합니다.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional
+
+from .news_normalizer import normalize_news_items
+from .news_store import pub_timestamp
+
+NEWS_CORPUS_ENABLED = os.getenv("NEWS_CORPUS_ENABLED", "true").lower() == "true"
+NEWS_CORPUS_PATH = os.getenv(
+    "NEWS_CORPUS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "news_corpus.db")
+)
+NEWS_CORPUS_WINDOW_HOURS = int(os.getenv("NEWS_CORPUS_WINDOW_HOURS", "24"))  # 로컬 응답에 쓰는 기사 발행 시간 창
+NEWS_CORPUS_FRESH_SECONDS = 300  # 일치하는 기사를 네이버 응답에서 마지막으로 본 시각이 이보다 오래되면 네이버 호출
+
+# 색인 토크나이저는 공백/기호 기준(unicode61)이라, 조사가 붙은 단어("삼성전자의")도 찾도록 검색어는 접두어로 매칭
+_TOKEN_RE = re.compile(r'[0-9A-Za-z가-힣]{2,}')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    link TEXT NOT NULL UNIQUE,
+    original_link TEXT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    pub_date TEXT,
+    formatted_date TEXT,
+    pub_ts REAL NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_first_seen ON articles (first_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content='articles', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+"""
+
+
+def match_expression(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식 (모든 단어를 접두어로 AND, 쓸 단어가 없으면 None)"""
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return " AND ".join(f'"{token}"*' for token in dict.fromkeys(tokens))
+
+
+class NewsCorpus:
+    """FTS5 색인 뉴스 코퍼스 (응답 항목은 네이버 API 아이템 형식)"""
+
+    def __init__(
+        self,
+        path: str = NEWS_CORPUS_PATH,
+        window_hours: int = NEWS_CORPUS_WINDOW_HOURS,
+        fresh_seconds: float = NEWS_CORPUS_FRESH_SECONDS
+    ):
+        """초기화"""
+        self.path = path
+        self.window = window_hours * 3600
+        self.fresh_seconds = fresh_seconds
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "added": 0, "lookup_ms": 0.0}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        """호출마다 새 연결 (검색이 여러 스레드에서 실행됨)"""
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _count(self, **values) -> None:
+        with self._lock:
+            for name, value in values.items():
+                self._stats[name] += value
+
+    def add(self, items: Iterable[Dict[str, Any]]) -> int:
+        """네이버 API 아이템을 정규화해 저장 (이미 있는 기사는 마지막으로 본 시각만 갱신), 새로 추가된 수 반환"""
+        items = list(items)
+        now = time.time()
+        rows = [
+            (
+                record['link'], record['original_link'], record['title'], record['description'],
+                record['pub_date'], record['formatted_date'], pub_timestamp(item), now, now
+            )
+            for item, record in zip(items, normalize_news_items(items))
+            if record['link']
+        ]
+        if not rows:
+            return 0
+        with closing(self._connect()) as conn:
+            before = conn.execute("SELECT COALESCE(MAX(id), 0) FROM articles").fetchone()[0]
+            conn.executemany(
+                """
+                INSERT INTO articles (link, original_link, title, description, pub_date, formatted_date,
+                                      pub_ts, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(link) DO UPDATE SET last_seen=excluded.last_seen
+                """,
+                rows
+            )
+            added = conn.execute("SELECT COUNT(*) FROM articles WHERE id>?", (before,)).fetchone()[0]
+            conn.commit()
+        self._count(added=added)
+        return added
+
+    def search(self, query: str, display: int, sort: str = "date") -> Optional[List[Dict[str, Any]]]:
+        """시간 창 안에서 검색어에 맞는 기사 display 건 (date: 최신순, sim: BM25 순)
+
+        창 안의 기사가 display 건보다 적거나, 맞는 기사를 최근 NEWS_CORPUS_FRESH_SECONDS 동안 네이버 응답에서
+        본 적이 없으면(새 기사가 더 있을 수 있음) None 을 반환해 네이버를 호출하게 합니다.
+        """
+        expression = match_expression(query)
+        if expression is None:
+            return None
+        started = time.perf_counter()
+        now = time.time()
+        window_start = now - self.window
+        order = "a.pub_ts DESC" if sort == "date" else "articles_fts.rank"
+        with closing(self._connect()) as conn:
+            # 기사는 발행된 뒤에야 받을 수 있으므로 창 안의 기사는 모두 창 시작 이후에 추가된 행 (rowid 범위로 색인 탐색 축소,
+            # 행은 추가된 순서대로 id 가 커지므로 창 시작 이후 처음 추가된 행이 가장 작은 id)
+            first = conn.execute(
+                "SELECT id FROM articles WHERE first_seen>=? ORDER BY first_seen LIMIT 1", (window_start,)
+            ).fetchone()
+            rows = [] if first is None else conn.execute(
+                f"""
+                SELECT a.title, a.description, a.link, a.original_link, a.pub_date, a.last_seen
+                FROM articles_fts JOIN articles AS a ON a.id = articles_fts.rowid
+                WHERE articles_fts MATCH ? AND articles_fts.rowid>=? AND a.pub_ts>=?
+                ORDER BY {order}
+                """,
+                (expression, first[0], window_start)
+            ).fetchall()
+        covered = len(rows) >= display and max(row[5] for row in rows) >= now - self.fresh_seconds
+        self._count(hits=int(covered), misses=int(not covered), lookup_ms=(time.perf_counter() - started) * 1000)
+        if not covered:
+            return None
+        return [
+            {"title": title, "description": description, "link": link, "originallink": original_link, "pubDate": pub_date}
+            for title, description, link, original_link, pub_date, _ in rows[:display]
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률, 평균 조회 시간, 보관 기사 수"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["avg_lookup_ms"] = round(stats.pop("lookup_ms") / lookups, 2) if lookups else 0.0
+        with closing(self._connect()) as conn:
+            stats["articles"] = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        return stats
+
+
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def get_news_corpus() -> Optional[NewsCorpus]:
+    """프로세스 공유 코퍼스 (NEWS_CORPUS_ENABLED=false 면 None)"""
+    global _corpus
+    if not NEWS_CORPUS_ENABLED:
+        return None
+    with _corpus_lock:
+        if _corpus is None:
+            _corpus = NewsCorpus()
+        return _corpus
+
+
+def ingest(response: Dict[str, Any]) -> None:
+    """네이버 검색 응답의 기사를 코퍼스에 추가 (저장 실패는 검색 결과에 영향 없음)"""
+    corpus = get_news_corpus()
+    if corpus is None:
+        return
+    try:
+        corpus.add(response.get('items', []))
+    except sqlite3.Error as e:
+        print(f"뉴스 코퍼스 저장 실패: {e}")
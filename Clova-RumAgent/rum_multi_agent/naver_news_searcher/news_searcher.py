@@ -4,22 +4,39 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import concurrent.futures
 import requests
 import urllib.parse
-import re
 from datetime import datetime
 from typing import Dict, List
-from dateutil import parser
 import os
 from langchain_anthropic import ChatAnthropic
+from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 import json
 
+from llm_cache import get_llm_cache
+from resilience import HedgedLLM, ProviderError, get_resilient_client
+from .news_normalizer import clean_text, format_pub_date, normalize_news_item, normalize_news_items
+from .news_dedup import cluster_near_duplicates
+from .keyword_expander import expand_keywords
+from .news_corpus import get_news_corpus, ingest
+from .news_store import get_news_store
+
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
 DEFAULT_DISPLAY = 10
 DEFAULT_SORT = "sim"  # sim: 유사도순, date: 날짜순
+# 키워드 생성 1순위/헤지 모델 (캐시 키는 두 모델 모두 포함), 프롬프트/후처리를 바꾸면 버전을 올려 이전 캐시 응답을 쓰지 않게 함
+KEYWORD_MODEL = "claude-3-5-haiku-latest"
+KEYWORD_FALLBACK_MODEL = "gemini-2.0-flash"
+KEYWORD_PROMPT_VERSION = 1
+# LLM 키워드 생성을 기다리는 동안 원본 질문으로 먼저 가져올 뉴스 비율
+ORIGINAL_QUERY_SHARE = 1 / 3
+
+# 패턴에 맞지 않는 질문의 LLM 키워드 생성은 원본 질문 검색과 겹쳐 실행
+_expansion_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="keyword-expand")
 
 # 검색 프롬프트 생성 템플릿
 search_prompt_template = ChatPromptTemplate.from_template("""
@@ -67,11 +84,24 @@ class NewsSearcher:
         if not self.client_id or not self.client_secret:
             raise ValueError("네이버 API 클라이언트 ID와 시크릿을 설정해주세요.")
 
-        # Claude 모델 초기화
-        self.llm = ChatAnthropic(
-            model="claude-3-5-haiku-latest",
-            temperature=0
-        )
+        # 키워드 생성: Claude 우선, p95 안에 응답이 없거나 실패하면 Gemini 에도 요청
+        # (타임아웃/재시도/서킷 브레이커는 제공자별 resilience 정책에서 처리)
+        self.hedged = HedgedLLM("generate_search_prompts", [
+            ("anthropic", KEYWORD_MODEL, lambda: ChatAnthropic(
+                model=KEYWORD_MODEL,
+                temperature=0,
+                timeout=get_resilient_client("anthropic").read_timeout,
+                max_retries=0
+            )),
+            ("gemini", KEYWORD_FALLBACK_MODEL, lambda: ChatGoogleGenerativeAI(
+                model=KEYWORD_FALLBACK_MODEL,
+                temperature=0,
+                timeout=get_resilient_client("gemini").read_timeout,
+                max_retries=0
+            )),
+        ])
+        # 키워드 생성 경로별 횟수 (local: 패턴 템플릿, llm: LLM 생성)
+        self.keyword_stats = {"local": 0, "llm": 0}
 
     def search_news(
         self, 
@@ -80,7 +110,7 @@ class NewsSearcher:
         start: int = 1, 
         sort: str = DEFAULT_SORT
     ) -> Dict:
-        """뉴스 검색"""
+        """뉴스 검색 (타임아웃/재시도/서킷 브레이커 적용, 실패 시 ProviderError)"""
         encoded_query = urllib.parse.quote(query)
         url = f"{NAVER_NEWS_API_URL}?query={encoded_query}&display={display}&start={start}&sort={sort}"
         
@@ -91,50 +121,108 @@ class NewsSearcher:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = get_resilient_client("naver_news").request("GET", url, headers=headers)
             response.raise_for_status()
-            return response.json()
+            results = response.json()
         except requests.exceptions.RequestException as e:
-            raise Exception(f"뉴스 검색 중 오류 발생: {e}")
+            raise ProviderError("naver_news", f"뉴스 검색 중 오류 발생: {e}")
+        # 받은 기사는 모두 로컬 코퍼스에 색인
+        ingest(results)
+        return results
 
     def generate_search_prompts(self, user_query: str) -> List[str]:
-        """사용자 질문을 바탕으로 검색 키워드 생성"""
-        chain = search_prompt_template | self.llm
+        """사용자 질문을 바탕으로 검색 키워드 생성 (참고 패턴에 맞으면 LLM 없이 로컬 템플릿 사용)"""
+        local_keywords = expand_keywords(user_query)
+        if local_keywords is not None:
+            self.keyword_stats["local"] += 1
+            print(f"로컬 확장 검색 키워드: {local_keywords}")
+            return local_keywords
+        return self._generate_with_llm(user_query)
+
+    def _generate_with_llm(self, user_query: str) -> List[str]:
+        """LLM 으로 검색 키워드 생성 (실패 시 원본 질문)"""
+        self.keyword_stats["llm"] += 1
+
+        def generate():
+            response_text = self.hedged.invoke(lambda llm: (search_prompt_template | llm).invoke({"user_query": user_query})).content
+            try:
+                # JSON 파싱
+                return json.loads(response_text).get("search_prompts", [])
+            except json.JSONDecodeError:
+                print(f"응답 내용: {response_text}")
+                raise
 
         try:
-            response = chain.invoke({"user_query": user_query})
-            response_text = response.content
-
-            # JSON 파싱
-            json_data = json.loads(response_text)
-            search_prompts = json_data.get("search_prompts", [])
+            # 같은 질문이면 캐시된 키워드 사용 (파싱에 실패한 응답은 저장하지 않음)
+            search_prompts = get_llm_cache().cached(
+                "generate_search_prompts", self.hedged.cache_model, 0,
+                search_prompt_template.format(user_query=user_query), generate,
+                version=KEYWORD_PROMPT_VERSION
+            )
 
             print(f"생성된 검색 키워드: {search_prompts}")
             return search_prompts
 
         except json.JSONDecodeError as e:
             print(f"JSON 파싱 오류: {e}")
-            print(f"응답 내용: {response_text}")
             # 파싱 실패 시 원본 질문 반환
             return [user_query]
         except Exception as e:
             print(f"검색 키워드 생성 중 오류: {e}")
             return [user_query]
 
-    def search_query(self, query: str, display: int = DEFAULT_DISPLAY, sort: str = DEFAULT_SORT) -> Dict:
-        """사용자 쿼리로 키워드 생성 후 뉴스 검색"""
-        # 검색 키워드 생성
-        search_keywords = self.generate_search_prompts(query)
-
-        # 모든 키워드로 검색 결과 수집
+    def _search_items(self, keyword: str, display: int, sort: str, start: int = 1) -> List[Dict]:
+        """키워드 하나로 검색한 원본 뉴스 아이템
+
+        로컬 코퍼스에 시간 창 안의 기사가 충분하면 네이버를 호출하지 않고, 날짜순 검색은 누적 뉴스 저장소에서 새 기사만 받아 옴
+        """
+        corpus = get_news_corpus()
+        local_items = corpus.search(keyword, display + start - 1, sort) if corpus else None
+        if local_items is not None:
+            print(f"키워드 '{keyword}' 로컬 코퍼스 응답 ({display}건)")
+            return local_items[start - 1:]
+        print(f"키워드 '{keyword}'로 검색 중...")
+        store = get_news_store() if sort == "date" else None
+        if store is None:
+            return self.search_news(keyword, display, start=start, sort=sort).get('items', [])
+        fetch_page = lambda page_start, page_size: self.search_news(keyword, page_size, start=page_start, sort="date")
+        return store.recent(keyword, fetch_page, display, offset=start - 1)['items']
+
+    def search_query(self, query: str, display: int = DEFAULT_DISPLAY, sort: str = DEFAULT_SORT, max_keywords: int = None) -> Dict:
+        """사용자 쿼리로 키워드 생성 후 뉴스 검색
+
+        max_keywords 가 주어지면 검색 키워드를 그 수로 제한합니다 (1 이면 키워드 생성 없이 원본 질문으로 검색).
+        참고 패턴에 맞지 않아 LLM 으로 키워드를 만들 때는 생성이 끝나기를 기다리지 않고
+        원본 질문으로 먼저 검색한 뒤, 생성된 키워드로 나머지를 채웁니다.
+        """
         all_results = {"items": []}
 
-        for keyword in search_keywords:
-            print(f"키워드 '{keyword}'로 검색 중...")
-            result = self.search_news(keyword, display//len(search_keywords) or 1, sort=sort)
-
-            if 'items' in result:
-                all_results['items'].extend(result['items'])
+        local_keywords = None if max_keywords == 1 else expand_keywords(query)
+        if max_keywords == 1 or local_keywords is not None:
+            # 키워드가 바로 정해지는 경우: 모든 키워드로 검색 결과 수집
+            if local_keywords is not None:
+                self.keyword_stats["local"] += 1
+                print(f"로컬 확장 검색 키워드: {local_keywords}")
+            # 회사/개체를 잘못 읽었을 때도 관련 기사가 빠지지 않도록 원본 질문은 항상 함께 검색
+            search_keywords = ([query] + (local_keywords or []))[:max_keywords]
+            for keyword in search_keywords:
+                all_results['items'].extend(self._search_items(keyword, display//len(search_keywords) or 1, sort))
+        else:
+            # LLM 키워드 생성과 원본 질문 검색을 겹쳐 실행
+            expansion = _expansion_executor.submit(self._generate_with_llm, query)
+            original_display = max(int(display * ORIGINAL_QUERY_SHARE), 1)
+            all_results['items'].extend(self._search_items(query, original_display, sort))
+
+            extra_limit = max_keywords - 1 if max_keywords else None
+            extra_keywords = [keyword for keyword in expansion.result() if keyword != query][:extra_limit]
+            search_keywords = [query] + extra_keywords
+            remaining = max(display - original_display, 0)
+            if extra_keywords:
+                for keyword in extra_keywords:
+                    all_results['items'].extend(self._search_items(keyword, remaining//len(extra_keywords) or 1, sort))
+            elif remaining:
+                # 생성된 키워드가 없으면 원본 질문 결과의 다음 페이지로 채움
+                all_results['items'].extend(self._search_items(query, remaining, sort, start=original_display + 1))
 
         # 중복 제거 (링크 기준)
         seen_links = set()
@@ -145,48 +233,36 @@ class NewsSearcher:
                 seen_links.add(link)
                 unique_items.append(item)
 
-        all_results['items'] = unique_items[:display]
-        print(f"최종 검색된 뉴스 개수: {len(all_results['items'])}개")
+        # 포맷팅 후 여러 매체가 재송출한 같은 기사는 대표 기사 하나로 묶음 (outlet_count 기록)
+        representatives = cluster_near_duplicates(self.format_news_items(unique_items))
+        print(f"유사 중복 제거: {len(unique_items)}개 → {len(representatives)}개")
 
-        # 포맷팅
-        if 'items' in all_results:
-            all_results['items'] = [self.format_news_item(item) for item in all_results['items']]
+        all_results['items'] = representatives[:display]
+        print(f"최종 검색된 뉴스 개수: {len(all_results['items'])}개")
 
         NewsSearcher.save_results_to_file(all_results, query, search_keywords)
         return all_results
 
     @staticmethod
     def clean_html_tags(text: str) -> str:
-        """HTML 태그 제거"""
-        if not text:
-            return ""
-        cleaned = re.sub(r'<[^>]+>', '', text)
-        return cleaned.strip()
+        """HTML 태그 및 엔티티 제거"""
+        return clean_text(text)
 
     @staticmethod
     def format_news_item(item: Dict) -> Dict:
-        print(f"Item의 키들: {list(item.keys())}")
         """뉴스 아이템 포맷팅"""
-        return {
-            'title': NewsSearcher.clean_html_tags(item.get('title', '')),
-            'description': NewsSearcher.clean_html_tags(item.get('description', '')),
-            'link': item.get('link', ''),
-            'original_link': item.get('originallink', ''),
-            'pub_date': item.get('pubDate', ''),
-            'formatted_date': NewsSearcher.format_date(item.get('pubDate', ''))
-        }
+        return normalize_news_item(item)
+
+    @staticmethod
+    def format_news_items(items: List[Dict]) -> List[Dict]:
+        """뉴스 아이템 목록 일괄 포맷팅"""
+        return normalize_news_items(items)
 
     @staticmethod
     def format_date(date_str: str) -> str:
         """날짜 포맷팅"""
-        if not date_str:
-            return ""
-        try:
-            dt = parser.parse(date_str)
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            return date_str
-    
+        return format_pub_date(date_str)
+
     @staticmethod
     def save_results_to_file(results: Dict, original_query: str = None, search_keywords: List[str] = None) -> None:
         """검색 결과를 파일로 저장"""
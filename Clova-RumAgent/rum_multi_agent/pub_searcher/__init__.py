@@ -1,6 +1,6 @@
 """
 출판물 검색 패키지
 """
-from .pub_searcher import search_publications
+from .pub_searcher import fetch_report_api_data, search_publications
 
-__all__ = ["search_publications"]
\ No newline at end of file
+__all__ = ["search_publications", "fetch_report_api_data"]
\ No newline at end of file
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+출판물 검색 결과 디스크 캐시
+
+정기보고서는 분기마다 한 번 바뀌므로 (회사, 연도, 분기, 결과 유형) 단위로 압축해 SQLite 에 저장합니다.
+- regular: 다음 DART 정기보고서 제출 기한까지 유효 (요청한 분기 보고서가 아직 없으면 REGULAR_PENDING_TTL_HOURS)
+- revision: 정정보고서는 수시로 올라오므로 REVISION_TTL_HOURS
+같은 질의 문자열은 별칭 테이블로 (회사, 연도, 분기)에 연결되어, 원격 호출 없이 바로 조회됩니다.
+
+관리:
+    python -m pub_searcher.cache --stats
+    python -m pub_searcher.cache --invalidate "LG Electronics" [--year 2025 --quarter 1]
+    python -m pub_searcher.cache --clear
+"""
+import json
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from datetime import date, datetime, timedelta
+
+PUB_CACHE_ENABLED = os.getenv("PUB_CACHE_ENABLED", "true").lower() == "true"
+PUB_CACHE_PATH = os.getenv(
+    "PUB_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "publications.db")
+)
+REVISION_TTL_HOURS = float(os.getenv("PUB_CACHE_REVISION_TTL_HOURS", "6"))
+REGULAR_PENDING_TTL_HOURS = 24  # 요청 분기 보고서가 아직 제출되지 않은 경우
+
+SECTIONS = {"regular": "regular_results", "revision": "revision_results"}
+
+# DART 정기보고서 제출 기한 (월, 일): 사업보고서 3/31, 1분기 5/15, 반기 8/14, 3분기 11/14
+FILING_DEADLINES = ((3, 31), (5, 15), (8, 14), (11, 14))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publications (
+    company TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    section TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (company, year, quarter, section)
+);
+CREATE TABLE IF NOT EXISTS query_aliases (
+    query TEXT NOT NULL,
+    section TEXT NOT NULL,
+    company TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (query, section)
+);
+"""
+
+
+def sections_for(dart_type):
+    """dart_type 에 해당하는 결과 유형 목록"""
+    if dart_type in SECTIONS:
+        return [dart_type]
+    return list(SECTIONS)
+
+
+def normalize_company(name):
+    """회사명 정규화 (대소문자/공백 무시)"""
+    return "".join(str(name or "").lower().split())
+
+
+def normalize_query(query):
+    """질의 정규화 (연속 공백 정리, 소문자)"""
+    return " ".join(str(query or "").lower().split())
+
+
+def next_filing_deadline(now=None):
+    """now 이후 가장 가까운 정기보고서 제출 기한 다음 날 0시 (그때까지 새 정기보고서가 나오지 않음)"""
+    now = now or datetime.now()
+    for year in (now.year, now.year + 1):
+        for month, day in FILING_DEADLINES:
+            boundary = datetime.combine(date(year, month, day) + timedelta(days=1), datetime.min.time())
+            if boundary > now:
+                return boundary
+
+
+def _has_target_report(regular_results):
+    """요청한 연도/분기 보고서가 결과에 있는지"""
+    return any(report.get("is_target") for report in regular_results.get("available_reports", []))
+
+
+def expires_at_for(section, results, now=None):
+    """결과 유형별 만료 시각 (epoch 초)"""
+    now = now or datetime.now()
+    if section == "revision":
+        expires = now + timedelta(hours=REVISION_TTL_HOURS)
+    elif _has_target_report(results):
+        expires = next_filing_deadline(now)
+    else:
+        expires = min(now + timedelta(hours=REGULAR_PENDING_TTL_HOURS), next_filing_deadline(now))
+    return expires.timestamp()
+
+
+def _is_cacheable(section, results):
+    """실패 응답은 저장하지 않음"""
+    if not isinstance(results, dict):
+        return False
+    if section == "regular":
+        return results.get("success", True) is not False and bool(results.get("available_reports"))
+    return "revision_documents" in results
+
+
+class PublicationCache:
+    """SQLite 기반 출판물 검색 결과 캐시 (payload 는 zlib 압축 JSON)"""
+
+    def __init__(self, path=PUB_CACHE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        """호출마다 새 연결 (그래프 노드가 여러 스레드에서 실행됨)"""
+        return sqlite3.connect(self.path, timeout=5)
+
+    @staticmethod
+    def _encode(value):
+        return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+
+    @staticmethod
+    def _decode(blob):
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def get(self, company, year, quarter, section):
+        """(회사, 연도, 분기, 유형) 조회, 없거나 만료되면 None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT payload FROM publications WHERE company=? AND year=? AND quarter=? AND section=? AND expires_at>?",
+                (normalize_company(company), int(year), int(quarter), section, time.time())
+            ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def lookup(self, query, sections):
+        """질의 별칭으로 유형별 캐시 조회 → {section: {"search_params", "results"}}"""
+        now = time.time()
+        found = {}
+        with closing(self._connect()) as conn:
+            for section in sections:
+                row = conn.execute(
+                    "SELECT p.payload FROM query_aliases a JOIN publications p "
+                    "ON p.company=a.company AND p.year=a.year AND p.quarter=a.quarter AND p.section=a.section "
+                    "WHERE a.query=? AND a.section=? AND a.expires_at>? AND p.expires_at>?",
+                    (normalize_query(query), section, now, now)
+                ).fetchone()
+                if row:
+                    found[section] = self._decode(row[0])
+        return found
+
+    def store(self, query, response, sections):
+        """원격 응답의 유형별 결과 저장 (search_params 의 회사/연도/분기를 키로 사용)"""
+        params = response.get("search_params") or {}
+        company, year, quarter = params.get("company_name"), params.get("year"), params.get("quarter")
+        if not company or year is None or quarter is None:
+            return
+
+        key = (normalize_company(company), int(year), int(quarter))
+        now = datetime.now()
+        with closing(self._connect()) as conn:
+            for section in sections:
+                results = response.get(SECTIONS[section])
+                if not _is_cacheable(section, results):
+                    continue
+                expires_at = expires_at_for(section, results, now)
+                payload = self._encode({"search_params": params, "results": results})
+                conn.execute(
+                    "INSERT OR REPLACE INTO publications VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*key, section, payload, now.timestamp(), expires_at)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO query_aliases VALUES (?, ?, ?, ?, ?, ?)",
+                    (normalize_query(query), section, *key, expires_at)
+                )
+            conn.commit()
+
+    def invalidate(self, company=None, year=None, quarter=None, section=None):
+        """조건에 맞는 항목 삭제 (조건이 없으면 전체), 삭제된 항목 수 반환"""
+        conditions, params = [], []
+        for column, value in (("company", normalize_company(company) if company else None),
+                              ("year", year), ("quarter", quarter), ("section", section)):
+            if value is not None:
+                conditions.append(f"{column}=?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with closing(self._connect()) as conn:
+            deleted = conn.execute(f"DELETE FROM publications{where}", params).rowcount
+            conn.execute(f"DELETE FROM query_aliases{where}", params)
+            conn.commit()
+        return deleted
+
+    def purge_expired(self):
+        """만료된 항목 삭제"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            deleted = conn.execute("DELETE FROM publications WHERE expires_at<=?", (now,)).rowcount
+            conn.execute("DELETE FROM query_aliases WHERE expires_at<=?", (now,))
+            conn.commit()
+        return deleted
+
+    def stats(self):
+        """저장 항목 수/압축 크기"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT section, COUNT(*), COALESCE(SUM(LENGTH(payload)), 0), "
+                "SUM(CASE WHEN expires_at>? THEN 1 ELSE 0 END) FROM publications GROUP BY section",
+                (time.time(),)
+            ).fetchall()
+            aliases = conn.execute("SELECT COUNT(*) FROM query_aliases").fetchone()[0]
+        return {
+            "sections": {section: {"entries": count, "bytes": size, "valid": valid} for section, count, size, valid in rows},
+            "aliases": aliases,
+        }
+
+
+_cache = None
+
+
+def get_publication_cache():
+    """프로세스 공유 캐시 (PUB_CACHE_ENABLED=false 이면 None)"""
+    global _cache
+    if not PUB_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = PublicationCache()
+    return _cache
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="출판물 검색 결과 캐시 관리")
+    parser.add_argument("--stats", action="store_true", help="저장 현황 출력")
+    parser.add_argument("--invalidate", metavar="COMPANY", help="회사 단위 무효화")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--quarter", type=int)
+    parser.add_argument("--section", choices=list(SECTIONS))
+    parser.add_argument("--clear", action="store_true", help="전체 삭제")
+    parser.add_argument("--purge-expired", action="store_true", help="만료 항목 삭제")
+    args = parser.parse_args()
+
+    cache = PublicationCache()
+    if args.clear:
+        print(f"삭제: {cache.invalidate()}건")
+    elif args.invalidate:
+        print(f"삭제: {cache.invalidate(args.invalidate, args.year, args.quarter, args.section)}건")
+    elif args.purge_expired:
+        print(f"삭제: {cache.purge_expired()}건")
+    print(json.dumps(cache.stats(), ensure_ascii=False, indent=2))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+출판물 검색 서비스 로컬 대체 서버
+
+저장된 응답(pub_search_result.json)을 /runs/wait 로 돌려주는 테스트용 서버입니다.
+실제 서비스와 같은 요청 형식을 받고, 2단계 로딩용 입력을 처리합니다.
+- metadata_only: 정기보고서 api_data 값을 비우고 키만 남김
+- api_selection: [{"year", "quarter", "api_keys"}] 에 해당하는 보고서/키만 남김
+
+실행:
+    python -m pub_searcher.local_service --port 2024
+    PUB_SEARCH_API_URL=http://127.0.0.1:2024/runs/wait langgraph dev
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(__file__), "pub_search_result.json")
+
+
+def build_response(fixture, input_data):
+    """요청 입력에 맞춰 저장된 응답을 가공"""
+    response = dict(fixture)
+    dart_type = input_data.get("dart_type", "both")
+    if dart_type == "regular":
+        response.pop("revision_results", None)
+    elif dart_type == "revision":
+        response.pop("regular_results", None)
+
+    regular_results = response.get("regular_results")
+    if not regular_results:
+        return response
+
+    selection = input_data.get("api_selection")
+    if selection is not None:
+        wanted = {(str(s.get("year")), str(s.get("quarter"))): set(s.get("api_keys", [])) for s in selection}
+    metadata_only = input_data.get("metadata_only", False)
+
+    reports = []
+    for report in regular_results.get("available_reports", []):
+        key = (str(report.get("year")), str(report.get("quarter")))
+        if selection is not None and key not in wanted:
+            continue
+        report = {k: v for k, v in report.items() if k not in ("raw_data", "file_path")}
+        processed = dict(report.get("processed_data", {}))
+        api_data = processed.get("api_data", {})
+        if metadata_only:
+            processed["api_data"] = {api_key: None for api_key in api_data}
+        elif selection is not None:
+            processed["api_data"] = {api_key: api_data[api_key] for api_key in api_data if api_key in wanted[key]}
+        report["processed_data"] = processed
+        reports.append(report)
+
+    response["regular_results"] = dict(regular_results, available_reports=reports)
+    return response
+
+
+def create_server(host="127.0.0.1", port=2024, fixture_path=DEFAULT_FIXTURE, latency=0.0):
+    """대체 서버 생성 (port=0 이면 임의 포트)"""
+    with open(fixture_path, "r", encoding="utf-8") as f:
+        fixture = json.load(f)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != "/runs/wait":
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                self.send_error(400, "invalid JSON")
+                return
+
+            if latency:
+                time.sleep(latency)
+            body = json.dumps(build_response(fixture, payload.get("input", {})), ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            print(f"[DEBUG] local publication service: {format % args}")
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def start_in_background(**kwargs):
+    """백그라운드 스레드로 서버 실행 후 (server, url) 반환"""
+    server = create_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/runs/wait"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="출판물 검색 서비스 로컬 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2024)
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="돌려줄 응답 JSON 파일")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.fixture, args.latency)
+    print(f"Local publication service: http://{args.host}:{args.port}/runs/wait")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -1,27 +1,36 @@
 # -*- coding: utf-8 -*-
+import os
+import threading
+import time
 import requests
 import json
+from collections import OrderedDict
 
+from resilience import ProviderError, get_resilient_client
+from .cache import SECTIONS, get_publication_cache, sections_for
+from .stream_parser import PARSE_ERRORS, parse_publication_stream
 
-def search_publications(query, dart_type="both"):
-    """
-    Send POST request to publication search API
+# 출판물 검색 서비스 주소 (로컬 대체 서비스: python -m pub_searcher.local_service)
+PUB_SEARCH_API_URL = os.getenv("PUB_SEARCH_API_URL", "http://211.188.53.220:2024/runs/wait")
 
-    Args:
-        query (str): Search query (e.g., "LG Electronics")
-        dart_type (str): Type of search, defaults to "both"
+# 캐시 없이 조회할 때 1단계 응답의 api_data 값을 2단계(fetch_report_api_data)까지 보관하는 프로세스 내 저장소
+# (서비스가 metadata_only/api_selection 을 지원하지 않아 1단계에서 이미 전체 값을 받으므로 원격 재조회를 피함)
+PENDING_API_DATA_TTL_SECONDS = 600
+PENDING_API_DATA_MAX_QUERIES = 32
+_pending_api_data = OrderedDict()  # query → (저장 시각, {(year, quarter): api_data})
+_pending_lock = threading.Lock()
 
-    Returns:
-        dict: API response
+
+def _request_publications(input_data, api_keys=None):
+    """출판물 검색 서비스 호출 후 필요한 필드만 파싱
+
+    타임아웃/재시도/서킷 브레이커는 "publication" 제공자 정책을 따르며, 실패 시 ProviderError 를 발생시킵니다.
     """
-    url = "http://211.188.53.220:2024/runs/wait"
+    url = PUB_SEARCH_API_URL
 
     payload = {
         "assistant_id": "agent",
-        "input": {
-            "query": query,
-            "dart_type": dart_type
-        }
+        "input": input_data
     }
 
     headers = {
@@ -33,37 +42,194 @@ def search_publications(query, dart_type="both"):
     print(f"[DEBUG] Headers: {headers}")
     print(f"[DEBUG] Payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
 
+    client = get_resilient_client("publication")
+
+    def send_and_parse():
+        # 본문 수신 중 끊겨도 재시도되도록 파싱까지 한 번의 호출로 묶음
+        with requests.post(url, json=payload, headers=headers, timeout=client.timeout, stream=True) as response:
+            print(f"[DEBUG] Response status code: {response.status_code}")
+            print(f"[DEBUG] Response headers: {dict(response.headers)}")
+
+            if response.status_code != 200:
+                print(f"[DEBUG] Error response text: {response.text}")
+                response.raise_for_status()
+
+            # 응답 본문을 전부 받아두지 않고 스트림에서 필요한 필드만 파싱
+            response.raw.decode_content = True
+            return parse_publication_stream(response.raw, api_keys=api_keys)
+
+    print(f"[DEBUG] Sending POST request...")
     try:
-        print(f"[DEBUG] Sending POST request...")
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-
-        print(f"[DEBUG] Response status code: {response.status_code}")
-        print(f"[DEBUG] Response headers: {dict(response.headers)}")
-
-        if response.status_code == 200:
-            response_data = response.json()
-            print(f"[DEBUG] Response data: {str(json.dumps(response_data, indent=2, ensure_ascii=False))[:300]}...")
-            return response_data
-        else:
-            print(f"[DEBUG] Error response text: {response.text}")
-            response.raise_for_status()
-
-    except requests.exceptions.ConnectTimeout:
-        print(f"[DEBUG] Connection timeout to {url}")
-        return None
-    except requests.exceptions.ConnectionError:
-        print(f"[DEBUG] Connection error to {url} - service might not be running")
-        return None
-    except requests.exceptions.Timeout:
-        print(f"[DEBUG] Request timeout")
-        return None
+        # 검색 실행(run)은 부수 효과가 없어 재시도해도 안전
+        response_data = client.call(send_and_parse, idempotent=True)
+    except PARSE_ERRORS as e:
+        raise ProviderError("publication", f"응답 JSON 파싱 실패: {e}")
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Request error: {e}")
-        return None
-    except json.JSONDecodeError as e:
-        print(f"[DEBUG] JSON decode error: {e}")
-        print(f"[DEBUG] Raw response: {response.text}")
+        raise ProviderError("publication", f"요청 실패: {e}")
+
+    regular_count = len((response_data.get("regular_results") or {}).get("available_reports", []))
+    revision_count = len((response_data.get("revision_results") or {}).get("revision_documents", []))
+    print(f"[DEBUG] Response parsed: regular={regular_count}, revision={revision_count}")
+    return response_data
+
+
+def _without_api_values(response_data):
+    """정기보고서 api_data 값을 None 으로 바꾼 사본 (키 목록은 유지)"""
+    regular_results = response_data.get("regular_results")
+    if not regular_results:
+        return response_data
+
+    reports = []
+    for report in regular_results.get("available_reports", []):
+        processed = report.get("processed_data")
+        if processed and processed.get("api_data"):
+            processed = dict(processed, api_data={key: None for key in processed["api_data"]})
+            report = dict(report, processed_data=processed)
+        reports.append(report)
+    return dict(response_data, regular_results=dict(regular_results, available_reports=reports))
+
+
+def _stash_api_values(query, response_data):
+    """1단계 응답의 보고서별 api_data 값을 query 단위로 보관 (오래된 query 부터 제거)"""
+    reports = {
+        (str(report.get("year")), str(report.get("quarter"))): (report.get("processed_data") or {}).get("api_data") or {}
+        for report in (response_data.get("regular_results") or {}).get("available_reports", [])
+    }
+    if not reports:
+        return
+    with _pending_lock:
+        _pending_api_data[query] = (time.monotonic(), reports)
+        _pending_api_data.move_to_end(query)
+        while len(_pending_api_data) > PENDING_API_DATA_MAX_QUERIES:
+            _pending_api_data.popitem(last=False)
+
+
+def _stashed_api_values(query, wanted):
+    """보관된 api_data 중 wanted({(year, quarter): 키 집합}) 값, 보고서가 하나라도 없거나 만료되면 None"""
+    with _pending_lock:
+        entry = _pending_api_data.get(query)
+        if entry is None or time.monotonic() - entry[0] > PENDING_API_DATA_TTL_SECONDS:
+            _pending_api_data.pop(query, None)
+            return None
+        reports = entry[1]
+    if any(key not in reports for key in wanted):
         return None
+    return {
+        key: {api_key: data for api_key, data in reports[key].items() if api_key in api_keys and data is not None}
+        for key, api_keys in wanted.items()
+    }
+
+
+def _search_with_cache(cache, query, dart_type):
+    """유형별로 캐시를 확인하고 없는 유형만 원격 조회 (원격 조회 시 api_data 값까지 받아 캐시)"""
+    sections = sections_for(dart_type)
+    cached = cache.lookup(query, sections)
+    missing = [section for section in sections if section not in cached]
+    print(f"[DEBUG] Publication cache: hit={list(cached)}, miss={missing}")
+
+    response_data = {"query": query, "dart_type": dart_type}
+    if missing:
+        remote = _request_publications({
+            "query": query,
+            "dart_type": missing[0] if len(missing) == 1 else "both"
+        })
+        cache.store(query, remote, missing)
+        response_data["search_params"] = remote.get("search_params")
+        for section in missing:
+            if SECTIONS[section] in remote:
+                response_data[SECTIONS[section]] = remote[SECTIONS[section]]
+
+    for section, entry in cached.items():
+        response_data.setdefault("search_params", entry["search_params"])
+        response_data[SECTIONS[section]] = entry["results"]
+    return response_data
+
+
+def search_publications(query, dart_type="both", metadata_only=False, use_cache=True):
+    """
+    Send POST request to publication search API
+
+    Args:
+        query (str): Search query (e.g., "LG Electronics")
+        dart_type (str): Type of search, defaults to "both"
+        metadata_only (bool): True 이면 정기보고서 api_data 는 키 목록만 반환 (값은 None, fetch_report_api_data 로 나중에 로드)
+        use_cache (bool): 디스크 캐시 사용 여부 (PUB_CACHE_ENABLED=false 이면 항상 원격 호출)
+
+    Returns:
+        dict: API response (raw_data, 정정보고서 content 등 사용하지 않는 큰 필드는 파싱 중 제거)
+
+    Raises:
+        ProviderError: 서비스 장애/타임아웃/응답 오류 (브레이커가 열려 있으면 CircuitOpenError)
+    """
+    cache = get_publication_cache() if use_cache else None
+    if cache is not None:
+        response_data = _search_with_cache(cache, query, dart_type)
+        return _without_api_values(response_data) if metadata_only else response_data
+
+    input_data = {
+        "query": query,
+        "dart_type": dart_type
+    }
+    if metadata_only:
+        input_data["metadata_only"] = True
+
+    response_data = _request_publications(input_data)
+    if not metadata_only:
+        return response_data
+    # 서비스가 metadata_only 를 무시하고 값까지 보내므로, 버리지 않고 2단계 로딩용으로 보관
+    _stash_api_values(query, response_data)
+    return _without_api_values(response_data)
+
+
+def fetch_report_api_data(query, selections, use_cache=True):
+    """
+    선택된 정기보고서의 API 데이터만 로드 (2단계 로딩, 1단계 응답에서 보관한 값이나 캐시에 있으면 원격 호출 없음)
+
+    Args:
+        query (str): 1단계 검색에 사용한 쿼리
+        selections (list): [{"year": 2025, "quarter": 2, "api_keys": ["api_02", ...]}, ...]
+        use_cache (bool): 디스크 캐시 사용 여부
+
+    Returns:
+        dict: {(str(year), str(quarter)): {api_key: data}}
+
+    Raises:
+        ProviderError: 서비스 장애/타임아웃/응답 오류
+    """
+    selections = [selection for selection in selections if selection.get("api_keys")]
+    if not selections:
+        return {}
+
+    wanted = {(str(s.get("year")), str(s.get("quarter"))): set(s["api_keys"]) for s in selections}
+    stashed = _stashed_api_values(query, wanted)
+    if stashed is not None:
+        print(f"[DEBUG] API data loaded from phase-1 response: {list(stashed)}")
+        return stashed
+
+    cache = get_publication_cache() if use_cache else None
+    if cache is not None:
+        response_data = _search_with_cache(cache, query, "regular")
+    else:
+        input_data = {
+            "query": query,
+            "dart_type": "regular",
+            "api_selection": selections
+        }
+        # 서비스가 api_selection 을 지원하지 않아 전체를 보내더라도 선택한 키의 값만 파싱
+        all_keys = frozenset(key for selection in selections for key in selection["api_keys"])
+        response_data = _request_publications(input_data, api_keys=all_keys)
+
+    loaded = {}
+    for report in (response_data.get("regular_results") or {}).get("available_reports", []):
+        key = (str(report.get("year")), str(report.get("quarter")))
+        if key not in wanted:
+            continue
+        api_data = (report.get("processed_data") or {}).get("api_data") or {}
+        loaded[key] = {
+            api_key: data for api_key, data in api_data.items()
+            if api_key in wanted[key] and data is not None
+        }
+    return loaded
 
 
 if __name__ == "__main__":
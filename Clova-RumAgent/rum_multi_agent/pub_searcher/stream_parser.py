@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+출판물 검색 응답 스트리밍 파서
+
+응답 JSON을 한 번에 로드하지 않고 소켓에서 읽는 즉시 이벤트 단위로 파싱하면서
+format_results 에서 쓰지 않는 큰 필드(raw_data, 정정보고서 content 등)를 버리고 필요한 부분만 조립합니다.
+api_keys 를 지정하면 정기보고서 api_data 는 해당 키의 값만 남기고 나머지 키는 값을 None 으로 둡니다
+(빈 집합이면 키 목록만 남는 메타데이터 전용 응답).
+
+ijson 은 C 백엔드(yajl2_c)를 씁니다. ijson 이 설치되지 않았거나 PUB_STREAM_PARSE=false 이면
+표준 json 으로 전체를 읽은 뒤 object_hook 으로 같은 필드를 제거합니다 (peak 메모리는 줄지 않음).
+"""
+import json
+import os
+
+try:
+    import ijson
+except ImportError:  # requirements.txt 에 포함, 없으면 표준 json 으로 대체
+    ijson = None
+
+# 스트리밍 파싱 백엔드 (C 백엔드가 없는 환경에서는 ijson 기본 백엔드)
+if ijson is not None:
+    try:
+        _ijson_backend = ijson.get_backend("yajl2_c")
+    except ImportError:
+        _ijson_backend = ijson
+else:
+    _ijson_backend = None
+
+# 스트리밍 파싱 사용 여부
+PUB_STREAM_PARSE = os.getenv("PUB_STREAM_PARSE", "true").lower() == "true"
+
+# 파싱 실패 시 발생할 수 있는 예외
+PARSE_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+# 파싱 중 버리는 경로 (ijson prefix 형식)
+DROP_PATHS = frozenset({
+    "regular_results.available_reports.item.raw_data",
+    "regular_results.available_reports.item.file_path",
+    "revision_results.revision_documents.item.content",
+})
+
+# 키만 남기고 값은 선택적으로 로드하는 경로
+API_DATA_PATH = "regular_results.available_reports.item.processed_data.api_data"
+
+_START_EVENTS = frozenset({"start_map", "start_array"})
+_END_EVENTS = frozenset({"end_map", "end_array"})
+
+
+def _skip_subtree(events):
+    """start_map/start_array 직후부터 짝이 맞는 end 이벤트까지 소비"""
+    depth = 1
+    for _, event, _ in events:
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if not depth:
+                return
+
+
+def _build_projected(events, drop_paths=DROP_PATHS, api_keys=None):
+    """ijson 이벤트 스트림에서 drop_paths 하위 트리를 건너뛰며 객체 조립
+
+    api_keys 가 None 이 아니면 api_data 중 api_keys 에 없는 키의 값은 읽지 않고 None 으로 둡니다.
+    건너뛰는 하위 트리는 별도 루프에서 이벤트 종류만 보고 소비합니다.
+    """
+    events = iter(events)
+    root = None
+    stack = []
+    key = None
+
+    for prefix, event, value in events:
+        if event == "map_key":
+            api_skipped = api_keys is not None and prefix == API_DATA_PATH and value not in api_keys
+            if api_skipped or (f"{prefix}.{value}" if prefix else value) in drop_paths:
+                _, event, _ = next(events)
+                if event in _START_EVENTS:
+                    _skip_subtree(events)
+                if api_skipped:
+                    # 키는 남기고 값은 건너뜀
+                    stack[-1][value] = None
+                continue
+            key = value
+            continue
+
+        if event in _END_EVENTS:
+            stack.pop()
+            continue
+        if event in _START_EVENTS:
+            value = {} if event == "start_map" else []
+        if not stack:
+            root = value
+        elif type(stack[-1]) is dict:
+            stack[-1][key] = value
+        else:
+            stack[-1].append(value)
+        if event in _START_EVENTS:
+            stack.append(value)
+
+    return root
+
+
+def _drop_heavy_fields(obj, api_keys=None):
+    """표준 json 파싱용 object_hook (객체가 만들어지는 즉시 큰 필드 제거)"""
+    if "processed_data" in obj:
+        obj.pop("raw_data", None)
+        obj.pop("file_path", None)
+    if "basic_info" in obj and "content_length" in obj:
+        obj.pop("content", None)
+    if api_keys is not None and "metadata" in obj and isinstance(obj.get("api_data"), dict):
+        obj["api_data"] = {key: value if key in api_keys else None for key, value in obj["api_data"].items()}
+    return obj
+
+
+def _object_hook(api_keys):
+    """api_keys 를 고정한 object_hook"""
+    if api_keys is None:
+        return _drop_heavy_fields
+    return lambda obj: _drop_heavy_fields(obj, api_keys)
+
+
+def parse_publication_stream(stream, api_keys=None, streaming=PUB_STREAM_PARSE):
+    """파일 객체(응답 raw 스트림 등)에서 필요한 필드만 담은 응답 dict 생성"""
+    if streaming and _ijson_backend is not None:
+        return _build_projected(_ijson_backend.parse(stream, use_float=True), api_keys=api_keys)
+    return json.load(stream, object_hook=_object_hook(api_keys))
+
+
+def parse_publication_bytes(data, api_keys=None, streaming=PUB_STREAM_PARSE):
+    """이미 받은 응답 본문(bytes/str)에서 필요한 필드만 담은 응답 dict 생성"""
+    if streaming and _ijson_backend is not None:
+        raw = data if isinstance(data, bytes) else data.encode("utf-8")
+        return _build_projected(_ijson_backend.parse(raw, use_float=True), api_keys=api_keys)
+    return json.loads(data, object_hook=_object_hook(api_keys))
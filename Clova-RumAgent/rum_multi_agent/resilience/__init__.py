@@ -0,0 +1,23 @@
+"""
+외부 호출 복원력 패키지
+"""
+from .hedging import HedgedLLM, hedging_stats
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderError,
+    ResilientClient,
+    breaker_states,
+    get_resilient_client,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "HedgedLLM",
+    "ProviderError",
+    "ResilientClient",
+    "breaker_states",
+    "get_resilient_client",
+    "hedging_stats",
+]
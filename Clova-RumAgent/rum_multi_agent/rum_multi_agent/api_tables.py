@@ -0,0 +1,210 @@
+"""
+정기보고서 API 데이터 표 변환
+출판물 서비스가 주는 DART API 데이터(마크다운 표 문자열, JSON 행 목록)를 pandas 표로 한 번만 파싱해
+필요한 열만 한글 머리글로 남기고, 빈 행/열을 뺀 압축 TSV 로 프롬프트에 넣습니다.
+"""
+import json
+import re
+from functools import lru_cache
+from typing import Any, List, Optional
+
+import pandas as pd
+
+# DART 공통 메타데이터 열 (보고서 정보에 이미 있음)
+META_COLUMNS = {"rcept_no", "corp_cls", "corp_code", "corp_name", "stlm_dt"}
+# 비어 있음을 뜻하는 값
+EMPTY_VALUES = {"", "-", "None", "null"}
+_BREAK_RE = re.compile(r"\s*\n\s*")
+
+# DART 필드 → 한글 머리글
+COLUMN_LABELS = {
+    # 공통
+    "se": "구분", "se_nm": "구분", "stock_knd": "주식종류", "nm": "성명", "ofcps": "직위", "sexdstn": "성별",
+    "rm": "비고", "sm": "합계", "nmpr": "인원수", "bsns_year": "사업연도", "adtor": "감사인",
+    # api_01 증자(감자) 현황
+    "isu_dcrs_de": "일자", "isu_dcrs_stle": "형태", "isu_dcrs_stock_knd": "주식종류", "isu_dcrs_qy": "수량",
+    "isu_dcrs_mstvdv_fval_amount": "주당액면가", "isu_dcrs_mstvdv_amount": "주당발행가",
+    # api_02 배당
+    "thstrm": "당기", "frmtrm": "전기", "lwfr": "전전기",
+    # api_03 자기주식
+    "acqs_mth1": "취득방법", "acqs_mth2": "취득방법(중)", "acqs_mth3": "취득방법(소)",
+    "bsis_qy": "기초수량", "change_qy_acqs": "취득", "change_qy_dsps": "처분", "change_qy_incnr": "소각",
+    "trmend_qy": "기말수량",
+    # api_04 최대주주 / api_05 최대주주 변동
+    "relate": "관계", "bsis_posesn_stock_co": "기초주식수", "bsis_posesn_stock_qota_rt": "기초지분율",
+    "trmend_posesn_stock_co": "기말주식수", "trmend_posesn_stock_qota_rt": "기말지분율",
+    "change_on": "변동일", "mxmm_shrholdr_nm": "최대주주", "posesn_stock_co": "소유주식수", "qota_rt": "지분율",
+    "change_cause": "변동원인",
+    # api_06 소액주주
+    "shrholdr_co": "소액주주수", "shrholdr_tot_co": "전체주주수", "shrholdr_rate": "소액주주비율",
+    "hold_stock_co": "소액주주주식수", "stock_tot_co": "총발행주식수", "hold_stock_rate": "소액주주주식비율",
+    # api_07 임원
+    "birth_ym": "출생년월", "rgist_exctv_at": "등기여부", "fte_at": "상근여부", "chrg_job": "담당업무",
+    "main_career": "주요경력", "mxmm_shrholdr_relate": "최대주주관계", "hffc_pd": "재직기간",
+    "tenure_end_on": "임기만료일",
+    # api_08 직원
+    "fo_bbm": "사업부문", "reform_bfe_emp_co_rgllbr": "개정전정규직", "reform_bfe_emp_co_cnttk": "개정전계약직",
+    "reform_bfe_emp_co_etc": "개정전기타", "rgllbr_co": "정규직", "rgllbr_abacpt_labrr_co": "정규직(단시간)",
+    "cnttk_co": "계약직", "cnttk_abacpt_labrr_co": "계약직(단시간)", "avrg_cnwk_sdytrn": "평균근속연수",
+    "fyer_salary_totamt": "연간급여총액", "jan_salary_am": "1인평균급여",
+    # api_09~11, 24~26 보수
+    "mendng_totamt": "보수총액", "mendng_totamt_ct_incls_mendng": "보수총액 외 보수", "jan_avrg_mendng_am": "1인평균보수",
+    "gmtsck_confm_amount": "주총승인금액", "pymnt_totamt": "보수총액", "psn1_avrg_pymntamt": "1인평균보수",
+    # api_12 타법인 출자
+    "inv_prm": "법인명", "frst_acqs_de": "최초취득일", "invstmnt_purps": "출자목적", "frst_acqs_amount": "최초취득금액",
+    "bsis_blce_qy": "기초수량", "bsis_blce_qota_rt": "기초지분율", "bsis_blce_acntbk_amount": "기초장부가",
+    "incrs_dcrs_acqs_dsps_qy": "증감수량", "incrs_dcrs_acqs_dsps_amount": "증감금액", "incrs_dcrs_evl_lstmn": "평가손익",
+    "trmend_blce_qy": "기말수량", "trmend_blce_qota_rt": "기말지분율", "trmend_blce_acntbk_amount": "기말장부가",
+    "recent_bsns_year_fnnr_sttus_tot_assets": "최근총자산", "recent_bsns_year_fnnr_sttus_thstrm_ntpf": "최근순손익",
+    # api_13 주식 총수
+    "isu_stock_totqy": "발행할주식총수", "now_to_isu_stock_totqy": "누적발행", "now_to_dcrs_stock_totqy": "누적감소",
+    "redc": "감자", "profit_incnr": "이익소각", "rdmstk_repy": "상환주식상환", "etc": "기타",
+    "istc_totqy": "발행주식총수", "tesstk_co": "자기주식수", "distb_stock_co": "유통주식수",
+    # api_14 채무증권 발행실적
+    "isu_cmpny": "발행회사", "scrits_knd_nm": "증권종류", "isu_mth_nm": "발행방법", "isu_de": "발행일",
+    "facvalu_totamt": "권면총액", "intrt": "이자율", "evl_grad_instt": "평가등급", "mtd": "만기일",
+    "repy_at": "상환여부", "mngt_cmpny": "주관회사",
+    # api_15~19 미상환 잔액 (잔여만기 구간)
+    "remndr_exprtn1": "잔여만기", "remndr_exprtn2": "구분2", "de10_below": "10일이하",
+    "de10_excess_de30_below": "10~30일", "de30_excess_de90_below": "30~90일", "de90_excess_de180_below": "90~180일",
+    "de180_excess_yy1_below": "180일~1년", "yy1_below": "1년이하", "yy1_excess_yy2_below": "1~2년",
+    "yy2_excess_yy3_below": "2~3년", "yy3_excess": "3년초과", "yy3_excess_yy4_below": "3~4년",
+    "yy4_excess_yy5_below": "4~5년", "yy1_excess_yy5_below": "1~5년", "yy5_excess_yy10_below": "5~10년",
+    "yy10_excess": "10년초과", "yy10_excess_yy15_below": "10~15년", "yy15_excess_yy20_below": "15~20년",
+    "yy10_excess_yy20_below": "10~20년", "yy20_excess_yy30_below": "20~30년", "yy30_excess": "30년초과",
+    "isu_lmt": "발행한도", "remndr_lmt": "잔여한도",
+    # api_20~22 회계감사
+    "adt_opinion": "감사의견", "adt_reprt_spcmnt_matter": "특기사항", "emphs_matter": "강조사항",
+    "core_adt_matter": "핵심감사사항", "cn": "내용", "mendng": "보수", "tot_reqre_time": "총소요시간",
+    "adt_cntrct_dtls_mendng": "계약보수", "adt_cntrct_dtls_time": "계약시간", "real_exc_dtls_mendng": "실제보수",
+    "real_exc_dtls_time": "실제시간", "cntrct_cncls_de": "계약일", "servc_cn": "용역내용",
+    "servc_exc_pd": "수행기간", "servc_mendng": "용역보수",
+    # api_23 사외이사
+    "drctr_co": "이사수", "otcmp_drctr_co": "사외이사수", "apnt": "선임", "rlsofc": "해임", "mdstrm_resig": "중도퇴임",
+    # api_27, 28 공모/사모자금
+    "tm": "회차", "pay_de": "납입일", "pay_amount": "납입금액", "on_dclrt_cptal_use_plan": "신고서상 사용계획",
+    "real_cptal_use_sttus": "실제사용현황", "rs_cptal_use_plan_useprps": "계획용도",
+    "rs_cptal_use_plan_prcure_amount": "계획금액", "real_cptal_use_dtls_cn": "실제사용내용",
+    "real_cptal_use_dtls_amount": "실제사용금액", "dffrnc_occrrnc_resn": "차이발생사유",
+    "cptal_use_plan": "사용계획", "mtrpt_cptal_use_plan_useprps": "계획용도",
+    "mtrpt_cptal_use_plan_prcure_amount": "계획금액",
+}
+# 여러 열을 하나로 합쳐 보여 줄 API (합친 열 이름 → 원래 열, 값은 "/" 로 연결)
+MERGED_COLUMNS = {
+    "api_03": {"acqs_mth1": ["acqs_mth1", "acqs_mth2", "acqs_mth3"]},
+}
+# 값이 아닌 행 이름 역할의 열 (이 열만 채워진 행은 빈 행으로 보고 제외)
+LABEL_COLUMNS = {
+    "se", "se_nm", "stock_knd", "nm", "ofcps", "sexdstn", "relate", "acqs_mth1", "acqs_mth2", "acqs_mth3",
+    "isu_dcrs_stock_knd", "isu_dcrs_stle", "isu_dcrs_de", "fo_bbm", "remndr_exprtn1", "remndr_exprtn2",
+    "bsns_year", "adtor", "inv_prm", "tm",
+}
+
+
+def _clean_cell(value: Any) -> str:
+    """셀 값 → 한 줄 문자열 (셀 안 줄바꿈은 ' / ', 비어 있음을 뜻하는 값은 빈 문자열)"""
+    if value is None or value != value:
+        return ""
+    value = str(value).strip()
+    if value in EMPTY_VALUES:
+        return ""
+    if "\n" in value or "\t" in value:
+        value = _BREAK_RE.sub(" / ", value).replace("\t", " ")
+    return value
+
+
+def _split_markdown_rows(lines: List[str]) -> List[str]:
+    """마크다운 표 본문 줄 → 행 (셀 안 줄바꿈은 다음 '|' 로 시작하는 줄 전까지 이어 붙임)"""
+    rows = []
+    for line in lines:
+        if rows and not (rows[-1].rstrip().endswith("|") and line.lstrip().startswith("|")):
+            rows[-1] += "\n" + line
+        elif line.strip():
+            rows.append(line)
+    return rows
+
+
+def _split_cells(row: str) -> List[str]:
+    row = row.strip()
+    return [cell.strip() for cell in row[1:-1].split("|")]
+
+
+def _parse_markdown(text: str) -> Optional[pd.DataFrame]:
+    """'## api_XX' 제목 + 마크다운 표 → DataFrame ('| Field | Value |' 세로 표는 한 행으로)"""
+    lines = [line for line in text.split("\n") if not line.startswith("#")]
+    start = next((i for i, line in enumerate(lines) if line.lstrip().startswith("|")), None)
+    if start is None or start + 1 >= len(lines):
+        return None
+    columns = _split_cells(lines[start])
+    rows = []
+    for row in _split_markdown_rows(lines[start + 2:]):
+        cells = _split_cells(row)
+        rows.append((cells + [""] * len(columns))[:len(columns)])
+    if columns == ["Field", "Value"]:
+        return pd.DataFrame([{field: value for field, value in rows}], dtype=object)
+    return pd.DataFrame(rows, columns=columns, dtype=object)
+
+
+def parse_api_table(data: Any) -> Optional[pd.DataFrame]:
+    """API 데이터 (마크다운 표 문자열, JSON 문자열, 행 dict 목록) → 문자열 DataFrame, 표가 아니면 None"""
+    if isinstance(data, str):
+        text = data.strip()
+        if text[:1] in ("[", "{"):
+            try:
+                data = json.loads(text)
+            except ValueError:
+                return None
+        else:
+            return _parse_markdown(text)
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        return None
+    return pd.DataFrame.from_records(data).astype(object)
+
+
+def project_api_table(api_key: str, frame: pd.DataFrame) -> pd.DataFrame:
+    """메타데이터/빈 열과 값이 없거나 중복된 행을 빼고, 열을 합친 뒤 한글 머리글로 변경"""
+    frame = frame.drop(columns=[column for column in frame.columns if column in META_COLUMNS])
+    frame = frame.map(_clean_cell)
+    for merged, sources in MERGED_COLUMNS.get(api_key, {}).items():
+        sources = [column for column in sources if column in frame.columns]
+        if len(sources) > 1:
+            frame[merged] = [
+                "/".join(dict.fromkeys(value for value in row if value))
+                for row in frame[sources].itertuples(index=False, name=None)
+            ]
+            frame = frame.drop(columns=[column for column in sources if column != merged])
+    frame = frame.loc[:, frame.ne("").any(axis=0)]
+    values = [column for column in frame.columns if column not in LABEL_COLUMNS]
+    if values:
+        frame = frame[frame[values].ne("").any(axis=1)]
+    return frame.drop_duplicates().rename(columns=COLUMN_LABELS)
+
+
+def render_tsv(frame: pd.DataFrame) -> str:
+    """표 → TSV (한 행짜리 표는 '머리글<TAB>값' 세로 목록)"""
+    if frame.empty:
+        return "(해당 없음)"
+    if len(frame) == 1 and len(frame.columns) > 2:
+        return "\n".join(f"{column}\t{value}" for column, value in frame.iloc[0].items() if value)
+    lines = ["\t".join(map(str, frame.columns))]
+    lines.extend("\t".join(row) for row in frame.itertuples(index=False, name=None))
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=512)
+def _format_text(api_key: str, text: str) -> str:
+    frame = parse_api_table(text)
+    if frame is None:
+        return text
+    return render_tsv(project_api_table(api_key, frame))
+
+
+def format_api_data(api_key: str, data: Any) -> str:
+    """API 데이터를 프롬프트용 압축 TSV 로 변환 (표로 파싱되지 않으면 원문, 같은 값은 메모이즈)"""
+    if data is None:
+        return "(해당 없음)"
+    if not isinstance(data, str):
+        data = json.dumps(data, ensure_ascii=False)
+    return _format_text(api_key, data)
@@ -0,0 +1,70 @@
+"""
+요청 지연 예산
+invoke 입력으로 state["latency_budget"](초)를 주면 analyze_query 가 마감 시각(deadline_at)을 정하고,
+각 노드는 남은 시간이 이후 단계를 전부 처리하기에 부족하면 작업을 줄입니다.
+적용한 축소는 state["degradations"] 에 기록되어 답변 끝에 표시됩니다.
+"""
+import time
+from typing import List, Optional
+
+FULL = "full"
+REDUCED = "reduced"
+MINIMAL = "minimal"
+
+# 전체 처리 시 단계별 예상 소요 시간 (초)
+STAGE_SECONDS = {"search": 6.0, "select": 3.0, "generate": 12.0}
+STAGES = list(STAGE_SECONDS)
+# 남은 시간이 이후 단계 예상 합의 이 비율 이상이면 reduced, 미만이면 minimal
+REDUCED_RATIO = 0.5
+# 기다림 상한 계산 시 이후 단계를 축소 처리한다고 보고 남겨 둘 비율
+RESERVE_RATIO = 0.5
+MIN_WAIT_SECONDS = 0.5
+
+
+def start_budget(state) -> None:
+    """예산이 주어졌으면 마감 시각 설정 (체크포인트 재개에도 유지되도록 epoch 초로 저장)"""
+    if state.get("latency_budget") and not state.get("deadline_at"):
+        state["deadline_at"] = time.time() + float(state["latency_budget"])
+
+
+def remaining_seconds(state) -> Optional[float]:
+    """마감까지 남은 시간 (예산이 없으면 None)"""
+    deadline_at = state.get("deadline_at")
+    if not deadline_at:
+        return None
+    return deadline_at - time.time()
+
+
+def _seconds_from(stage: str) -> float:
+    """stage 부터 끝까지 예상 소요 시간"""
+    return sum(STAGE_SECONDS[name] for name in STAGES[STAGES.index(stage):])
+
+
+def budget_level(state, stage: str) -> str:
+    """stage 에서 적용할 처리 수준 (full / reduced / minimal)"""
+    remaining = remaining_seconds(state)
+    if remaining is None:
+        return FULL
+    needed = _seconds_from(stage)
+    if remaining >= needed:
+        return FULL
+    if remaining >= needed * REDUCED_RATIO:
+        return REDUCED
+    return MINIMAL
+
+
+def wait_limit(state, stage: str) -> Optional[float]:
+    """stage 에서 외부 응답을 기다릴 수 있는 최대 시간 (이후 단계 몫을 남김, 예산이 없으면 None)"""
+    remaining = remaining_seconds(state)
+    if remaining is None:
+        return None
+    later = STAGES[STAGES.index(stage) + 1:]
+    reserve = sum(STAGE_SECONDS[name] for name in later) * RESERVE_RATIO
+    return max(remaining - reserve, MIN_WAIT_SECONDS)
+
+
+def degradation_note(degradations: List[str]) -> str:
+    """답변 끝에 붙일 축소 내역"""
+    if not degradations:
+        return ""
+    return "\n\n---\n※ 응답 시간 제한으로 간소화된 답변입니다: " + ", ".join(degradations)
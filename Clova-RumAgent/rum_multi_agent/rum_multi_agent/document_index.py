@@ -0,0 +1,123 @@
+"""
+검색 문서 id/색인
+format_results 에서 문서마다 안정적인 id 를 붙이고 해시 색인을 만들어,
+선택된 문서를 id 로 O(1) 조회합니다. LLM 이 id 대신 제목 등을 (조금 바꿔) 돌려준 경우를 위한 퍼지 대체 조회를 포함합니다.
+"""
+import re
+import zlib
+from typing import Dict, List, Optional
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+# 퍼지 대체 조회 최소 유사도 (문자 bigram Dice 계수)
+FUZZY_THRESHOLD = 0.6
+
+
+def _normalize(text) -> str:
+    """소문자화 후 공백/기호 제거"""
+    return _NON_WORD_RE.sub("", str(text or "").lower())
+
+
+def document_id(doc_type: str, doc: Dict) -> str:
+    """문서 내용에서 결정되는 안정적인 id (같은 문서는 실행마다 같은 id)"""
+    if doc_type == "news":
+        key = doc.get("link") or doc.get("title", "")
+        return f"N-{zlib.crc32(str(key).encode('utf-8')):08x}"
+    if doc_type == "regular":
+        return f"R-{doc.get('year')}Q{doc.get('quarter')}"
+    basic_info = doc.get("basic_info", {})
+    key = basic_info.get("rcept_no") or basic_info.get("title") or doc.get("index")
+    return f"V-{key}"
+
+
+def lookup_key(doc_type: str, doc: Dict) -> Optional[str]:
+    """id 가 없을 때 쓰는 정확 일치 키 (뉴스: 제목, 정기보고서: 연도/분기, 정정보고서: 접수번호/제목)"""
+    if doc_type == "news":
+        return f"news:{_normalize(doc.get('title'))}" if doc.get("title") else None
+    if doc_type == "regular":
+        if doc.get("year") is None or doc.get("quarter") is None:
+            return None
+        return f"regular:{doc.get('year')}:{doc.get('quarter')}"
+    basic_info = doc.get("basic_info") or {}
+    if basic_info.get("rcept_no"):
+        return f"revision:{basic_info['rcept_no']}"
+    if basic_info.get("title"):
+        return f"revision:{_normalize(basic_info['title'])}"
+    return None
+
+
+def _fuzzy_text(doc_type: str, doc: Dict) -> str:
+    """퍼지 비교용 텍스트"""
+    if doc_type == "news":
+        return _normalize(doc.get("title"))
+    if doc_type == "regular":
+        return _normalize(f"{doc.get('company_name', '')}{doc.get('year', '')}{doc.get('quarter', '')}")
+    basic_info = doc.get("basic_info") or {}
+    return _normalize(f"{basic_info.get('report_name', '')}{basic_info.get('date', '')}")
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)} or ({text} if text else set())
+
+
+def _dice(a: set, b: set) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+def assign_ids(searched_list: Dict[str, List[Dict]]) -> None:
+    """유형별 문서에 id 부여 (같은 id 가 겹치면 순번을 붙여 구분)"""
+    seen = set()
+    for doc_type, docs in searched_list.items():
+        for doc in docs:
+            doc_id = base_id = document_id(doc_type, doc)
+            suffix = 2
+            while doc_id in seen:
+                doc_id = f"{base_id}-{suffix}"
+                suffix += 1
+            seen.add(doc_id)
+            doc["id"] = doc_id
+
+
+def build_document_index(searched_list: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """id → [유형, 위치], 정확 일치 키 → id 해시 색인"""
+    ids, keys = {}, {}
+    for doc_type, docs in searched_list.items():
+        for position, doc in enumerate(docs):
+            ids[doc["id"]] = [doc_type, position]
+            key = lookup_key(doc_type, doc)
+            if key:
+                keys.setdefault(key, doc["id"])
+    return {"ids": ids, "keys": keys}
+
+
+def resolve_document(
+    searched_list: Dict[str, List[Dict]],
+    index: Optional[Dict[str, Dict]],
+    doc_type: str,
+    selected: Dict
+) -> Optional[Dict]:
+    """선택 항목에 해당하는 검색 문서 조회
+
+    1) id 색인 (O(1)) 2) 정확 일치 키 색인 (O(1)) 3) 같은 유형 문서와 문자 bigram 유사도 비교 (퍼지 대체)
+    """
+    docs = searched_list.get(doc_type, [])
+    index = index or build_document_index(searched_list)
+
+    location = index["ids"].get(selected.get("id"))
+    if location and location[0] == doc_type:
+        return docs[location[1]]
+
+    key = lookup_key(doc_type, selected)
+    if key and key in index["keys"]:
+        location = index["ids"][index["keys"][key]]
+        return docs[location[1]]
+
+    target = _bigrams(_fuzzy_text(doc_type, selected))
+    best, best_score = None, FUZZY_THRESHOLD
+    for doc in docs:
+        score = _dice(target, _bigrams(_fuzzy_text(doc_type, doc)))
+        if score >= best_score:
+            best, best_score = doc, score
+    if best is not None:
+        print(f"[DEBUG] Fuzzy matched {doc_type} document {best['id']} (score {best_score:.2f})")
+    return best
@@ -1,6 +1,7 @@
 """
 LangGraph Studio용 검색 그래프 정의
 """
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 from naver_news_searcher.news_searcher import NewsSearcher
 
@@ -32,7 +33,11 @@ def create_search_graph():
     workflow.add_node("search_publications", nodes.search_publications)
     workflow.add_node("format_results", nodes.format_results)
     workflow.add_node("select_documents", doc_nodes.select_documents)
-    workflow.add_node("generate_response", gen_nodes.generate_response)
+    # 비동기 실행(langgraph dev / astream)에서는 astream 토큰 스트리밍, 동기 invoke 에서는 stream 사용
+    workflow.add_node(
+        "generate_response",
+        RunnableLambda(gen_nodes.generate_response, afunc=gen_nodes.agenerate_response, name="generate_response")
+    )
 
     # 엣지 정의 - 병렬 실행 구조
     workflow.set_entry_point("analyze_query")
@@ -51,5 +56,50 @@ def create_search_graph():
     return workflow
 
 
+def create_incremental_search_graph():
+    """증분 검색 그래프 생성
+
+    출판물 검색을 백그라운드로 시작해 두고, 뉴스 정리/선택을 먼저 진행한 뒤
+    출판물 결과를 마감 시간(publication_deadline)까지 기다려 병합합니다. 늦으면 뉴스만으로 답변합니다.
+    """
+    try:
+        news_searcher = NewsSearcher()
+    except ValueError as e:
+        print(f"Warning: News searcher initialization failed: {e}")
+        news_searcher = None
+
+    nodes = SearchNodes(news_searcher)
+    doc_nodes = DocumentNodes()
+    gen_nodes = GenerationNodes()
+
+    workflow = StateGraph(SearchState)
+
+    workflow.add_node("analyze_query", nodes.analyze_query)
+    workflow.add_node("start_publications", nodes.start_publications)
+    workflow.add_node("search_news", nodes.search_news)
+    workflow.add_node("format_news", nodes.format_news)
+    workflow.add_node("select_news", doc_nodes.select_news)
+    workflow.add_node("merge_publications", nodes.merge_publications)
+    workflow.add_node("select_publications", doc_nodes.select_publications)
+    workflow.add_node(
+        "generate_response",
+        RunnableLambda(gen_nodes.generate_response, afunc=gen_nodes.agenerate_response, name="generate_response")
+    )
+
+    # 출판물 검색은 start_publications 에서 백그라운드로 실행되어 뉴스 경로와 겹침
+    workflow.set_entry_point("analyze_query")
+    workflow.add_edge("analyze_query", "start_publications")
+    workflow.add_edge("start_publications", "search_news")
+    workflow.add_edge("search_news", "format_news")
+    workflow.add_edge("format_news", "select_news")
+    workflow.add_edge("select_news", "merge_publications")
+    workflow.add_edge("merge_publications", "select_publications")
+    workflow.add_edge("select_publications", "generate_response")
+    workflow.add_edge("generate_response", END)
+
+    return workflow
+
+
 # LangGraph Studio에서 사용할 그래프 인스턴스
-graph = create_search_graph().compile()
\ No newline at end of file
+graph = create_search_graph().compile()
+incremental_graph = create_incremental_search_graph().compile()
\ No newline at end of file
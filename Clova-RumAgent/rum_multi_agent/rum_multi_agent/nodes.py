@@ -1,17 +1,94 @@
 """
 검색 에이전트 노드 함수들
 """
+import os
 import json
+import time
+import uuid
+import threading
 import asyncio
 import concurrent.futures
 from typing import Dict
+from langchain_core.runnables import RunnableConfig
 from rum_multi_agent.state import SearchState
+from rum_multi_agent.scoring import score_documents, select_api_keys
+from rum_multi_agent.document_index import assign_ids, build_document_index, resolve_document
+from rum_multi_agent.api_tables import format_api_data
+from rum_multi_agent.budget import (
+    FULL, MINIMAL, REDUCED, budget_level, degradation_note, start_budget, wait_limit
+)
+from rum_multi_agent.routing import STANDARD, THINKING, TIER_MODELS, record_generation, route_generation
+from resilience import CircuitOpenError, HedgedLLM, get_resilient_client
+from blob_store import put_blob, resolve_blob
+from llm_cache import get_llm_cache
 from naver_news_searcher.news_searcher import NewsSearcher
-from pub_searcher.pub_searcher import search_publications
+from pub_searcher.pub_searcher import fetch_report_api_data, search_publications
 from langchain_naver import ChatClovaX
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+# LLM에 전달할 유형별 후보 수 (로컬 점수 상위)
+SHORTLIST_SIZES = {"news": 8, "regular": 4, "revision": 5}
+# LLM 없이 선택할 때 유형별 선택 수
+LOCAL_SELECTION_SIZES = {"news": 3, "regular": 2, "revision": 3}
+# 질의와 겹치는 API 설명이 없을 때 확인할 기본 API 키 (배당, 자기주식, 최대주주)
+DEFAULT_API_KEYS = ["api_02", "api_03", "api_04"]
+# 문서 선택 1순위/헤지 모델 (캐시 키는 두 모델 모두 포함), 프롬프트/후처리를 바꾸면 버전을 올려 이전 캐시 응답을 쓰지 않게 함
+SELECT_MODEL = "gemini-2.0-flash"
+SELECT_FALLBACK_MODEL = "claude-3-5-haiku-latest"
+SELECT_PROMPT_VERSION = 1
+# 지연 예산 수준별 뉴스 검색량 (display, 최대 키워드 수)
+NEWS_SEARCH_LIMITS = {FULL: (20, None), REDUCED: (10, 2), MINIMAL: (5, 1)}
+# 뉴스 정렬 (sim: 유사도순, date: 날짜순 — date 면 검색어별 누적 뉴스 저장소에서 새 기사만 받아 옴)
+NEWS_SEARCH_SORT = os.getenv("NEWS_SEARCH_SORT", "sim")
+# 증분 모드에서 출판물 검색을 기다리는 최대 시간 (검색 시작 시점부터, 초)
+PUBLICATION_DEADLINE_SECONDS = float(os.getenv("PUBLICATION_DEADLINE_SECONDS", "8"))
+
+# 증분 모드에서 실행 중인 출판물 검색 (작업 id → (Future, 시작 시각))
+# Future 는 state(체크포인트)에 넣을 수 없어 프로세스에 보관하고 state 에는 id 만 저장
+_publication_jobs = {}
+_publication_jobs_lock = threading.Lock()
+_publication_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="pub-search")
+
+
+def submit_publication_search(query: str, dart_type: str = "both") -> str:
+    """출판물 검색(1단계, 메타데이터 전용)을 백그라운드로 시작하고 작업 id 반환"""
+    job_id = uuid.uuid4().hex
+    future = _publication_executor.submit(search_publications, query, dart_type, metadata_only=True)
+    with _publication_jobs_lock:
+        _publication_jobs[job_id] = (future, time.monotonic())
+    return job_id
+
+
+def publication_dart_type(state: SearchState, degradations: list) -> str:
+    """지연 예산이 빠듯하면 정정보고서 검색 생략"""
+    if budget_level(state, "search") == FULL:
+        return "both"
+    degradations.append("정정보고서 검색 생략")
+    return "regular"
+
+
+def job_elapsed(job_id: str) -> float:
+    """작업 시작 후 경과 시간 (초, 없는 작업이면 0)"""
+    with _publication_jobs_lock:
+        job = _publication_jobs.get(job_id)
+    return time.monotonic() - job[1] if job else 0.0
+
+
+def wait_publication_search(job_id: str, deadline: float):
+    """시작 후 deadline 초까지 결과를 기다림 (넘기면 concurrent.futures.TimeoutError)
+
+    작업은 기다림 여부와 관계없이 목록에서 제거합니다. 늦게 끝난 검색도 출판물 캐시에는 저장됩니다.
+    """
+    with _publication_jobs_lock:
+        job = _publication_jobs.pop(job_id, None)
+    if job is None:
+        # 다른 프로세스에서 재개된 체크포인트 등
+        raise LookupError(f"unknown publication job {job_id}")
+    future, started = job
+    return future.result(timeout=max(deadline - (time.monotonic() - started), 0))
+
+
 class SearchNodes:
     """검색 노드 클래스"""
 
@@ -27,6 +104,11 @@ class SearchNodes:
             state["news_errors"] = []
         if not state.get("pub_errors"):
             state["pub_errors"] = []
+        if not state.get("degradations"):
+            state["degradations"] = []
+
+        # 지연 예산(latency_budget)이 있으면 마감 시각 설정
+        start_budget(state)
 
         return state
 
@@ -36,6 +118,7 @@ class SearchNodes:
         print(f"[DEBUG] Search preference: {state['search_preference']}")
         print(f"[DEBUG] Query: {state['query']}")
 
+        degradations = []
         if state["search_preference"] in ["news", "both"]:
             if not self.news_searcher:
                 print(f"[DEBUG] News searcher not available")
@@ -44,13 +127,19 @@ class SearchNodes:
             else:
                 try:
                     print(f"[DEBUG] Calling news searcher...")
+                    level = budget_level(state, "search")
+                    display, max_keywords = NEWS_SEARCH_LIMITS[level]
+                    if level != FULL:
+                        degradations.append(f"뉴스 검색 축소 (기사 {display}건, 키워드 {max_keywords or '전체'}개)")
                     results = self.news_searcher.search_query(
                         state["query"],
-                        display=20,
-                        sort="sim"
+                        display=display,
+                        sort=NEWS_SEARCH_SORT,
+                        max_keywords=max_keywords
                     )
                     print(f"[DEBUG] News search completed successfully")
-                    state["news_results"] = results
+                    # state 에는 핸들만 저장 (체크포인트 크기를 검색량과 무관하게 유지)
+                    state["news_results"] = put_blob(results)
                 except Exception as e:
                     error_msg = f"News search failed: {e}"
                     print(f"[DEBUG] {error_msg}")
@@ -62,7 +151,8 @@ class SearchNodes:
         # 부분 state 반환 (reducer가 병합 처리)
         return {
             "news_results": state["news_results"],
-            "news_errors": state["news_errors"]
+            "news_errors": state["news_errors"],
+            "degradations": degradations
         }
 
     def search_publications(self, state: SearchState) -> SearchState:
@@ -71,12 +161,26 @@ class SearchNodes:
         print(f"[DEBUG] Search preference: {state['search_preference']}")
         print(f"[DEBUG] Query: {state['query']}")
 
+        degradations = []
         if state["search_preference"] in ["publications", "both"]:
             try:
                 print(f"[DEBUG] Calling search_publications function...")
-                results = search_publications(state["query"], "both")
+                dart_type = publication_dart_type(state, degradations)
+                limit = wait_limit(state, "search")
+                # 1단계: 메타데이터만 (API 데이터는 문서 선택 후 generate_response 에서 로드)
+                if limit is None:
+                    results = search_publications(state["query"], dart_type, metadata_only=True)
+                else:
+                    # 지연 예산이 있으면 이후 단계 몫을 남기고 그때까지만 기다림
+                    results = wait_publication_search(submit_publication_search(state["query"], dart_type), limit)
                 print(f"[DEBUG] Publication search results: {type(results)}")
-                state["publication_results"] = results
+                state["publication_results"] = put_blob(results) if results is not None else None
+            except concurrent.futures.TimeoutError:
+                error_msg = f"Publication search exceeded latency budget ({limit:.1f}s)"
+                print(f"[DEBUG] {error_msg}")
+                state["pub_errors"].append(error_msg)
+                degradations.append("출판물 검색 시간 초과로 제외")
+                state["publication_results"] = None
             except Exception as e:
                 error_msg = f"Publication search failed: {e}"
                 print(f"[DEBUG] {error_msg}")
@@ -88,52 +192,149 @@ class SearchNodes:
         # 부분 state 반환 (reducer가 병합 처리)
         return {
             "publication_results": state["publication_results"],
-            "pub_errors": state["pub_errors"]
+            "pub_errors": state["pub_errors"],
+            "degradations": degradations
         }
 
 
 
     def format_results(self, state: SearchState) -> SearchState:
-        """검색 결과를 정리하여 searched_list 생성"""
+        """검색 결과를 정리하여 searched_list 생성
+
+        뉴스 본문, API 데이터 같은 큰 값은 블롭 저장소에 넣고 핸들만 searched_list 에 남깁니다.
+        """
+        news_results = resolve_blob(state.get("news_results"))
+        publication_results = resolve_blob(state.get("publication_results"))
+
+        regular_list, revision_list = self._format_publications(publication_results)
+
+        # searched_list 생성 (문서별 안정적인 id 부여, id/키 해시 색인 생성)
+        state["searched_list"] = {
+            "news": self._format_news(news_results),
+            "regular": regular_list,
+            "revision": revision_list
+        }
+        assign_ids(state["searched_list"])
+        state["document_index"] = build_document_index(state["searched_list"])
+        state["search_summary"] = self._summarize(state)
+
+        # 메모리 절약을 위해 원본 큰 데이터 삭제 (searched_list에 필요한 정보는 이미 저장됨)
+        state["news_results"] = None
+        state["publication_results"] = None
+
+        print(f"[DEBUG] Final formatted output:\n{state['search_summary']}")
+        return state
+
+    def start_publications(self, state: SearchState) -> SearchState:
+        """증분 모드: 출판물 검색을 백그라운드로 시작하고 작업 id 만 state 에 저장"""
+        state["publication_job"] = None
+        if state["search_preference"] in ["publications", "both"]:
+            dart_type = publication_dart_type(state, state["degradations"])
+            state["publication_job"] = submit_publication_search(state["query"], dart_type)
+            print(f"[DEBUG] Publication search started in background: {state['publication_job']}")
+        return state
+
+    def format_news(self, state: SearchState) -> SearchState:
+        """증분 모드: 뉴스 결과만 먼저 searched_list 로 정리 (출판물은 merge_publications 에서 추가)"""
+        state["searched_list"] = {
+            "news": self._format_news(resolve_blob(state.get("news_results"))),
+            "regular": [],
+            "revision": []
+        }
+        assign_ids(state["searched_list"])
+        state["document_index"] = build_document_index(state["searched_list"])
+        state["search_summary"] = self._summarize(state)
+        state["news_results"] = None
+        return state
+
+    def merge_publications(self, state: SearchState) -> SearchState:
+        """증분 모드: 백그라운드 출판물 검색을 마감 시간까지 기다렸다가 searched_list 에 병합
+
+        마감 시간을 넘기면 출판물 없이(뉴스만으로) 진행하고, 늦게 끝난 결과는 출판물 캐시에만 반영됩니다.
+        """
+        job_id = state.get("publication_job")
+        if not job_id:
+            return state
+
+        deadline = state.get("publication_deadline") or PUBLICATION_DEADLINE_SECONDS
+        limit = wait_limit(state, "search")
+        try:
+            # 지연 예산이 더 빠듯하면 그 안에서만 기다림 (작업 시작 시점 기준 마감으로 환산)
+            wait = deadline if limit is None else min(deadline, limit + job_elapsed(job_id))
+            publication_results = wait_publication_search(job_id, wait)
+        except concurrent.futures.TimeoutError:
+            error_msg = f"Publication search exceeded deadline ({wait:.1f}s), answering with news only"
+            print(f"[DEBUG] {error_msg}")
+            state["pub_errors"].append(error_msg)
+            state["degradations"].append("출판물 검색 시간 초과로 제외")
+            publication_results = None
+        except Exception as e:
+            error_msg = f"Publication search failed: {e}"
+            print(f"[DEBUG] {error_msg}")
+            state["pub_errors"].append(error_msg)
+            publication_results = None
+
+        regular_list, revision_list = self._format_publications(publication_results)
+        searched_list = dict(state.get("searched_list") or {"news": []})
+        searched_list["regular"] = regular_list
+        searched_list["revision"] = revision_list
+        assign_ids({"regular": regular_list, "revision": revision_list})
+        state["searched_list"] = searched_list
+        state["document_index"] = build_document_index(searched_list)
+        state["search_summary"] = self._summarize(state)
+        state["publication_job"] = None
+
+        print(f"[DEBUG] Merged publications:\n{state['search_summary']}")
+        return state
 
-        # 뉴스 리스트 생성
+    @staticmethod
+    def _format_news(news_results) -> list:
+        """뉴스 검색 응답 → 뉴스 문서 리스트 (본문은 블롭 핸들)"""
         news_list = []
-        if state.get("news_results") and "items" in state["news_results"]:
-            for item in state["news_results"]["items"]:
+        if news_results and "items" in news_results:
+            for item in news_results["items"]:
                 news_list.append({
                     "title": item["title"],
                     "date": item["formatted_date"],
                     "link": item["link"],
-                    "description": item["description"]
+                    "description": put_blob(item["description"]),  # 본문 핸들
+                    "outlet_count": item.get("outlet_count", 1)
                 })
+        return news_list
 
+    @staticmethod
+    def _format_publications(publication_results):
+        """출판물 검색 응답 → (정기보고서 리스트, 정정보고서 리스트)"""
         # 정기보고서 리스트 생성
         regular_list = []
-        if state.get("publication_results") and "regular_results" in state["publication_results"]:
-            regular_results = state["publication_results"]["regular_results"]
+        if publication_results and "regular_results" in publication_results:
+            regular_results = publication_results["regular_results"]
             if "available_reports" in regular_results:
                 for report in regular_results["available_reports"]:
                     if "processed_data" in report:
-                        # LLM 선택용 데이터 (메타데이터만)
-                        llm_data = {
+                        # 메타데이터만 저장 (API 데이터는 선택된 키만 generate_response 에서 로드)
+                        api_data = report["processed_data"].get("api_data") or {}
+                        report_data = {
                             "year": report.get("year"),
                             "quarter": report.get("quarter"),
                             "company_name": report.get("company_name"),
                             "filename": report.get("filename"),
+                            "is_target": report.get("is_target", False),
                             "metadata": report["processed_data"].get("metadata", {}),
-                            "api_keys": list(report["processed_data"].get("api_data", {}).keys())
+                            "api_keys": list(api_data.keys())
                         }
 
-                        # 실제 API 데이터도 저장 (generate_response에서 사용)
-                        full_data = llm_data.copy()
-                        full_data["api_data"] = report["processed_data"].get("api_data", {})
+                        # 서비스가 값까지 보낸 경우 이미 받은 값은 재요청하지 않도록 보관
+                        loaded_api_data = {key: value for key, value in api_data.items() if value is not None}
+                        if loaded_api_data:
+                            report_data["api_data"] = put_blob(loaded_api_data)
 
-                        regular_list.append(full_data)
+                        regular_list.append(report_data)
 
         # 정정보고서 리스트 생성
         revision_list = []
-        if state.get("publication_results") and "revision_results" in state["publication_results"]:
-            revision_results = state["publication_results"]["revision_results"]
+        if publication_results and "revision_results" in publication_results:
+            revision_results = publication_results["revision_results"]
             if "revision_documents" in revision_results:
                 for doc in revision_results["revision_documents"]:
                     revision_list.append({
@@ -142,30 +343,28 @@ class SearchNodes:
                         "index": doc.get("index")
                     })
 
-        # searched_list 생성
-        state["searched_list"] = {
-            "news": news_list,
-            "regular": regular_list,
-            "revision": revision_list
-        }
+        return regular_list, revision_list
 
-        # 요약 정보 생성
-        news_count = len(news_list)
-        regular_count = len(regular_list)
-        revision_count = len(revision_list)
+    @staticmethod
+    def _summarize(state: SearchState) -> str:
+        """검색 결과 요약 텍스트"""
+        searched_list = state["searched_list"]
+        news_list = searched_list.get("news", [])
+        regular_list = searched_list.get("regular", [])
+        revision_list = searched_list.get("revision", [])
 
         all_errors = state.get("news_errors", []) + state.get("pub_errors", [])
 
         output = f"=== 검색 결과 요약: '{state['query']}' ===\n"
-        output += f"📰 뉴스: {news_count}건\n"
+        output += f"📰 뉴스: {len(news_list)}건\n"
         output += f"   뉴스 제목:\n"
         for news in news_list:
             output += f"   - {news['title']} ({news['date']})\n"
-        output += f"📊 정기보고서: {regular_count}건\n"
+        output += f"📊 정기보고서: {len(regular_list)}건\n"
         output += f"   회사명:\n"
         for report in regular_list:
             output += f"   - {report['company_name']} ({report['year']}년 {report['quarter']}분기)\n"
-        output += f"🔄 정정보고서: {revision_count}건\n"
+        output += f"🔄 정정보고서: {len(revision_list)}건\n"
         output += f"   문서 인덱스:\n"
         for doc in revision_list:
             output += f"   - {doc['basic_info']['date']} {doc['basic_info']['report_name']}\n"
@@ -175,14 +374,7 @@ class SearchNodes:
             for error in all_errors:
                 output += f"- {error}\n"
 
-        state["search_summary"] = output
-
-        # 메모리 절약을 위해 원본 큰 데이터 삭제 (searched_list에 필요한 정보는 이미 저장됨)
-        state["news_results"] = None
-        state["publication_results"] = None
-
-        print(f"[DEBUG] Final formatted output:\n{output}")
-        return state
+        return output
 
 
 class DocumentNodes:
@@ -220,17 +412,133 @@ class DocumentNodes:
             "api_27": "공모자금의 사용내역",
             "api_28": "사모자금의 사용내역"
         }
+        # 문서 선택: Gemini 우선, p95 안에 응답이 없거나 실패하면 Claude 에도 요청 (클라이언트는 처음 사용할 때 생성)
+        self.hedged = HedgedLLM("select_documents", [
+            ("gemini", SELECT_MODEL, lambda: ChatGoogleGenerativeAI(
+                model=SELECT_MODEL,
+                temperature=0,
+                timeout=get_resilient_client("gemini").read_timeout,
+                max_retries=0
+            )),
+            ("anthropic", SELECT_FALLBACK_MODEL, lambda: ChatAnthropic(
+                model=SELECT_FALLBACK_MODEL,
+                temperature=0,
+                timeout=get_resilient_client("anthropic").read_timeout,
+                max_retries=0
+            )),
+        ])
+
+    def _shortlist(self, query: str, searched_list: Dict) -> Dict[str, list]:
+        """로컬 점수(어휘 관련도/최신성/출처 등급)로 유형별 후보를 상위 몇 건으로 축소"""
+        # 뉴스 본문 핸들을 풀어 점수 계산/LLM 입력에 사용
+        documents = dict(searched_list, news=[
+            dict(doc, description=resolve_blob(doc.get("description"), ""))
+            for doc in searched_list.get("news", [])
+        ])
+
+        shortlist = {}
+        for doc_type, size in SHORTLIST_SIZES.items():
+            scored = score_documents(query, doc_type, documents.get(doc_type, []))
+            shortlist[doc_type] = scored[:size]
+        return shortlist
+
+    def _select_locally(self, query: str, shortlist: Dict[str, list], summary_prefix: str = "로컬 선택") -> Dict:
+        """LLM 없이 로컬 점수 상위 문서를 선택 (LLM 선택과 같은 형식)"""
+        selected = {"news": [], "regular": [], "revision": []}
+
+        for priority, (doc, score) in enumerate(shortlist.get("news", [])[:LOCAL_SELECTION_SIZES["news"]], 1):
+            selected["news"].append({
+                "id": doc["id"],
+                "title": doc["title"],
+                "date": doc["date"],
+                "link": doc["link"],
+                "reason": f"로컬 관련도 점수 {score}",
+                "priority": priority
+            })
+
+        api_keys = select_api_keys(query, self.api_descriptions, default=DEFAULT_API_KEYS)
+        for priority, (doc, score) in enumerate(shortlist.get("regular", [])[:LOCAL_SELECTION_SIZES["regular"]], 1):
+            selected["regular"].append({
+                "id": doc["id"],
+                "company_name": doc.get("company_name"),
+                "year": doc.get("year"),
+                "quarter": doc.get("quarter"),
+                "filename": doc.get("filename"),
+                "api_keys_to_check": api_keys,
+                "reason": f"로컬 관련도 점수 {score}",
+                "priority": priority
+            })
+
+        for priority, (doc, score) in enumerate(shortlist.get("revision", [])[:LOCAL_SELECTION_SIZES["revision"]], 1):
+            selected["revision"].append({
+                "id": doc["id"],
+                "basic_info": doc.get("basic_info", {}),
+                "reason": f"로컬 관련도 점수 {score}",
+                "priority": priority
+            })
+
+        selected["selection_summary"] = (
+            f"{summary_prefix}: 뉴스 {len(selected['news'])}건, "
+            f"정기보고서 {len(selected['regular'])}건, 정정보고서 {len(selected['revision'])}건"
+        )
+        return selected
 
     def select_documents(self, state: SearchState) -> SearchState:
-        """LLM을 사용하여 관련성 높은 문서들을 선택"""
+        """로컬 점수로 후보를 줄인 뒤 LLM을 사용하여 관련성 높은 문서들을 선택
 
-        try:
-            # gemini LLM 초기화
-            llm = ChatGoogleGenerativeAI(
-                model="gemini-2.0-flash",
-                temperature=0
-            )
+        state["selection_mode"] 가 "local" 이면 LLM 호출 없이 로컬 점수만으로 선택합니다.
+        """
+        state["selected_documents"] = self._select_documents(
+            state["query"], state.get("searched_list") or {}, self._selection_mode(state)
+        )
+        return state
+
+    def select_news(self, state: SearchState) -> SearchState:
+        """증분 모드: 출판물 검색이 끝나기 전에 뉴스만으로 먼저 선택"""
+        searched_list = state.get("searched_list") or {}
+        state["selected_documents"] = self._select_documents(
+            state["query"], {"news": searched_list.get("news", [])}, self._selection_mode(state)
+        )
+        return state
+
+    def select_publications(self, state: SearchState) -> SearchState:
+        """증분 모드: 병합된 출판물 문서를 선택해 뉴스 선택 결과에 합침"""
+        searched_list = state.get("searched_list") or {}
+        publications = {doc_type: searched_list.get(doc_type, []) for doc_type in ("regular", "revision")}
+        selected = dict(state.get("selected_documents") or {"news": []})
+        if not any(publications.values()):
+            return state
+
+        publication_selection = self._select_documents(state["query"], publications, self._selection_mode(state))
+        for doc_type in publications:
+            selected[doc_type] = publication_selection.get(doc_type, [])
+        selected["selection_summary"] = " / ".join(
+            summary for summary in (selected.get("selection_summary"), publication_selection.get("selection_summary"))
+            if summary
+        )
+        state["selected_documents"] = selected
+        return state
+
+    @staticmethod
+    def _selection_mode(state: SearchState) -> str:
+        """지연 예산이 빠듯하면 LLM 선택 대신 로컬 선택"""
+        if state.get("selection_mode") == "local" or budget_level(state, "select") == FULL:
+            return state.get("selection_mode")
+        degradation = "문서 선택을 로컬 점수로 대체"
+        if degradation not in state.setdefault("degradations", []):
+            state["degradations"].append(degradation)
+        return "local"
+
+    def _select_documents(self, query: str, searched_list: Dict, selection_mode: str = None) -> Dict:
+        """searched_list 에 있는 유형의 문서 중에서 선택 (선택 결과 반환)"""
+        shortlist = self._shortlist(query, searched_list)
+
+        if selection_mode == "local":
+            selected_documents = self._select_locally(query, shortlist)
+            print(f"[DEBUG] Documents selected locally: {selected_documents['selection_summary']}")
+            return selected_documents
 
+        try:
             # 시스템 프롬프트
             system_prompt = """당신은 검색된 문서들 중에서 사용자 쿼리에 가장 관련성이 높은 문서들을 선택하는 AI 어시스턴트입니다.
 
@@ -250,27 +558,24 @@ class DocumentNodes:
             # API 키 설명 텍스트 생성
             api_desc_text = "\n".join([f"- {key}: {desc}" for key, desc in self.api_descriptions.items()])
 
-            # searched_list에서 API 데이터 제외한 버전 생성 (LLM 입력용)
-            searched_list_for_llm = {}
-            if "news" in state['searched_list']:
-                searched_list_for_llm["news"] = state['searched_list']["news"]
-
-            if "regular" in state['searched_list']:
-                searched_list_for_llm["regular"] = []
-                for report in state['searched_list']["regular"]:
-                    llm_report = {k: v for k, v in report.items() if k != "api_data"}
-                    searched_list_for_llm["regular"].append(llm_report)
-
-            if "revision" in state['searched_list']:
-                searched_list_for_llm["revision"] = state['searched_list']["revision"]
+            # 로컬 점수 상위 후보만 LLM 입력으로 사용 (API 데이터 제외)
+            searched_list_for_llm = {
+                "news": [doc for doc, _ in shortlist.get("news", [])],
+                "regular": [
+                    {k: v for k, v in doc.items() if k != "api_data"}
+                    for doc, _ in shortlist.get("regular", [])
+                ],
+                "revision": [doc for doc, _ in shortlist.get("revision", [])]
+            }
 
             # 사용자 프롬프트
-            user_prompt = f"""사용자 쿼리: "{state['query']}"
+            user_prompt = f"""사용자 쿼리: "{query}"
 
 검색된 문서 목록:
-{json.dumps(searched_list_for_llm, ensure_ascii=False, indent=2)}
+{json.dumps(searched_list_for_llm, ensure_ascii=False, separators=(",", ":"))}
 
 위 문서들 중에서 사용자 쿼리에 가장 관련성이 높은 문서들을 선택하고, 선택 이유와 우선순위를 포함하여 JSON 형태로 응답해주세요.
+선택한 문서는 반드시 문서 목록의 "id" 값을 그대로 포함하세요.
 
 정기보고서의 경우 관련성이 높은 API 키들만 선별해서 포함해주세요.
 API 키 설명:
@@ -280,6 +585,7 @@ API 키 설명:
 {{
     "news": [
         {{
+            "id": "N-1a2b3c4d",
             "title": "선택된 뉴스 제목",
             "date": "2024-10-09",
             "link": "...",
@@ -289,6 +595,7 @@ API 키 설명:
     ],
     "regular": [
         {{
+            "id": "R-2025Q2",
             "company_name": "회사명",
             "year": 2025,
             "quarter": 2,
@@ -300,7 +607,7 @@ API 키 설명:
     ],
     "revision": [
         {{
-            "basic_info": {{}},
+            "id": "V-20251001800707",
             "reason": "선택 이유",
             "priority": 2
         }}
@@ -314,82 +621,211 @@ API 키 설명:
                 {"role": "user", "content": user_prompt}
             ]
 
-            response = llm.invoke(messages)
-            response_text = response.content
+            def select_with_llm():
+                response_text = self.hedged.invoke(lambda llm: llm.invoke(messages)).content
 
-            # JSON 파싱 시도
-            try:
                 # JSON 추출 (```json 블록이 있을 경우)
                 if "```json" in response_text:
                     start = response_text.find("```json") + 7
                     end = response_text.find("```", start)
                     response_text = response_text[start:end].strip()
 
-                selected_documents = json.loads(response_text)
-                state["selected_documents"] = selected_documents
+                try:
+                    return json.loads(response_text)
+                except json.JSONDecodeError:
+                    print(f"[DEBUG] Raw response: {response_text}")
+                    raise
 
+            # 같은 후보 목록/질의면 캐시된 선택 결과 사용 (파싱에 실패한 응답은 저장하지 않음)
+            try:
+                selected_documents = get_llm_cache().cached(
+                    "select_documents", self.hedged.cache_model, 0, messages, select_with_llm, version=SELECT_PROMPT_VERSION
+                )
                 print(f"[DEBUG] Documents selected by LLM: {json.dumps(selected_documents, ensure_ascii=False, indent=2)}")
+                return selected_documents
 
             except json.JSONDecodeError as e:
                 print(f"[DEBUG] JSON parsing failed: {e}")
-                print(f"[DEBUG] Raw response: {response_text}")
-                # 실패 시 기본값 설정
-                state["selected_documents"] = {
-                    "news": [],
-                    "regular": [],
-                    "revision": [],
-                    "selection_summary": "문서 선택 중 오류 발생"
-                }
+                # 실패 시 로컬 선택으로 대체
+                return self._select_locally(query, shortlist, "LLM 응답 파싱 실패로 로컬 선택")
 
+        except CircuitOpenError as e:
+            print(f"[DEBUG] Document selection skipped: {e}")
+            # Gemini 장애 중에는 기다리지 않고 로컬 선택
+            return self._select_locally(query, shortlist, "LLM 사용 불가로 로컬 선택")
         except Exception as e:
             print(f"[DEBUG] Document selection failed: {e}")
-            # 실패 시 기본값 설정
-            state["selected_documents"] = {
-                "news": [],
-                "regular": [],
-                "revision": [],
-                "selection_summary": "문서 선택 중 오류 발생"
-            }
+            # 실패 시 로컬 선택으로 대체
+            return self._select_locally(query, shortlist, "LLM 선택 실패로 로컬 선택")
 
-        return state
+
+class GenerationTimer:
+    """스트리밍 답변 누적 및 지연 지표 (첫 청크, 첫 답변 토큰(TTFT), 전체 시간)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_chunk_ms = None
+        self.ttft_ms = None
+        self.chunks = 0
+        self.usage = None
+        self._parts = []
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+    def add(self, chunk) -> None:
+        """청크 누적 (thinking 단계 청크는 내용이 비어 있어 TTFT 에 포함하지 않음)"""
+        self.chunks += 1
+        if self.first_chunk_ms is None:
+            self.first_chunk_ms = self._elapsed_ms()
+        if getattr(chunk, "usage_metadata", None):
+            # 토큰 사용량은 보통 마지막 청크에 포함됨
+            self.usage = chunk.usage_metadata
+        content = chunk.content if isinstance(chunk.content, str) else "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part) for part in chunk.content
+        )
+        if content:
+            if self.ttft_ms is None:
+                self.ttft_ms = self._elapsed_ms()
+            self._parts.append(content)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def metrics(self) -> Dict:
+        return {
+            "ttft_ms": self.ttft_ms,
+            "first_chunk_ms": self.first_chunk_ms,
+            "total_ms": self._elapsed_ms(),
+            "chunks": self.chunks,
+            "answer_chars": len(self.text),
+        }
 
 
 class GenerationNodes:
     """선택된 문서들을 기반으로 최종 답변을 생성하는 클래스"""
 
     def __init__(self):
-        self.llm = ChatClovaX(
-            model="HCX-007",
-            thinking={"effort": "medium"}
+        self.llm_guard = get_resilient_client("clova")
+        # 난이도 단계별 생성 모델 (thinking 외에는 처음 사용할 때 생성)
+        self._llms = {THINKING: self._create_llm(THINKING)}
+
+    def _create_llm(self, tier: str):
+        model, effort = TIER_MODELS[tier]
+        options = {"thinking": {"effort": effort}} if effort else {}
+        return ChatClovaX(
+            model=model,
+            timeout=self.llm_guard.read_timeout,
+            max_retries=0,
+            **options
         )
 
-    def generate_response(self, state: SearchState) -> SearchState:
-        """선택된 문서들을 분석하여 최종 답변 생성"""
+    @property
+    def llm(self):
+        """어려운 질문용 HCX-007 thinking 모델"""
+        return self._llms[THINKING]
+
+    def _tier_llm(self, tier: str):
+        if tier not in self._llms:
+            self._llms[tier] = self._create_llm(tier)
+        return self._llms[tier]
+
+    def _llm_for(self, state: SearchState):
+        """난이도 단계와 지연 예산 수준에 맞는 생성 모델 (단계는 state["model_route"] 에 기록)"""
+        route = state.get("model_route") or {"tier": THINKING}
+        if route["tier"] == THINKING and budget_level(state, "generate") != FULL:
+            route["tier"] = STANDARD
+            state.setdefault("degradations", []).append("빠른 생성 설정 사용 (thinking 생략)")
+        state["model_route"] = route
+        print(f"[DEBUG] Generation tier: {route}")
+        return self._tier_llm(route["tier"])
+
+    def _finish_generation(self, state: SearchState, messages: list, timer: GenerationTimer) -> None:
+        """답변/지표 기록 및 단계별 지연/비용 집계"""
+        state["generated_response"] = timer.text + degradation_note(state.get("degradations"))
+        metrics = timer.metrics()
+        tier = state["model_route"]["tier"]
+        prompt = "".join(message["content"] for message in messages)
+        metrics.update(record_generation(tier, metrics["total_ms"], prompt, timer.text, timer.usage))
+        metrics["tier"] = tier
+        state["generation_metrics"] = metrics
+        print(f"[DEBUG] Generation metrics: {state['generation_metrics']}")
+
+    def generate_response(self, state: SearchState, config: RunnableConfig = None) -> SearchState:
+        """선택된 문서들을 분석하여 최종 답변 생성 (토큰 스트리밍, 동기 실행용)"""
 
         try:
-            selected_documents = state.get("selected_documents", {})
-            query = state.get("query", "")
-
-            if not selected_documents or not any(selected_documents.values()):
+            messages = self._prepare_messages(state)
+            if messages is None:
                 state["generated_response"] = "선택된 문서가 없어 답변을 생성할 수 없습니다."
                 return state
 
-            # 선택된 문서들의 내용 로딩
-            document_contents = self._load_document_contents(selected_documents, state)
+            timer = GenerationTimer()
+            llm = self._llm_for(state)
+            for chunk in self.llm_guard.stream(llm.stream, messages, config=config):
+                timer.add(chunk)
+            self._finish_generation(state, messages, timer)
 
-            # LLM을 사용하여 최종 답변 생성
-            response = self._generate_final_answer(query, document_contents, selected_documents)
+        except Exception as e:
+            state["generated_response"] = self._failure_message(e)
+
+        return state
+
+    async def agenerate_response(self, state: SearchState, config: RunnableConfig = None) -> SearchState:
+        """선택된 문서들을 분석하여 최종 답변 생성 (astream 토큰 스트리밍)
+
+        LangGraph stream_mode="messages" 로 실행하면 생성되는 토큰이 바로 클라이언트에 전달됩니다.
+        """
+
+        try:
+            # 문서 로딩은 2단계 API 데이터 조회(네트워크)가 있을 수 있어 스레드에서 실행
+            messages = await asyncio.to_thread(self._prepare_messages, state)
+            if messages is None:
+                state["generated_response"] = "선택된 문서가 없어 답변을 생성할 수 없습니다."
+                return state
 
-            state["generated_response"] = response
+            timer = GenerationTimer()
+            llm = self._llm_for(state)
+            async for chunk in self.llm_guard.astream(llm.astream, messages, config=config):
+                timer.add(chunk)
+            self._finish_generation(state, messages, timer)
 
         except Exception as e:
-            print(f"[DEBUG] Response generation failed: {e}")
-            state["generated_response"] = f"답변 생성 중 오류가 발생했습니다: {str(e)}"
+            state["generated_response"] = self._failure_message(e)
 
         return state
 
+    def _prepare_messages(self, state: SearchState):
+        """선택된 문서 내용을 불러와 LLM 메시지 생성 (선택된 문서가 없으면 None)"""
+        selected_documents = state.get("selected_documents", {})
+        query = state.get("query", "")
+
+        if not selected_documents or not any(selected_documents.values()):
+            return None
+
+        if budget_level(state, "generate") == MINIMAL and selected_documents.get("revision"):
+            # 예산이 거의 없으면 정정보고서는 답변 입력에서 제외
+            selected_documents = dict(selected_documents, revision=[])
+            state.setdefault("degradations", []).append("정정보고서 분석 생략")
+
+        # 선택된 문서들의 내용 로딩
+        document_contents = self._load_document_contents(selected_documents, state)
+        # 문서 수/유형, 뉴스 간 일치도, 질문 유형으로 생성 모델 단계 결정
+        state["model_route"] = route_generation(query, document_contents)
+        return self._build_messages(query, document_contents)
+
+    @staticmethod
+    def _failure_message(error: Exception) -> str:
+        """답변 생성 실패 시 사용자에게 보여줄 문구"""
+        if isinstance(error, CircuitOpenError):
+            print(f"[DEBUG] LLM unavailable: {error}")
+            return f"답변 생성 모델을 일시적으로 사용할 수 없습니다. 잠시 후 다시 시도해주세요. ({error})"
+        print(f"[DEBUG] Response generation failed: {error}")
+        return f"답변 생성 중 오류가 발생했습니다: {str(error)}"
+
     def _load_document_contents(self, selected_documents: dict, state: SearchState) -> dict:
-        """선택된 문서들의 실제 내용을 searched_list에서 추출"""
+        """선택된 문서들의 실제 내용을 searched_list에서 추출 (id 색인으로 문서당 O(1) 조회)"""
 
         contents = {
             "news": [],
@@ -397,73 +833,104 @@ class GenerationNodes:
             "revision": []
         }
 
-        searched_list = state.get("searched_list", {})
+        searched_list = state.get("searched_list") or {}
+        index = state.get("document_index") or build_document_index(searched_list)
 
         # 뉴스 내용 로딩 (searched_list에서 실제 내용 추출)
         for news_doc in selected_documents.get("news", []):
-            # searched_list에서 해당 뉴스 찾기
-            for news_item in searched_list.get("news", []):
-                if news_item["title"] == news_doc["title"]:
-                    contents["news"].append({
-                        "title": news_item["title"],
-                        "date": news_item["date"],
-                        "description": news_item["description"],  # 실제 뉴스 전체 내용
-                        "link": news_item["link"],
-                        "reason": news_doc.get("reason", ""),
-                        "priority": news_doc.get("priority", 1)
-                    })
-                    break
-
-        # 정기보고서 내용 로딩 (searched_list에서 실제 API 데이터 추출)
+            news_item = resolve_document(searched_list, index, "news", news_doc)
+            if news_item is None:
+                continue
+            contents["news"].append({
+                "id": news_item["id"],
+                "title": news_item["title"],
+                "date": news_item["date"],
+                "description": resolve_blob(news_item["description"], ""),  # 실제 뉴스 전체 내용
+                "link": news_item["link"],
+                "reason": news_doc.get("reason", ""),
+                "priority": news_doc.get("priority", 1)
+            })
+
+        # 정기보고서 내용 로딩 (2단계: 선택된 보고서/API 키 중 아직 없는 값만 출판물 서비스에서 로드)
+        fetched_api_data = self._fetch_selected_api_data(selected_documents, state, index)
         for reg_doc in selected_documents.get("regular", []):
-            # searched_list에서 해당 정기보고서 찾기
-            for report_item in searched_list.get("regular", []):
-                if (report_item["company_name"] == reg_doc["company_name"] and
-                    report_item["year"] == reg_doc["year"] and
-                    report_item["quarter"] == reg_doc["quarter"]):
-
-                    # 선택된 API 키들에 해당하는 데이터만 추출
-                    selected_api_data = {}
-                    api_keys_to_check = reg_doc.get("api_keys_to_check", [])
-
-                    # searched_list에 api_data가 있다면 사용
-                    if "api_data" in report_item:
-                        for api_key in api_keys_to_check:
-                            if api_key in report_item["api_data"]:
-                                selected_api_data[api_key] = report_item["api_data"][api_key]
-
-                    contents["regular"].append({
-                        "company_name": reg_doc["company_name"],
-                        "year": reg_doc["year"],
-                        "quarter": reg_doc["quarter"],
-                        "filename": reg_doc["filename"],
-                        "api_keys_to_check": api_keys_to_check,
-                        "api_data": selected_api_data,  # 실제 API 데이터
-                        "metadata": report_item.get("metadata", {}),
-                        "reason": reg_doc.get("reason", ""),
-                        "priority": reg_doc.get("priority", 1)
-                    })
-                    break
+            report_item = resolve_document(searched_list, index, "regular", reg_doc)
+            if report_item is None:
+                continue
+
+            # 선택된 API 키들에 해당하는 데이터만 추출
+            selected_api_data = {}
+            api_keys_to_check = reg_doc.get("api_keys_to_check", [])
+
+            # searched_list에 이미 있는 값, 없으면 2단계에서 로드한 값 사용
+            loaded = fetched_api_data.get((str(report_item["year"]), str(report_item["quarter"])), {})
+            stored_api_data = resolve_blob(report_item.get("api_data"), {})
+            for api_key in api_keys_to_check:
+                if api_key in stored_api_data:
+                    selected_api_data[api_key] = stored_api_data[api_key]
+                elif api_key in loaded:
+                    selected_api_data[api_key] = loaded[api_key]
+
+            contents["regular"].append({
+                "id": report_item["id"],
+                "company_name": report_item["company_name"],
+                "year": report_item["year"],
+                "quarter": report_item["quarter"],
+                "filename": report_item.get("filename"),
+                "api_keys_to_check": api_keys_to_check,
+                "api_data": selected_api_data,  # 실제 API 데이터
+                "metadata": report_item.get("metadata", {}),
+                "reason": reg_doc.get("reason", ""),
+                "priority": reg_doc.get("priority", 1)
+            })
 
         # 정정보고서 내용 로딩 (searched_list에서 실제 내용 추출)
         for rev_doc in selected_documents.get("revision", []):
-            # searched_list에서 해당 정정보고서 찾기
-            for revision_item in searched_list.get("revision", []):
-                if revision_item["basic_info"] == rev_doc["basic_info"]:
-                    contents["revision"].append({
-                        "basic_info": revision_item["basic_info"],
-                        "content_length": revision_item.get("content_length", 0),
-                        "index": revision_item.get("index"),
-                        "reason": rev_doc.get("reason", ""),
-                        "priority": rev_doc.get("priority", 1)
-                    })
-                    break
+            revision_item = resolve_document(searched_list, index, "revision", rev_doc)
+            if revision_item is None:
+                continue
+            contents["revision"].append({
+                "id": revision_item["id"],
+                "basic_info": revision_item["basic_info"],
+                "content_length": revision_item.get("content_length", 0),
+                "index": revision_item.get("index"),
+                "reason": rev_doc.get("reason", ""),
+                "priority": rev_doc.get("priority", 1)
+            })
 
         return contents
 
 
-    def _generate_final_answer(self, query: str, document_contents: dict, selected_documents: dict) -> str:
-        """LLM을 사용하여 최종 답변 생성"""
+    def _fetch_selected_api_data(self, selected_documents: dict, state: SearchState, index: dict = None) -> dict:
+        """선택된 정기보고서의 (보고서, API 키) 중 searched_list에 값이 없는 것만 한 번에 로드"""
+        searched_list = state.get("searched_list") or {}
+
+        selections = []
+        for reg_doc in selected_documents.get("regular", []):
+            report_item = resolve_document(searched_list, index, "regular", reg_doc)
+            if report_item is None:
+                continue
+            available = set(report_item.get("api_keys", []))
+            stored_api_data = resolve_blob(report_item.get("api_data"), {})
+            missing = [
+                api_key for api_key in reg_doc.get("api_keys_to_check", [])
+                if api_key not in stored_api_data and (not available or api_key in available)
+            ]
+            if missing:
+                selections.append({"year": report_item["year"], "quarter": report_item["quarter"], "api_keys": missing})
+
+        if not selections:
+            return {}
+
+        print(f"[DEBUG] Fetching selected API data: {selections}")
+        try:
+            return fetch_report_api_data(state.get("query", ""), selections)
+        except Exception as e:
+            print(f"[DEBUG] API data fetch failed: {e}")
+            return {}
+
+    def _build_messages(self, query: str, document_contents: dict) -> list:
+        """최종 답변 생성용 LLM 메시지"""
 
         # 시스템 프롬프트
         system_prompt = """당신은 금융 및 기업 정보 분석 전문가입니다.
@@ -496,19 +963,10 @@ class GenerationNodes:
 위 문서들을 바탕으로 사용자 질문에 대한 종합적이고 정확한 답변을 작성해주세요.
 """
 
-        try:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-
-            response = self.llm.invoke(messages)
-            print(f"[DEBUG] LLM response: {response.content}")
-            return response.content
-
-        except Exception as e:
-            print(f"[DEBUG] LLM response generation failed: {e}")
-            return f"답변 생성 중 오류가 발생했습니다: {str(e)}"
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
 
     def _format_documents_for_llm(self, document_contents: dict) -> str:
         """문서 내용을 LLM이 이해할 수 있는 형태로 포맷팅"""
@@ -540,16 +998,11 @@ class GenerationNodes:
 분석 API: {', '.join(report['api_keys_to_check'])}
 선택 이유: {report['reason']}
 
-API 데이터:
+API 데이터 (TSV, 빈 칸은 해당 없음):
 """
-
-
-
-
+                # 원본 표(마크다운/JSON 행)는 토큰이 많아 필요한 열만 한글 머리글 TSV 로 변환
                 for api_key, data in report.get("api_data", {}).items():
-                    if api_key == 'api_03':
-                        data = data.replace('change_qy_incnr','change_qy_dcrnr')
-                    formatted_text += f"  - {api_key}: {data}\n"
+                    formatted_text += f"  - {api_key}:\n{format_api_data(api_key, data)}\n"
 
         # 정정보고서 문서들
         if document_contents.get("revision"):
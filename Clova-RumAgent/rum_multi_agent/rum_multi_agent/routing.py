@@ -0,0 +1,186 @@
+"""
+난이도 기반 답변 생성 모델 라우팅
+선택된 문서 수/유형, 뉴스 간 일치도, 질문 유형으로 난이도를 계산해
+쉬운 질문은 빠른 모델, 보통은 HCX-007(thinking 생략), 어려운 질문만 HCX-007 thinking 으로 답변합니다.
+단계별(tier) 호출 수, 지연, 토큰, 추정 비용은 routing_stats() 로 확인합니다.
+"""
+import math
+import os
+import re
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+FAST = "fast"
+STANDARD = "standard"
+THINKING = "thinking"
+TIERS = [FAST, STANDARD, THINKING]
+
+ROUTING_ENABLED = os.getenv("ROUTING_ENABLED", "true").lower() == "true"
+# 단계별 모델 (모델명, thinking effort)
+TIER_MODELS = {
+    FAST: ("HCX-DASH-002", None),
+    STANDARD: ("HCX-007", "none"),
+    THINKING: ("HCX-007", "medium"),
+}
+# 난이도 점수 경계 (EASY 미만 fast, HARD 이상 thinking)
+EASY_MAX_SCORE = 0.35
+HARD_MIN_SCORE = 0.6
+# 신호 가중치 (문서 수/유형, 출처 간 불일치, 질문 유형)
+DOCUMENT_WEIGHT = 0.3
+DISAGREEMENT_WEIGHT = 0.35
+QUERY_WEIGHT = 0.35
+# 모델별 추정 단가 (USD / 1M 토큰, (입력, 출력)), 요금이 바뀌면 수정
+MODEL_COSTS = {
+    "HCX-DASH-002": (0.09, 0.36),
+    "HCX-007": (0.9, 3.6),
+}
+STATS_WINDOW = 200
+
+# 질문 유형 (인과/비교 > 사실 확인 > 전망/현황)
+_CAUSAL_RE = re.compile(r"왜|이유|원인|영향|때문|탓|덕분|비교|차이|관계|분석")
+_FACT_RE = re.compile(r"사실|진짜|정말|루머|맞아|맞나|했다는|했대|한대|확인")
+_OUTLOOK_RE = re.compile(r"어떻게 될|전망|오를까|내릴까|떨어질까|살까|팔까|주가|현황|얼마")
+# 출처 간 다툼을 나타내는 표현
+_CONFLICT_RE = re.compile(r"부인|사실무근|해명|반박|정정|의혹|논란|엇갈")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _bigrams(text: str) -> set:
+    compact = _NON_WORD_RE.sub("", str(text).lower())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _dice(a: set, b: set) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (한글 등 비ASCII 1자 ≈ 0.7토큰, ASCII 4자 ≈ 1토큰)"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return math.ceil((len(text) - ascii_chars) * 0.7 + ascii_chars / 4)
+
+
+def query_type(query: str) -> str:
+    """질문 유형 (causal / fact / outlook / other)"""
+    if _CAUSAL_RE.search(query):
+        return "causal"
+    if _FACT_RE.search(query):
+        return "fact"
+    if _OUTLOOK_RE.search(query):
+        return "outlook"
+    return "other"
+
+
+QUERY_TYPE_SCORES = {"causal": 1.0, "fact": 0.5, "other": 0.5, "outlook": 0.2}
+
+
+def _document_score(document_contents: Dict) -> float:
+    """문서 수와 유형 수 (여러 유형의 문서를 맞춰 봐야 할수록 어려움)"""
+    counts = {doc_type: len(docs) for doc_type, docs in document_contents.items() if docs}
+    total = sum(counts.values())
+    numeric = any(report.get("api_data") for report in document_contents.get("regular", []))
+    return min(total / 8, 1.0) * 0.5 + max(len(counts) - 1, 0) / 2 * 0.3 + (0.2 if numeric else 0.0)
+
+
+def _disagreement(news: List[Dict]) -> float:
+    """뉴스 간 불일치 (제목 bigram 유사도가 낮거나 부인/해명 표현이 있으면 높음)"""
+    if any(_CONFLICT_RE.search(f"{item.get('title', '')} {item.get('description', '')}") for item in news):
+        return 1.0
+    if len(news) < 2:
+        return 0.5
+    grams = [_bigrams(item.get("title", "")) for item in news]
+    pairs = [(i, j) for i in range(len(grams)) for j in range(i + 1, len(grams))]
+    similarity = sum(_dice(grams[i], grams[j]) for i, j in pairs) / len(pairs)
+    # 제목 유사도 0.4 이상이면 같은 내용을 보도한 것으로 보고 불일치 0
+    return max(0.0, 1.0 - similarity / 0.4)
+
+
+def route_generation(query: str, document_contents: Dict) -> Dict:
+    """답변 생성 단계(tier)와 난이도 신호"""
+    signals = {
+        "documents": round(_document_score(document_contents), 3),
+        "disagreement": round(_disagreement(document_contents.get("news", [])), 3),
+        "query_type": query_type(query),
+    }
+    score = (
+        DOCUMENT_WEIGHT * signals["documents"]
+        + DISAGREEMENT_WEIGHT * signals["disagreement"]
+        + QUERY_WEIGHT * QUERY_TYPE_SCORES[signals["query_type"]]
+    )
+    if not ROUTING_ENABLED or score >= HARD_MIN_SCORE:
+        tier = THINKING
+    elif score < EASY_MAX_SCORE:
+        tier = FAST
+    else:
+        tier = STANDARD
+    return {"tier": tier, "difficulty": round(score, 3), "signals": signals}
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """추정 비용 (USD)"""
+    input_price, output_price = MODEL_COSTS.get(model, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class TierStats:
+    """단계별 호출 수, 지연, 토큰, 추정 비용"""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self._lock = threading.Lock()
+        self._window = window
+        self._stats: Dict[str, Dict] = {}
+
+    def record(self, tier: str, latency_ms: float, input_tokens: int, output_tokens: int, cost: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(tier, {
+                "calls": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0,
+                "latencies": deque(maxlen=self._window),
+            })
+            stats["calls"] += 1
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+            stats["cost_usd"] += cost
+            stats["latencies"].append(latency_ms)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            stats = {tier: dict(values, latencies=sorted(values["latencies"])) for tier, values in self._stats.items()}
+        result = {}
+        for tier in TIERS:
+            if tier not in stats:
+                continue
+            values = stats[tier]
+            latencies = values.pop("latencies")
+            result[tier] = dict(
+                values,
+                model=TIER_MODELS[tier][0],
+                cost_usd=round(values["cost_usd"], 6),
+                avg_cost_usd=round(values["cost_usd"] / values["calls"], 6),
+                p50_ms=latencies[min(int(len(latencies) * 0.5), len(latencies) - 1)],
+                p95_ms=latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)],
+            )
+        return result
+
+
+tier_stats = TierStats()
+
+
+def record_generation(tier: str, latency_ms: float, prompt: str, answer: str, usage: Optional[Dict] = None) -> Dict:
+    """생성 1회 기록 (모델 usage 가 없으면 문자 수로 토큰 추정), 기록한 토큰/비용 반환"""
+    model = TIER_MODELS[tier][0]
+    if usage:
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+    else:
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(answer)
+    cost = estimate_cost(model, input_tokens, output_tokens)
+    tier_stats.record(tier, latency_ms, input_tokens, output_tokens, cost)
+    return {"model": model, "input_tokens": input_tokens, "output_tokens": output_tokens, "estimated_cost_usd": round(cost, 6)}
+
+
+def routing_stats() -> Dict[str, Dict]:
+    """단계별 호출 수, 지연(p50/p95), 토큰, 추정 비용"""
+    return tier_stats.snapshot()
@@ -0,0 +1,127 @@
+"""
+문서 후보 로컬 점수 계산
+LLM 호출 전에 어휘 관련도(문자 bigram BM25), 최신성, 출처 등급으로 후보를 줄이는 결정적 스코어러
+"""
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# 문서 유형별 출처 등급 (정기보고서 > 정정보고서 > 뉴스)
+SOURCE_TIERS = {"regular": 1.0, "revision": 0.8, "news": 0.5}
+
+# 점수 가중치
+RELEVANCE_WEIGHT = 0.6
+RECENCY_WEIGHT = 0.25
+TIER_WEIGHT = 0.15
+
+RECENCY_HALF_LIFE_DAYS = 30
+
+
+def _compact(text: str) -> str:
+    """소문자화 후 공백 제거"""
+    return "".join(str(text).lower().split())
+
+
+def bm25_scores(query: str, documents: List[str], ngram: int = 2, k1: float = 1.2, b: float = 0.75) -> List[float]:
+    """문자 n-gram BM25 점수 (질의 n-gram만 문서 문자열에서 직접 셈)"""
+    compact_query = _compact(query)
+    terms = list(dict.fromkeys(compact_query[i:i + ngram] for i in range(len(compact_query) - ngram + 1)))
+    if not terms or not documents:
+        return [0.0] * len(documents)
+
+    docs = [_compact(doc) for doc in documents]
+    lengths = [max(len(doc) - ngram + 1, 1) for doc in docs]
+    avg_length = sum(lengths) / len(lengths)
+    counts = [[doc.count(term) for term in terms] for doc in docs]
+
+    idf = []
+    for t in range(len(terms)):
+        df = sum(1 for row in counts if row[t])
+        idf.append(math.log(1 + (len(docs) - df + 0.5) / (df + 0.5)))
+
+    scores = []
+    for row, length in zip(counts, lengths):
+        norm = k1 * (1 - b + b * length / avg_length)
+        scores.append(sum(idf[t] * tf * (k1 + 1) / (tf + norm) for t, tf in enumerate(row) if tf))
+    return scores
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """'2025-10-01 12:00', '2025.10.01' 형식 날짜 파싱"""
+    if not value:
+        return None
+    head = str(value)[:10].replace(".", "-")
+    try:
+        return datetime.strptime(head, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _recency(date: Optional[datetime], now: datetime) -> float:
+    """반감기 기반 최신성 점수 (0~1, 날짜를 모르면 0.5)"""
+    if date is None:
+        return 0.5
+    days = max((now - date).days, 0)
+    return 0.5 ** (days / RECENCY_HALF_LIFE_DAYS)
+
+
+def _normalize(scores: List[float]) -> List[float]:
+    """최댓값 기준 0~1 정규화"""
+    top = max(scores, default=0.0)
+    return [score / top if top > 0 else 0.0 for score in scores]
+
+
+def _document_text(doc_type: str, doc: Dict) -> str:
+    """유형별 어휘 비교용 텍스트"""
+    if doc_type == "news":
+        return f"{doc.get('title', '')} {doc.get('title', '')} {doc.get('description', '')}"
+    if doc_type == "regular":
+        return f"{doc.get('company_name', '')} {doc.get('year', '')}년 {doc.get('quarter', '')}분기 정기보고서"
+    basic_info = doc.get("basic_info", {})
+    return f"{basic_info.get('company', '')} {basic_info.get('report_name', '')} {basic_info.get('title', '')}"
+
+
+def _document_date(doc_type: str, doc: Dict) -> Optional[datetime]:
+    """유형별 기준 날짜 (정기보고서는 분기 마지막 달)"""
+    if doc_type == "news":
+        return _parse_date(doc.get("date", ""))
+    if doc_type == "regular":
+        try:
+            return datetime(int(doc["year"]), int(doc["quarter"]) * 3, 1)
+        except (KeyError, TypeError, ValueError):
+            return None
+    return _parse_date(doc.get("basic_info", {}).get("date", ""))
+
+
+def score_documents(query: str, doc_type: str, documents: List[Dict], now: datetime = None) -> List[Tuple[Dict, float]]:
+    """한 유형의 후보 문서 점수 계산 (점수 내림차순)"""
+    if not documents:
+        return []
+    now = now or datetime.now()
+    relevance = _normalize(bm25_scores(query, [_document_text(doc_type, doc) for doc in documents]))
+    tier = SOURCE_TIERS.get(doc_type, 0.5)
+
+    scored = []
+    for doc, rel in zip(documents, relevance):
+        score = RELEVANCE_WEIGHT * rel + RECENCY_WEIGHT * _recency(_document_date(doc_type, doc), now) + TIER_WEIGHT * tier
+        if doc_type == "news" and doc.get("outlet_count", 1) > 1:
+            # 여러 매체가 보도한 기사는 출처 신뢰도 가산
+            score += TIER_WEIGHT * min(math.log2(doc["outlet_count"]) / 4, 0.5)
+        if doc_type == "regular" and doc.get("is_target"):
+            # 질의에서 요청한 연도/분기의 보고서 가산
+            score += RECENCY_WEIGHT
+        scored.append((doc, round(score, 4)))
+
+    return sorted(scored, key=lambda pair: pair[1], reverse=True)
+
+
+def select_api_keys(query: str, api_descriptions: Dict[str, str], limit: int = 3, default: List[str] = None) -> List[str]:
+    """질의와 어휘가 겹치는 정기보고서 API 키 선택 (최고 점수의 절반 이상만, 없으면 default)"""
+    keys = list(api_descriptions)
+    scores = bm25_scores(query, [api_descriptions[key] for key in keys])
+    cutoff = max(scores, default=0.0) / 2
+    ranked = [
+        key for key, score in sorted(zip(keys, scores), key=lambda pair: pair[1], reverse=True)
+        if score > 0 and score >= cutoff
+    ]
+    return ranked[:limit] or list(default or [])
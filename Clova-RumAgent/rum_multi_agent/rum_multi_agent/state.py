@@ -5,19 +5,32 @@ from typing import Dict, List, Optional, TypedDict, Annotated
 
 
 def merge_lists(left: List, right: List) -> List:
-    """리스트 병합 함수"""
-    return left + right if right else left
+    """리스트 병합 함수 (노드가 기존 항목을 포함한 전체 리스트를 반환한 경우 중복 추가하지 않음)"""
+    if not right:
+        return left
+    if left and right[:len(left)] == left:
+        return right
+    return left + right
 
 
 class SearchState(TypedDict):
     """검색 상태 정의"""
     query: str
     search_preference: str  # "news", "publications", "both"
-    news_results: Optional[Dict]
-    publication_results: Optional[Dict]
+    selection_mode: Optional[str]  # "llm"(기본): 로컬 후보 축소 후 LLM 선택, "local": LLM 없이 로컬 점수로 선택
+    latency_budget: Optional[float]  # 요청 전체 지연 예산 (초, 없으면 축소 없이 처리)
+    deadline_at: Optional[float]  # 지연 예산 마감 시각 (epoch 초, analyze_query 에서 설정)
+    degradations: Annotated[List[str], merge_lists]  # 지연 예산 때문에 적용한 작업 축소 내역
+    publication_deadline: Optional[float]  # 증분 모드에서 출판물 검색을 기다릴 최대 시간 (초, 기본 PUBLICATION_DEADLINE_SECONDS)
+    publication_job: Optional[str]  # 증분 모드에서 백그라운드로 실행 중인 출판물 검색 작업 id
+    news_results: Optional[str]  # 뉴스 검색 원본 응답의 블롭 핸들
+    publication_results: Optional[str]  # 출판물 검색 원본 응답의 블롭 핸들
     news_errors: Annotated[List[str], merge_lists]  # 뉴스 검색 에러
     pub_errors: Annotated[List[str], merge_lists]   # 출판물 검색 에러
-    searched_list: Optional[Dict]  # 정리된 검색 결과 리스트
+    searched_list: Optional[Dict]  # 정리된 검색 결과 리스트 (뉴스 본문/API 데이터는 블롭 핸들)
+    document_index: Optional[Dict]  # 문서 id/정확 일치 키 해시 색인 (format_results 에서 생성)
     search_summary: str  # 검색 결과 요약
     selected_documents: Optional[Dict]  # LLM이 선택한 확인할 문서들
-    generated_response: Optional[str]  # 최종 생성된 답변 (LangGraph CLI 배포용)
\ No newline at end of file
+    generated_response: Optional[str]  # 최종 생성된 답변 (LangGraph CLI 배포용)
+    model_route: Optional[Dict]  # 답변 생성 모델 단계 (tier: fast/standard/thinking, difficulty, signals)
+    generation_metrics: Optional[Dict]  # 답변 생성 지연 지표 (ttft_ms, first_chunk_ms, total_ms, chunks, tier, 토큰, 추정 비용)
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+로컬 뉴스 코퍼스 조회 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_news_corpus [기사 수]
+
+최근 30일에 걸쳐 발행/수집된 합성 기사로 임시 코퍼스를 만들고,
+종목명/키워드 검색(최신순, BM25 순)의 조회 시간(p50/p95)과 로컬 응답 여부를 측정합니다.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from email.utils import format_datetime
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.news_corpus import NewsCorpus  # noqa: E402
+
+COMPANIES = ["삼성전자", "SK하이닉스", "하이브", "NAVER", "카카오", "현대자동차", "LG에너지솔루션", "셀트리온",
+             "포스코홀딩스", "미래에셋증권", "크래프톤", "에코프로", "두산에너빌리티", "기아", "KB금융"]
+TERMS = ["자사주 매입", "유상증자", "실적 발표", "영업이익", "수주", "인수합병", "배당", "목표주가", "공급계약", "소송"]
+QUERIES = [("삼성전자", "date"), ("하이브", "date"), ("삼성전자 자사주", "sim"), ("카카오 실적", "sim"), ("에코프로 배당", "date")]
+DAYS = 30
+
+
+def build_corpus(path: str, size: int) -> NewsCorpus:
+    """size 건의 합성 기사 (발행 시각순으로 수집된 것처럼 first_seen/last_seen 조정)"""
+    rng = random.Random(0)
+    now = time.time()
+    items = []
+    for i in range(size):
+        pub_ts = now - DAYS * 86400 * (1 - i / size)
+        company, term = rng.choice(COMPANIES), rng.choice(TERMS)
+        items.append({
+            "title": f"<b>{company}</b>, {term} 관련 소식 {i}",
+            "description": f"{company}의 {term} 소식이 전해졌다. 증권가에서는 {rng.choice(TERMS)} 영향도 주목하고 있다.",
+            "link": f"https://n.news.naver.com/article/{i}",
+            "originallink": f"https://news.example.com/{i}",
+            "pubDate": format_datetime(datetime.fromtimestamp(pub_ts, timezone.utc)),
+        })
+    corpus = NewsCorpus(path=path)
+    for offset in range(0, size, 1000):
+        corpus.add(items[offset:offset + 1000])
+    # 최근 1시간 기사는 방금 네이버 응답에서 다시 본 것으로 (주기적으로 검색되는 종목)
+    with corpus._connect() as conn:
+        conn.execute("UPDATE articles SET first_seen=pub_ts + 60, last_seen=pub_ts + 600")
+        conn.execute("UPDATE articles SET last_seen=? WHERE pub_ts>=?", (now, now - 3600))
+    return corpus
+
+
+def main(size: int = 100_000, repeat: int = 200):
+    """결과 출력"""
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        corpus = build_corpus(str(Path(tmp) / "news_corpus.db"), size)
+        print(f"=== 로컬 뉴스 코퍼스 조회 벤치마크 ({size:,}건, 색인 {time.perf_counter() - started:.1f}s) ===")
+        for query, sort in QUERIES:
+            latencies = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                items = corpus.search(query, 20, sort)
+                latencies.append((time.perf_counter() - started) * 1000)
+            latencies.sort()
+            answered = "로컬 응답" if items is not None else "네이버 호출"
+            print(
+                f"{query:<14} ({sort}) p50 {latencies[len(latencies) // 2]:6.2f}ms "
+                f"p95 {latencies[int(len(latencies) * 0.95)]:6.2f}ms  {answered}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
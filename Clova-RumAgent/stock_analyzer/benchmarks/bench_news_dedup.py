@@ -0,0 +1,67 @@
+"""
+유사 중복 뉴스 클러스터링 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_news_dedup
+
+같은 통신사 기사를 N개 매체가 재송출한 경우(클러스터 하나)와 서로 다른 기사 N건(클러스터 N개)에 대해
+cluster_near_duplicates 시간을 측정합니다. 기사당 비교 횟수가 밴드 수로 묶여 있으므로 N 에 선형으로 늘어야 합니다.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.news_dedup import cluster_near_duplicates  # noqa: E402
+
+SIZES = (500, 1000, 2000, 4000, 8000)
+WIRE_STORY = (
+    "삼성전자가 3분기 영업이익 9조원을 기록하며 시장 전망치를 웃돌았다고 발표했다. "
+    "반도체 부문의 고대역폭메모리 판매 확대가 실적 개선을 이끌었으며 회사는 4분기에도 수요가 견조할 것으로 내다봤다."
+)
+WORDS = ["실적", "반도체", "수주", "배당", "인수", "소송", "공급", "투자", "증설", "감산", "전망", "발표"]
+
+
+def republished(size: int) -> list:
+    """한 기사를 size 개 매체가 재송출 (매체명만 다름)"""
+    return [
+        {"title": "삼성전자 3분기 영업이익 9조원", "description": f"[매체{i}] {WIRE_STORY}",
+         "link": f"https://news{i}.example.com/article/1"}
+        for i in range(size)
+    ]
+
+
+def distinct(size: int, seed: int = 0) -> list:
+    """서로 다른 기사 size 건"""
+    rng = random.Random(seed)
+    return [
+        {"title": " ".join(rng.choices(WORDS, k=5)) + f" {i}", "description": " ".join(rng.choices(WORDS, k=30)),
+         "link": f"https://news{i}.example.com/article/{i}"}
+        for i in range(size)
+    ]
+
+
+def measure(items: list) -> tuple:
+    """(클러스터 수, 소요 시간 ms)"""
+    started = time.perf_counter()
+    clusters = cluster_near_duplicates(items)
+    return len(clusters), (time.perf_counter() - started) * 1000
+
+
+def main():
+    """결과 출력"""
+    print(f"{'기사 수':>8} {'재송출 1건':>22} {'서로 다른 기사':>22}")
+    for size in SIZES:
+        same_clusters, same_ms = measure(republished(size))
+        distinct_clusters, distinct_ms = measure(distinct(size))
+        print(
+            f"{size:>8} {same_ms:9.1f}ms ({same_clusters}개, {same_ms * 1000 / size:5.1f}µs/건) "
+            f"{distinct_ms:9.1f}ms ({distinct_clusters}개, {distinct_ms * 1000 / size:5.1f}µs/건)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+뉴스 아이템 정규화 마이크로 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_normalizer [아이템 수]
+
+verification_results 에 저장된 실제 뉴스 데이터를 네이버 API 응답 형태로 되돌려
+기존 format_news_item 방식과 일괄 정규화(news_normalizer)의 초당 처리 아이템 수를 비교합니다.
+"""
+
+import glob
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from dateutil import parser
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.news_normalizer import format_pub_date, normalize_news_items  # noqa: E402
+
+STOCK_ANALYZER_DIR = Path(__file__).resolve().parent.parent
+
+
+def legacy_format_news_item(item: dict) -> dict:
+    """기존 구현 (매 호출마다 re.sub 패턴 해석, dateutil 범용 파서 사용)"""
+    def clean(text):
+        if not text:
+            return ""
+        return re.sub(r'<[^>]+>', '', text).strip()
+
+    def format_date(date_str):
+        if not date_str:
+            return ""
+        try:
+            return parser.parse(date_str).strftime("%Y-%m-%d %H:%M")
+        except Exception:
+            return date_str
+
+    return {
+        'title': clean(item.get('title', '')),
+        'description': clean(item.get('description', '')),
+        'link': item.get('link', ''),
+        'original_link': item.get('originallink', ''),
+        'pub_date': item.get('pubDate', ''),
+        'formatted_date': format_date(item.get('pubDate', ''))
+    }
+
+
+def load_sample_items(size: int) -> list:
+    """저장된 검증 결과에서 API 응답 형태의 샘플 아이템 생성"""
+    items = []
+    for path in sorted(glob.glob(str(STOCK_ANALYZER_DIR / "verification_results" / "*" / "*.json"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            for news in json.load(f).get("news_data", []):
+                items.append({
+                    "title": f"<b>{news['title']}</b>",
+                    "description": news["description"].replace(" ", " <b>", 1),
+                    "link": news["link"],
+                    "originallink": news["link"],
+                    "pubDate": news["pub_date"],
+                })
+    if not items:
+        raise SystemExit("샘플 뉴스 데이터가 없습니다.")
+    return [items[i % len(items)] for i in range(size)]
+
+
+def measure(func, items: list, repeat: int = 5) -> float:
+    """초당 처리 아이템 수 (최고 기록)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(items)
+        best = min(best, time.perf_counter() - started)
+    return len(items) / best
+
+
+def main(size: int = 5000):
+    """결과 출력"""
+    items = load_sample_items(size)
+
+    legacy = measure(lambda batch: [legacy_format_news_item(item) for item in batch], items)
+    format_pub_date.cache_clear()
+    cold = measure(normalize_news_items, items, repeat=1)
+    warm = measure(normalize_news_items, items)
+
+    print(f"=== 뉴스 정규화 벤치마크 ({size}건) ===")
+    print(f"기존 format_news_item : {legacy:12,.0f} items/s")
+    print(f"일괄 정규화 (cold)    : {cold:12,.0f} items/s (x{cold / legacy:.1f})")
+    print(f"일괄 정규화 (warm)    : {warm:12,.0f} items/s (x{warm / legacy:.1f})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,49 @@
+"""
+BM25 재정렬 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_reranker [뉴스 수]
+
+저장된 검증 결과(verification_results/*/*.json)의 뉴스를 모아 한 루머로 재정렬하는 시간을 측정하고 상위 10건을 출력합니다.
+"""
+
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.reranker import BM25Reranker  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent.parent / "verification_results"
+QUERY = "방시혁 하이브 출국금지 사실이야?"
+REPEAT = 100
+
+
+def load_news(limit: int) -> list:
+    """저장된 검증 결과의 뉴스 최대 limit 건"""
+    items = []
+    for path in sorted(glob.glob(str(RESULTS_DIR / "*" / "*.json"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            items.extend(json.load(f).get("news_data", []))
+    return items[:limit]
+
+
+def main(limit: int = 200):
+    """결과 출력"""
+    items = load_news(limit)
+    reranker = BM25Reranker()
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        top = reranker.rerank(QUERY, items, top_k=10)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / REPEAT
+
+    print(f"{len(items)}건 재정렬: {elapsed_ms:.2f} ms/회")
+    for item, score in top:
+        print(f"{score:6.2f}  {item['title']}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,83 @@
+"""
+유사 루머 색인 조회 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_rumor_index [루머 수]
+
+여러 종목에 나뉜 합성 루머로 임시 색인을 만들고, 유사 루머 조회 시간(p50/p95)을
+색인 조회 전체와 벡터 검색만 나눠 측정합니다.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.rumor_index import RumorIndex, company_key, term_counts, _weigh  # noqa: E402
+
+COMPANIES = [f"종목{i:03d}" for i in range(200)]
+# 루머가 몰리는 대형주
+HOT_COMPANIES = ["삼성전자", "SK하이닉스", "하이브", "NAVER", "카카오"]
+SUBJECTS = ["이재용", "회장", "대표", "최대주주", "외국인", "기관", "경영진"]
+EVENTS = ["자사주 매입", "유상증자", "인수합병", "대규모 수주", "실적 부진", "배당 확대", "압수수색", "공급계약"]
+ENDINGS = ["사실이야?", "했다던데", "한다는 소문 진짜?", "맞나요", "루머 확인 부탁"]
+
+
+def build_index(path: str, size: int) -> RumorIndex:
+    """size 건의 합성 루머 (절반은 대형주 5종목, 나머지는 200종목에 분산)"""
+    rng = random.Random(0)
+    index = RumorIndex(path=path)
+    rows = []
+    now = time.time()
+    for i in range(size):
+        company = rng.choice(HOT_COMPANIES) if i % 2 == 0 else rng.choice(COMPANIES)
+        rumor = f"{company} {rng.choice(SUBJECTS)} {rng.choice(EVENTS)} {rng.choice(ENDINGS)} {i}"
+        rows.append((f"v{i}", company_key(company), company, rumor, "판정", 10, now))
+    with index._connect() as conn:
+        conn.executemany(
+            "INSERT INTO rumors (verification_id, company_key, company_name, rumor_text, final_result, news_count, "
+            "created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+    index.load()
+    return index
+
+
+def percentiles(latencies: list) -> str:
+    latencies = sorted(latencies)
+    return f"p50 {latencies[len(latencies) // 2] * 1000:6.3f}ms p95 {latencies[int(len(latencies) * 0.95)] * 1000:6.3f}ms"
+
+
+def main(size: int = 100_000, repeat: int = 500):
+    """결과 출력"""
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        index = build_index(str(Path(tmp) / "rumor_index.db"), size)
+        stats = index.stats()
+        print(
+            f"=== 유사 루머 색인 벤치마크 ({stats['entries']:,}건, {stats['companies']}종목, "
+            f"최대 {stats['largest_partition']:,}건/종목, 색인 {time.perf_counter() - started:.1f}s, "
+            f"{stats['matrix_mb']}MB) ==="
+        )
+        for company, rumor in [("삼성전자", "삼성 회장이 자사주 샀다던데"), ("종목042", "종목042 유상증자 한다는 소문")]:
+            full, vector = [], []
+            partition = index._partitions[company_key(company)]
+            size_ = len(partition.entries)
+            for _ in range(repeat):
+                started = time.perf_counter()
+                results = index.similar(company, rumor, top_k=3, min_score=0.0)
+                full.append(time.perf_counter() - started)
+                started = time.perf_counter()
+                scores = partition.vectors[:size_] @ _weigh(term_counts(rumor), index._idf)[0]
+                vector.append(time.perf_counter() - started)
+            print(f"{company} ({size_:,}건)")
+            print(f"  조회 전체            {percentiles(full)}")
+            print(f"  벡터 검색만          {percentiles(vector)}")
+            print(f"  최상위: {results[0]['rumor_text']} ({results[0]['score']})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
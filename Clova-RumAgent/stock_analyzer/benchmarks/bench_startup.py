@@ -0,0 +1,68 @@
+"""
+서버 기동 시간(time-to-ready) 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_startup [반복 횟수]
+
+새 프로세스에서 main 모듈 import 시간과 lifespan 초기화/워밍업 완료까지의 시간을 측정합니다.
+API 키가 없어도 측정할 수 있도록 더미 환경변수를 사용합니다.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+STOCK_ANALYZER_DIR = Path(__file__).resolve().parent.parent
+
+# 새 프로세스에서 실행할 측정 코드
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+main.services.initialize()
+t2 = time.perf_counter()
+main.services.warm_up()
+t3 = time.perf_counter()
+print(json.dumps({
+    "import": t1 - t0,
+    "initialize": t2 - t1,
+    "warm_up": t3 - t2,
+    "time_to_ready": t3 - t0,
+    "ready": main.services.ready,
+}))
+"""
+
+
+def run_once() -> dict:
+    """새 프로세스에서 한 번 측정"""
+    env = dict(os.environ)
+    env.setdefault("NAVER_CLIENT_ID", "bench")
+    env.setdefault("NAVER_CLIENT_SECRET", "bench")
+    env.setdefault("GOOGLE_API_KEY", "bench")
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=STOCK_ANALYZER_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(repeat: int = 5):
+    """측정 결과 출력"""
+    runs = [run_once() for _ in range(repeat)]
+    print(f"=== time-to-ready ({repeat}회, 중앙값) ===")
+    for key in ("import", "initialize", "warm_up", "time_to_ready"):
+        values = [run[key] for run in runs]
+        print(f"{key:>14}: {statistics.median(values) * 1000:8.1f} ms")
+    print(f"{'ready':>14}: {all(run['ready'] for run in runs)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,92 @@
+"""
+멀티 워커 저장소 동시성/처리량 벤치마크
+
+사용법 (stock_analyzer 디렉토리에서):
+    python -m benchmarks.bench_storage_workers [요청 수] [요청당 처리 시간(ms)]
+
+워커 프로세스 1/2/4개가 같은 저장소에 동시에 결과를 저장하면서
+- 인덱스 항목 유실/손상이 없는지 확인하고
+- 처리량(requests/s)이 워커 수에 따라 늘어나는지 측정합니다.
+요청당 처리 시간은 uvicorn 워커 한 개가 분석/포맷팅에 쓰는 CPU 시간을 흉내냅니다.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.result_storage import ResultStorage  # noqa: E402
+
+
+def _busy_wait(ms: float) -> None:
+    """CPU 작업 시뮬레이션"""
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def _worker(args) -> int:
+    """한 워커 프로세스가 담당 요청을 처리하고 저장"""
+    storage_dir, worker_id, count, work_ms = args
+    storage = ResultStorage(storage_dir)
+    saved = 0
+    for i in range(count):
+        _busy_wait(work_ms)
+        path = storage.save_verification_result(
+            rumor_text=f"벤치마크 루머 {worker_id}-{i}",
+            company_name="벤치마크",
+            news_count=0,
+            news_data=[],
+            analysis_details="",
+            final_result="",
+            status="success"
+        )
+        saved += bool(path)
+    return saved
+
+
+def run(workers: int, total_requests: int, work_ms: float) -> dict:
+    """워커 수별 처리량 측정 및 인덱스 무결성 확인"""
+    with tempfile.TemporaryDirectory() as storage_dir:
+        per_worker = total_requests // workers
+        started = time.perf_counter()
+        with Pool(workers) as pool:
+            saved = sum(pool.map(_worker, [(storage_dir, w, per_worker, work_ms) for w in range(workers)]))
+        elapsed = time.perf_counter() - started
+
+        with open(Path(storage_dir) / "index.json", 'r', encoding='utf-8') as f:
+            indexed = len(json.load(f)["verifications"])
+
+    expected = min(saved, 100)  # 인덱스는 최근 100개만 유지
+    return {
+        "workers": workers,
+        "saved": saved,
+        "indexed": indexed,
+        "consistent": indexed == expected,
+        "throughput": saved / elapsed,
+    }
+
+
+def main(total_requests: int = 80, work_ms: float = 20.0):
+    """결과 출력"""
+    print(f"=== 저장소 멀티 워커 벤치마크 (요청 {total_requests}건, 요청당 {work_ms}ms) ===")
+    baseline = None
+    for workers in (1, 2, 4):
+        result = run(workers, total_requests, work_ms)
+        baseline = baseline or result["throughput"]
+        print(
+            f"workers={result['workers']}: {result['throughput']:7.1f} req/s "
+            f"(x{result['throughput'] / baseline:.2f}), "
+            f"saved={result['saved']}, indexed={result['indexed']}, consistent={result['consistent']}"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 80,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 20.0,
+    )
@@ -19,14 +19,120 @@ NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
 DEFAULT_DISPLAY = 20
 MAX_DISPLAY = 100
 DEFAULT_SORT = "date"  # sim: 정확도순, date: 날짜순
+NEWS_CANDIDATE_POOL = 100  # BM25 재정렬 전 가져오는 후보 뉴스 수 (상위 news_count건만 LLM에 전달)
 
 # LLM 설정
 LLM_MODEL = "gemini-2.0-flash-exp"
 LLM_TEMPERATURE = 0.1
+CLOVA_MODEL = "HCX-007"  # Clova 기본 모델 (회사명 추출 1순위, 분석 헤지용)
+
+# 뉴스 컨텍스트 토큰 예산 (모델별, 근사 토큰 수)
+CONTEXT_TOKEN_BUDGETS = {
+    "gemini-2.0-flash-exp": 3000,
+    "gemini-2.0-flash": 3000,
+    "HCX-007": 2000,
+}
+DEFAULT_CONTEXT_TOKEN_BUDGET = 2000
+MAX_DESCRIPTION_CHARS = 200  # 뉴스 한 건당 본문 요약 최대 길이
+
+# 외부 호출 복원력 설정 (제공자별 타임아웃/재시도/서킷 브레이커)
+DEFAULT_PROVIDER_POLICY = {
+    "timeout": 10.0,           # 초, HTTP는 (연결, 읽기) 튜플 가능
+    "max_retries": 2,          # 멱등 호출만 재시도
+    "backoff_base": 0.5,       # 지수 백오프 기준 (full jitter)
+    "backoff_max": 8.0,
+    "failure_threshold": 5,    # 연속 실패 시 브레이커 열림
+    "recovery_timeout": 30.0,  # 열린 뒤 시험 호출까지 대기 (초)
+}
+PROVIDER_POLICIES = {
+    "naver_news": {"timeout": (3.05, 5.0), "max_retries": 2},
+    "gemini": {"timeout": 30.0, "max_retries": 1},
+    "clova": {"timeout": 60.0, "max_retries": 1},
+}
+
+# LLM 헤지 호출 설정 (1순위 제공자가 p95 안에 답하지 않으면 2순위 제공자에도 요청)
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+HEDGE_WINDOW = 200        # 제공자별로 보관하는 최근 지연 표본 수
+HEDGE_MIN_SAMPLES = 20    # p95 를 쓰기 위한 최소 표본 수 (그 전에는 아래 기본값)
+HEDGE_DEFAULT_DELAYS = {  # 초
+    "gemini": 4.0,
+    "clova": 8.0,
+    "anthropic": 4.0,
+}
+
+# LLM 응답 캐시 설정 (같은 모델/temperature/프롬프트/프롬프트 버전이면 이전 응답 재사용)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "llm_responses.db"))
+LLM_CACHE_MEMORY_ITEMS = 1024
+LLM_CACHE_MAX_TEMPERATURE = 0.2  # 이보다 높은 temperature 호출은 캐시하지 않음
+LLM_CACHE_DEFAULT_TTL = 24 * 3600  # 초
+LLM_CACHE_TTLS = {  # 호출 위치별 TTL (초)
+    "extract_company_from_query": 30 * 24 * 3600,  # 회사명 정규화는 거의 바뀌지 않음
+    "extract_info_from_query": 7 * 24 * 3600,
+    "verify_rumor": 6 * 3600,  # 같은 뉴스 목록에 대한 판정
+    "verify_rumor_details": 6 * 3600,
+    "article_credibility": 7 * 24 * 3600,  # 기사 단위 신뢰성 요약 (기사 내용이 같으면 재사용)
+}
+
+# 난이도 기반 모델 라우팅 (쉬운 검증은 빠른 모델 1회 호출, 어려운 검증만 뉴스별 분석 + 판정 2회 호출)
+ROUTING_ENABLED = os.getenv("ROUTING_ENABLED", "true").lower() == "true"
+ROUTING_FAST_MODEL = "gemini-2.0-flash-lite"
+ROUTING_FAST_CLOVA_MODEL = "HCX-DASH-002"  # fast 단계 헤지용
+ROUTING_EASY_MAX_SCORE = 0.35  # 난이도 점수가 이보다 낮으면 fast
+ROUTING_HARD_MIN_SCORE = 0.6   # 이 이상이면 deep (뉴스별 분석 + 판정)
+MODEL_COSTS = {  # 모델별 추정 단가 (USD / 1M 토큰, (입력, 출력)), 요금이 바뀌면 수정
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-2.0-flash-exp": (0.10, 0.40),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "HCX-DASH-002": (0.09, 0.36),
+    "HCX-007": (0.9, 3.6),
+}
+
+# 검색어별 누적 뉴스 저장소 (sort=date 로 마지막으로 본 기사(워터마크)까지만 가져와 새 기사만 추가)
+NEWS_STORE_ENABLED = os.getenv("NEWS_STORE_ENABLED", "true").lower() == "true"
+NEWS_STORE_PATH = os.getenv("NEWS_STORE_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "news_store.db"))
+NEWS_STORE_MAX_AGE_DAYS = int(os.getenv("NEWS_STORE_MAX_AGE_DAYS", "30"))  # 이보다 오래된 기사는 삭제
+NEWS_STORE_KEEP_LATEST = MAX_DISPLAY  # 오래되었어도 검색어별 최신 기사 이만큼은 보관 (뉴스가 드문 종목용)
+NEWS_STORE_MIN_POLL_SECONDS = 60  # 마지막 동기화 후 이 시간 안에는 네이버를 다시 호출하지 않음
+NEWS_STORE_POLL_DISPLAY = 20      # 증분 동기화 첫 페이지 크기 (워터마크에 못 닿으면 다음 페이지는 MAX_DISPLAY)
+NEWS_STORE_MAX_PAGES = 10         # 동기화 1회 최대 페이지 수 (네이버 start 최대 1000)
+
+# 로컬 뉴스 코퍼스 (네이버에서 받은 모든 기사를 FTS5 로 색인, 시간 창 안의 기사가 충분하면 네이버 대신 응답)
+NEWS_CORPUS_ENABLED = os.getenv("NEWS_CORPUS_ENABLED", "true").lower() == "true"
+NEWS_CORPUS_PATH = os.getenv("NEWS_CORPUS_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "news_corpus.db"))
+NEWS_CORPUS_WINDOW_HOURS = int(os.getenv("NEWS_CORPUS_WINDOW_HOURS", "24"))  # 로컬 응답에 쓰는 기사 발행 시간 창
+NEWS_CORPUS_FRESH_SECONDS = 300  # 일치하는 기사를 네이버 응답에서 마지막으로 본 시각이 이보다 오래되면 네이버 호출
+
+# 관심 종목 뉴스 사전 수집 (주기적으로 뉴스 검색/정리 + 기사별 신뢰성 요약을 미리 계산)
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "true").lower() == "true"
+PREFETCH_WATCHLIST = [
+    name.strip() for name in os.getenv("PREFETCH_WATCHLIST", "삼성전자,SK하이닉스,하이브,NAVER,미래에셋증권").split(",")
+    if name.strip()
+]
+PREFETCH_INTERVAL_SECONDS = int(os.getenv("PREFETCH_INTERVAL_SECONDS", "600"))
+PREFETCH_MAX_AGE_SECONDS = PREFETCH_INTERVAL_SECONDS * 2  # 이보다 오래된 사전 수집 결과는 쓰지 않고 직접 검색
+PREFETCH_NEWS_COUNT = NEWS_CANDIDATE_POOL
+PREFETCH_STOP_TIMEOUT_SECONDS = 10  # 종료 시 진행 중인 갱신이 끝나기를 기다리는 최대 시간
+# 워커 간 공유 다이제스트 파일 (`.lock` 파일 잠금을 잡은 워커 하나만 갱신, 나머지 워커는 이 파일을 읽음)
+PREFETCH_SHARED_PATH = os.getenv("PREFETCH_SHARED_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "prefetch_digests.json"))
+ARTICLE_SUMMARY_BATCH = 10  # 신뢰성 요약 LLM 호출 1회당 기사 수
+
+# 유사 루머 색인 (과거 rumor_text 의 해시 문자 n-gram TF-IDF 벡터, 같은 종목의 비슷한 루머 검증 결과를 찾아 재사용)
+RUMOR_INDEX_ENABLED = os.getenv("RUMOR_INDEX_ENABLED", "true").lower() == "true"
+RUMOR_INDEX_PATH = os.getenv("RUMOR_INDEX_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "rumor_index.db"))
+RUMOR_INDEX_DIMS = 256          # 해시 벡터 차원 (n-gram 을 이 크기로 접음, 10만 건 ≈ 150MB)
+RUMOR_SIMILAR_TOP_K = 3         # 응답에 함께 보여 줄 유사 루머 수
+RUMOR_SIMILAR_MIN_SCORE = 0.4   # 유사 루머로 보여 줄 최소 코사인 유사도
+RUMOR_REUSE_MIN_SCORE = float(os.getenv("RUMOR_REUSE_MIN_SCORE", "0.9"))  # 이 이상이면 같은 루머로 보고 이전 판정 재사용 (매입/매각처럼 한 단어만 다른 루머도 0.8 대)
+RUMOR_REUSE_MAX_AGE_SECONDS = int(os.getenv("RUMOR_REUSE_MAX_AGE_SECONDS", str(6 * 3600)))  # 이보다 오래된 판정은 재사용하지 않음
 
 # FastAPI 설정
 SERVER_HOST = "0.0.0.0"
 SERVER_PORT = 9000
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))  # uvicorn 워커 프로세스 수
+
+# 기동 설정 (True: 서버 기동 후 백그라운드에서 LLM 클라이언트 워밍업)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
 
 # 프롬프트 파일 경로
 PROMPTS_FILE = "prompts/prompts.yaml"
\ No newline at end of file
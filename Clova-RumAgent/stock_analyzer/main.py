@@ -2,37 +2,190 @@
 주식 뉴스 분석 시스템 메인 파일
 """
 
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import uvicorn
 
+from src.services import ServiceContainer
 from src.news_searcher import NewsSearcher
-from src.ai_analyzer import AIAnalyzer
-from src.result_storage import ResultStorage
-from src.company_extractor import CompanyExtractor
-from config.settings import SERVER_HOST, SERVER_PORT
+from src.context_builder import build_news_context
+from src.news_dedup import cluster_near_duplicates
+from src.reranker import BM25Reranker
+from src.hedging import hedging_stats
+from src.llm_cache import get_llm_cache
+from src.model_router import route_verification, routing_stats
+from src.news_corpus import get_news_corpus
+from src.news_store import get_news_store
+from src.resilience import CircuitOpenError, ProviderError, breaker_states
+from src.result_storage import is_successful_verdict
+from src.rumor_index import get_rumor_index
+from config.settings import (
+    LLM_MODEL, MAX_DISPLAY, NEWS_CANDIDATE_POOL, PREFETCH_ENABLED, RUMOR_REUSE_MAX_AGE_SECONDS, RUMOR_REUSE_MIN_SCORE,
+    SERVER_HOST, SERVER_PORT, SERVER_WORKERS, WARMUP_ON_STARTUP
+)
 
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 전역 서비스 컨테이너 (클라이언트는 lifespan에서 생성)
+services = ServiceContainer()
+reranker = BM25Reranker()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 클라이언트 초기화, 워밍업은 백그라운드에서 진행"""
+    services.initialize()
+    warmup_task = None
+    if WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(asyncio.to_thread(services.warm_up))
+    else:
+        services.warm_up()
+    if PREFETCH_ENABLED:
+        services.start_prefetch()
+    yield
+    services.stop_prefetch()
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="🔍 Rumor Verification API",
     description="기업 루머 및 뉴스 팩트체킹 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# 전역 인스턴스
-news_searcher = NewsSearcher()
-ai_analyzer = AIAnalyzer()
-result_storage = ResultStorage()
-company_extractor = CompanyExtractor()
+
+def get_client(name: str):
+    """초기화된 클라이언트 조회 (없으면 503)"""
+    try:
+        return services.require(name)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+def provider_unavailable(error: ProviderError) -> HTTPException:
+    """일시적 장애인 제공자(뉴스 검색, LLM)에 대한 503 응답
+
+    서킷 브레이커가 열려 있으면(CircuitOpenError) 타임아웃까지 기다리지 않고 즉시 반환하며 Retry-After 를 붙입니다.
+    """
+    headers = None
+    if isinstance(error, CircuitOpenError):
+        headers = {"Retry-After": str(max(int(error.retry_after), 1))}
+    return HTTPException(status_code=503, detail=str(error), headers=headers)
+
+
+def verify_and_save(ai_analyzer, result_storage, rumor_text: str, company_name: str, news_count: int, news_context: Dict) -> tuple:
+    """루머 판정 후 결과 저장, (판정, 저장 경로) 반환
+
+    판정에 실패하면 status="error" 로 저장해(유사 루머 색인에 넣지 않음) 기록만 남기고 예외를 다시 발생시킵니다.
+    """
+    def save(final_result: str, status: str) -> str:
+        return result_storage.save_verification_result(
+            rumor_text=rumor_text,
+            company_name=company_name,
+            news_count=news_count,
+            news_data=news_context["news_data"],
+            analysis_details="",  # 필요시 개별 뉴스 분석 결과 추가
+            final_result=final_result,
+            status=status,
+            metadata=news_context["stats"]
+        )
+
+    try:
+        verification_result = ai_analyzer.verify_rumor(
+            rumor_text, company_name, news_context["text"],
+            tier=news_context["model_route"]["tier"], analysis_details=news_context.get("analysis_details")
+        )
+    except Exception as e:
+        save(f"❌ 루머 검증 중 오류 발생: {e}", "error")
+        raise
+    return verification_result, save(verification_result, "success")
+
+
+def candidate_pool_size(news_count: int) -> int:
+    """재정렬용 후보 뉴스 검색 개수"""
+    return min(max(news_count, NEWS_CANDIDATE_POOL), MAX_DISPLAY)
+
+
+def prepare_news_context(news_items: List[Dict], rumor_text: str, top_k: int, normalized: bool = False) -> Dict:
+    """후보 뉴스를 정규화/유사 중복 제거/BM25 재정렬한 뒤 상위 top_k건으로 토큰 예산에 맞춘 컨텍스트 생성
+
+    normalized=True 이면 news_items 가 이미 정규화/유사 중복 제거된 대표 기사 목록(사전 수집 결과)입니다.
+    """
+    if normalized:
+        formatted_items = representatives = news_items
+    else:
+        formatted_items = NewsSearcher.format_news_items(news_items)
+        # 여러 매체가 재송출한 같은 기사는 대표 기사 하나로 묶음
+        representatives = cluster_near_duplicates(formatted_items)
+    # 루머 내용과 관련도가 높은 상위 top_k건만 LLM에 전달
+    top_items = [item for item, _ in reranker.rerank(rumor_text, representatives, top_k=top_k)]
+    context = build_news_context(top_items, query=rumor_text, model=LLM_MODEL, ranked=True)
+
+    # 저장 기록에는 판정 프롬프트에 실제로 들어간 기사만 남김 (제목 중복/토큰 예산으로 빠진 기사 제외)
+    context["news_data"] = [
+        {
+            "title": item['title'],
+            "description": item['description'],
+            "link": item.get('link', ''),
+            "pub_date": item.get('pub_date', ''),
+            "formatted_date": item['formatted_date']
+        }
+        for item in context["items"]
+    ]
+    context["stats"] = {
+        "candidate_pool": len(formatted_items),
+        "near_duplicates_removed": len(formatted_items) - len(representatives),
+        "context_items": len(context["items"]),
+        "context_tokens": context["tokens_used"],
+        "context_token_budget": context["token_budget"],
+        "context_tokens_saved": context["tokens_saved"],
+    }
+    # 뉴스 수/일치도/질문 유형으로 검증 단계(fast/standard/deep) 결정
+    context["model_route"] = route_verification(rumor_text, context["items"])
+    context["stats"]["model_route"] = context["model_route"]
+    logger.info(
+        f"📝 뉴스 컨텍스트: 후보 {len(formatted_items)}건 중 {len(context['items'])}건 "
+        f"(유사 중복 {len(formatted_items) - len(representatives)}건 제외), "
+        f"{context['tokens_used']}/{context['token_budget']} 토큰 (절감 {context['tokens_saved']})"
+    )
+    return context
+
+
+def load_news_context(news_searcher, company_name: str, rumor_text: str, news_count: int) -> Optional[Dict]:
+    """검증용 뉴스 컨텍스트 (관심 종목은 사전 수집 결과 사용, 관련 뉴스가 없으면 None)
+
+    사전 수집된 종목이고 컨텍스트에 들어간 기사 모두 신뢰성 요약이 있으면 analysis_details 를 채워
+    검증 시 뉴스별 분석 호출을 생략합니다.
+    """
+    digest = services.news_prefetcher.get_digest(company_name) if services.news_prefetcher else None
+    if digest and digest["items"]:
+        pool = digest["items"][:candidate_pool_size(news_count)]
+        context = prepare_news_context(pool, rumor_text, top_k=news_count, normalized=True)
+        summaries = [digest["summaries"].get(item['link']) for item in context["items"]]
+        if all(summaries):
+            context["analysis_details"] = "\n".join(f"{i}. {summary}" for i, summary in enumerate(summaries, 1))
+        context["stats"]["prefetched"] = True
+        logger.info(f"📦 {company_name} 사전 수집 뉴스 사용 (기사별 요약 {'사용' if all(summaries) else '일부 없음'})")
+        return context
+
+    news_results = news_searcher.recent_stock_news(company_name, display=candidate_pool_size(news_count))
+    if not news_results or 'items' not in news_results or len(news_results['items']) == 0:
+        return None
+    return prepare_news_context(news_results['items'], rumor_text, top_k=news_count)
 
 
 # 요청/응답 모델
@@ -40,11 +193,13 @@ class RumorVerificationRequest(BaseModel):
     rumor_text: str
     company_name: str
     news_count: int = 10
+    reuse_similar: bool = True  # 최근 검증된 같은 회사의 유사 루머가 있으면 그 판정 재사용
 
 
 class AutoVerificationRequest(BaseModel):
     rumor_text: str
     news_count: int = 10
+    reuse_similar: bool = True
 
 
 class RumorVerificationResponse(BaseModel):
@@ -55,6 +210,33 @@ class RumorVerificationResponse(BaseModel):
     status: str
     timestamp: str
     saved_file_path: str = ""
+    similar_verifications: List[Dict] = []  # 같은 회사의 유사 루머 검증 결과 (유사도 높은 순)
+    reused_verification_id: str = ""
+
+
+def reused_response(rumor_text: str, company_name: str, similar: List[Dict]) -> Optional[RumorVerificationResponse]:
+    """가장 유사한 루머가 RUMOR_REUSE_MIN_SCORE 이상이고 RUMOR_REUSE_MAX_AGE_SECONDS 안에 검증되었으면 그 판정으로 응답
+
+    성공한 판정이 아니면(오류 문구) 재사용하지 않습니다.
+    """
+    if not similar:
+        return None
+    best = similar[0]
+    if best["score"] < RUMOR_REUSE_MIN_SCORE or time.time() - best["created_at"] > RUMOR_REUSE_MAX_AGE_SECONDS:
+        return None
+    if not is_successful_verdict(best["final_result"]):
+        return None
+    logger.info(f"♻️ {company_name} 유사 루머 판정 재사용: {best['verification_id']} (유사도 {best['score']})")
+    return RumorVerificationResponse(
+        rumor_text=rumor_text,
+        company_name=company_name,
+        verification_result=best["final_result"],
+        news_count=best["news_count"],
+        status="reused",
+        timestamp=datetime.now().isoformat(),
+        similar_verifications=similar,
+        reused_verification_id=best["verification_id"]
+    )
 
 
 @app.get("/")
@@ -68,15 +250,36 @@ async def root():
             "verify": "/verify - 기업 루머 검증 (회사명 직접 입력)",
             "recent": "/recent - 최근 검증 결과 조회",
             "search": "/search - 검증 결과 검색",
-            "health": "/health - 헬스 체크"
+            "health": "/health - 헬스 체크",
+            "ready": "/ready - 준비 상태 확인"
         }
     }
 
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    """헬스 체크 (외부 제공자별 서킷 브레이커 상태 포함, 열린 브레이커가 있으면 degraded)"""
+    providers = breaker_states()
+    degraded = any(state["state"] != "closed" for state in providers.values())
+    return {
+        "status": "degraded" if degraded else "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "providers": providers,
+        "llm_hedging": hedging_stats(),
+        "llm_cache": get_llm_cache().stats(),
+        "model_routing": routing_stats(),
+        "news_prefetch": services.news_prefetcher.status() if services.news_prefetcher else None,
+        "news_store": get_news_store().stats() if get_news_store() else None,
+        "news_corpus": get_news_corpus().stats() if get_news_corpus() else None,
+        "rumor_index": get_rumor_index().stats() if get_rumor_index() else None
+    }
+
+
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (클라이언트 초기화/워밍업 완료 전에는 503)"""
+    readiness = services.readiness()
+    return JSONResponse(status_code=200 if readiness["ready"] else 503, content=readiness)
 
 
 @app.post("/auto-verify", response_model=RumorVerificationResponse)
@@ -95,9 +298,13 @@ async def auto_verify_rumor(request: AutoVerificationRequest):
         if not rumor_text:
             raise HTTPException(status_code=400, detail="루머 내용을 입력해주세요.")
 
+        news_searcher = get_client("news_searcher")
+        ai_analyzer = get_client("ai_analyzer")
+        result_storage = get_client("result_storage")
+
         # 1. AI로 회사명 추출
         logger.info(f"🤖 회사명 추출 중: {rumor_text}")
-        extracted_company = company_extractor.extract_company_from_query(rumor_text)
+        extracted_company = get_client("company_extractor").extract_company_from_query(rumor_text)
 
         if not extracted_company:
             return RumorVerificationResponse(
@@ -111,14 +318,16 @@ async def auto_verify_rumor(request: AutoVerificationRequest):
 
         logger.info(f"✅ 추출된 회사명: {extracted_company}")
 
-        # 2. 뉴스 검색
-        news_results = news_searcher.search_stock_news(
-            extracted_company,
-            display=request.news_count,
-            sort="date"
-        )
+        # 같은 회사의 유사 루머가 최근 검증되었으면 그 판정 재사용
+        similar = result_storage.find_similar_verifications(extracted_company, rumor_text)
+        reused = reused_response(rumor_text, extracted_company, similar) if request.reuse_similar else None
+        if reused:
+            return reused
 
-        if not news_results or 'items' not in news_results or len(news_results['items']) == 0:
+        # 2. 뉴스 검색 및 토큰 예산에 맞춘 컨텍스트 생성 (관심 종목은 사전 수집 결과 사용)
+        news_context = load_news_context(news_searcher, extracted_company, rumor_text, request.news_count)
+
+        if news_context is None:
             return RumorVerificationResponse(
                 rumor_text=rumor_text,
                 company_name=extracted_company,
@@ -128,35 +337,9 @@ async def auto_verify_rumor(request: AutoVerificationRequest):
                 timestamp=datetime.now().isoformat()
             )
 
-        # 3. 뉴스 목록 정리 및 데이터 구조화
-        news_list = ""
-        news_data = []
-        for i, item in enumerate(news_results['items'], 1):
-            formatted_item = news_searcher.format_news_item(item)
-            news_list += f"{i}. 제목: {formatted_item['title']}\n"
-            news_list += f"   내용: {formatted_item['description']}\n"
-            news_list += f"   날짜: {formatted_item['formatted_date']}\n\n"
-
-            news_data.append({
-                "title": formatted_item['title'],
-                "description": formatted_item['description'],
-                "link": formatted_item.get('link', ''),
-                "pub_date": formatted_item.get('pub_date', ''),
-                "formatted_date": formatted_item['formatted_date']
-            })
-
-        # 4. AI 루머 검증 실행
-        verification_result = ai_analyzer.verify_rumor(rumor_text, extracted_company, news_list)
-
-        # 5. 결과 저장
-        saved_file_path = result_storage.save_verification_result(
-            rumor_text=rumor_text,
-            company_name=extracted_company,
-            news_count=request.news_count,
-            news_data=news_data,
-            analysis_details="",
-            final_result=verification_result,
-            status="success"
+        # 3. AI 루머 검증 실행 및 결과 저장
+        verification_result, saved_file_path = verify_and_save(
+            ai_analyzer, result_storage, rumor_text, extracted_company, request.news_count, news_context
         )
 
         logger.info(f"✅ {extracted_company} 루머 검증 완료, 결과 저장: {saved_file_path}")
@@ -165,14 +348,20 @@ async def auto_verify_rumor(request: AutoVerificationRequest):
             rumor_text=rumor_text,
             company_name=extracted_company,
             verification_result=verification_result,
-            news_count=len(news_results['items']),
+            news_count=len(news_context["items"]),
             status="success",
             timestamp=datetime.now().isoformat(),
-            saved_file_path=saved_file_path
+            saved_file_path=saved_file_path,
+            similar_verifications=similar
         )
 
     except HTTPException:
         raise
+    except ProviderError as e:
+        if not e.retryable:
+            raise HTTPException(status_code=502, detail=str(e))
+        logger.warning(f"⚠️ {e}")
+        raise provider_unavailable(e)
     except Exception as e:
         error_msg = f"분석 중 오류 발생: {str(e)}"
         logger.error(f"❌ {error_msg}")
@@ -206,16 +395,22 @@ async def verify_rumor(request: RumorVerificationRequest):
         if not company_name:
             raise HTTPException(status_code=400, detail="회사명을 입력해주세요.")
 
+        news_searcher = get_client("news_searcher")
+        ai_analyzer = get_client("ai_analyzer")
+        result_storage = get_client("result_storage")
+
         logger.info(f"🔍 {company_name} 루머 검증 시작: {rumor_text}")
-        
-        # 1. 뉴스 검색
-        news_results = news_searcher.search_stock_news(
-            company_name,
-            display=request.news_count,
-            sort="date"
-        )
 
-        if not news_results or 'items' not in news_results or len(news_results['items']) == 0:
+        # 같은 회사의 유사 루머가 최근 검증되었으면 그 판정 재사용
+        similar = result_storage.find_similar_verifications(company_name, rumor_text)
+        reused = reused_response(rumor_text, company_name, similar) if request.reuse_similar else None
+        if reused:
+            return reused
+
+        # 1. 뉴스 검색 및 토큰 예산에 맞춘 컨텍스트 생성 (관심 종목은 사전 수집 결과 사용)
+        news_context = load_news_context(news_searcher, company_name, rumor_text, request.news_count)
+
+        if news_context is None:
             return RumorVerificationResponse(
                 rumor_text=rumor_text,
                 company_name=company_name,
@@ -225,36 +420,9 @@ async def verify_rumor(request: RumorVerificationRequest):
                 timestamp=datetime.now().isoformat()
             )
         
-        # 2. 뉴스 목록 정리 및 데이터 구조화
-        news_list = ""
-        news_data = []
-        for i, item in enumerate(news_results['items'], 1):
-            formatted_item = news_searcher.format_news_item(item)
-            news_list += f"{i}. 제목: {formatted_item['title']}\n"
-            news_list += f"   내용: {formatted_item['description']}\n"
-            news_list += f"   날짜: {formatted_item['formatted_date']}\n\n"
-
-            # 저장용 뉴스 데이터
-            news_data.append({
-                "title": formatted_item['title'],
-                "description": formatted_item['description'],
-                "link": formatted_item.get('link', ''),
-                "pub_date": formatted_item.get('pub_date', ''),
-                "formatted_date": formatted_item['formatted_date']
-            })
-
-        # 3. AI 루머 검증 실행
-        verification_result = ai_analyzer.verify_rumor(rumor_text, company_name, news_list)
-
-        # 4. 결과 저장
-        saved_file_path = result_storage.save_verification_result(
-            rumor_text=rumor_text,
-            company_name=company_name,
-            news_count=request.news_count,
-            news_data=news_data,
-            analysis_details="",  # 필요시 개별 뉴스 분석 결과 추가
-            final_result=verification_result,
-            status="success"
+        # 2. AI 루머 검증 실행 및 결과 저장
+        verification_result, saved_file_path = verify_and_save(
+            ai_analyzer, result_storage, rumor_text, company_name, request.news_count, news_context
         )
 
         logger.info(f"✅ {company_name} 루머 검증 완료, 결과 저장: {saved_file_path}")
@@ -263,14 +431,20 @@ async def verify_rumor(request: RumorVerificationRequest):
             rumor_text=rumor_text,
             company_name=company_name,
             verification_result=verification_result,
-            news_count=len(news_results['items']),
+            news_count=len(news_context["items"]),
             status="success",
             timestamp=datetime.now().isoformat(),
-            saved_file_path=saved_file_path
+            saved_file_path=saved_file_path,
+            similar_verifications=similar
         )
         
     except HTTPException:
         raise
+    except ProviderError as e:
+        if not e.retryable:
+            raise HTTPException(status_code=502, detail=str(e))
+        logger.warning(f"⚠️ {e}")
+        raise provider_unavailable(e)
     except Exception as e:
         error_msg = f"분석 중 오류 발생: {str(e)}"
         logger.error(f"❌ {error_msg}")
@@ -289,12 +463,14 @@ async def verify_rumor(request: RumorVerificationRequest):
 async def get_recent_verifications(limit: int = 10):
     """최근 검증 결과 조회"""
     try:
-        recent_results = result_storage.get_recent_verifications(limit)
+        recent_results = get_client("result_storage").get_recent_verifications(limit)
         return {
             "status": "success",
             "count": len(recent_results),
             "results": recent_results
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"최근 결과 조회 중 오류: {e}")
         raise HTTPException(status_code=500, detail=f"조회 중 오류 발생: {str(e)}")
@@ -307,7 +483,7 @@ async def search_verifications(company_name: str = None, keyword: str = None):
         if not company_name and not keyword:
             raise HTTPException(status_code=400, detail="company_name 또는 keyword 중 하나는 필수입니다.")
 
-        search_results = result_storage.search_verifications(company_name, keyword)
+        search_results = get_client("result_storage").search_verifications(company_name, keyword)
         return {
             "status": "success",
             "count": len(search_results),
@@ -324,7 +500,7 @@ async def search_verifications(company_name: str = None, keyword: str = None):
 async def get_verification_detail(verification_id: str):
     """특정 검증 결과 상세 조회"""
     try:
-        result = result_storage.get_verification_by_id(verification_id)
+        result = get_client("result_storage").get_verification_by_id(verification_id)
         if not result:
             raise HTTPException(status_code=404, detail="검증 결과를 찾을 수 없습니다.")
 
@@ -344,8 +520,12 @@ def verify_rumor_cli(rumor_text: str, company_name: str, news_count: int = 10):
     try:
         print(f"🔍 {company_name} 루머 검증 중: {rumor_text}")
 
+        services.initialize()
+        news_searcher = services.require("news_searcher")
+        ai_analyzer = services.require("ai_analyzer")
+
         # 뉴스 검색
-        news_results = news_searcher.search_stock_news(company_name, display=news_count, sort="date")
+        news_results = news_searcher.recent_stock_news(company_name, display=candidate_pool_size(news_count))
         
         if not news_results or 'items' not in news_results or len(news_results['items']) == 0:
             print("❌ 관련 뉴스를 찾을 수 없습니다.")
@@ -353,17 +533,12 @@ def verify_rumor_cli(rumor_text: str, company_name: str, news_count: int = 10):
         
         print(f"📰 {len(news_results['items'])}개 뉴스 발견")
         
-        # 뉴스 목록 정리
-        news_list = ""
-        for i, item in enumerate(news_results['items'], 1):
-            formatted_item = news_searcher.format_news_item(item)
-            news_list += f"{i}. 제목: {formatted_item['title']}\n"
-            news_list += f"   내용: {formatted_item['description']}\n"
-            news_list += f"   날짜: {formatted_item['formatted_date']}\n\n"
-        
+        # 뉴스 정리 및 토큰 예산에 맞춘 컨텍스트 생성
+        news_context = prepare_news_context(news_results['items'], rumor_text, top_k=news_count)
+
         # AI 루머 검증
         print("🤖 AI 루머 검증 중...")
-        verification_result = ai_analyzer.verify_rumor(rumor_text, company_name, news_list)
+        verification_result = ai_analyzer.verify_rumor(rumor_text, company_name, news_context["text"], tier=news_context["model_route"]["tier"])
 
         print("\n" + "="*60)
         print(verification_result)
@@ -373,15 +548,19 @@ def verify_rumor_cli(rumor_text: str, company_name: str, news_count: int = 10):
         print(f"❌ 루머 검증 중 오류 발생: {str(e)}")
 
 
-def run_server(host: str = SERVER_HOST, port: int = SERVER_PORT):
-    """서버 실행"""
-    print(f"🚀 서버 시작: http://{host}:{port}")
+def run_server(host: str = SERVER_HOST, port: int = SERVER_PORT, workers: int = SERVER_WORKERS):
+    """서버 실행 (workers > 1 이면 워커 프로세스별로 lifespan 초기화)"""
+    print(f"🚀 서버 시작: http://{host}:{port} (workers={workers})")
     print("📝 사용법:")
     print(f"   curl -X POST 'http://{host}:{port}/verify' \\")
     print("        -H 'Content-Type: application/json' \\")
     print("        -d '{\"rumor_text\": \"삼성전자 이재용이 자사주 매입했다는 거 사실이야?\", \"company_name\": \"삼성전자\"}'")
     
-    uvicorn.run(app, host=host, port=port)
+    if workers > 1:
+        # 멀티 워커는 import 문자열로 앱을 지정해야 함
+        uvicorn.run("main:app", host=host, port=port, workers=workers)
+    else:
+        uvicorn.run(app, host=host, port=port)
 
 
 if __name__ == "__main__":
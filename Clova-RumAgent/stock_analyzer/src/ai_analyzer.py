@@ -2,30 +2,100 @@
 AI 분석 모듈
 """
 
+import time
 import yaml
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
-
-from config.settings import GOOGLE_API_KEY, LLM_MODEL, LLM_TEMPERATURE, PROMPTS_FILE
+from config.settings import (
+    ARTICLE_SUMMARY_BATCH,
+    CLOVA_MODEL,
+    GOOGLE_API_KEY,
+    LLM_MODEL,
+    LLM_TEMPERATURE,
+    PROMPTS_FILE,
+    ROUTING_FAST_CLOVA_MODEL,
+    ROUTING_FAST_MODEL,
+)
+from src.hedging import HedgedLLM
+from src.llm_cache import get_llm_cache
+from src.model_router import DEEP, FAST, TIER_MODELS, record_verification
+from src.resilience import ProviderError, get_resilient_client
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트/후처리를 바꾸면 올려서 이전 캐시 응답을 쓰지 않게 함
+VERIFY_PROMPT_VERSION = 1
+# fast/standard 단계에서 뉴스별 분석 호출을 생략할 때 판정 프롬프트에 넣는 문구
+SKIPPED_DETAILS = "뉴스 간 내용이 일치하여 뉴스별 상세 분석은 생략했습니다. 위 뉴스 목록으로 판단하세요."
+
+# 기사 단위 신뢰성 요약 프롬프트 (루머와 무관하므로 관심 종목 뉴스는 미리 계산해 둠)
+ARTICLE_SUMMARY_PROMPT = """다음 뉴스들을 각각 루머 검증 관점에서 신뢰성을 평가해주세요.
+
+{news_list}
+
+어떤 설명도 추가하지 말고 JSON 배열로만 답하세요. 뉴스마다 다음 키를 가진 객체 하나:
+{{"index": 뉴스 번호, "summary": "제목 요약", "credibility": "높음/보통/낮음", "source": "공식/언론/개인/커뮤니티", "verification": "검증됨/부분검증/미검증/의심"}}
+"""
+
 
 class AIAnalyzer:
     """AI 기반 뉴스 분석 클래스"""
 
     def __init__(self):
-        """초기화"""
-        self.llm = ChatGoogleGenerativeAI(
-            model=LLM_MODEL,
+        """초기화 (LLM 클라이언트와 프롬프트는 처음 사용할 때 로드)"""
+        self._prompts = None
+        self._templates: Dict[str, Any] = {}
+        # Gemini 우선, p95 안에 응답이 없거나 실패하면 Clova 에도 요청
+        self.hedged = HedgedLLM("ai_analyzer", [
+            ("gemini", LLM_MODEL, self._create_gemini),
+            ("clova", CLOVA_MODEL, self._create_clova),
+        ])
+        # 쉬운 검증용 빠른 모델 (난이도 라우팅 fast 단계)
+        self.fast_hedged = HedgedLLM("ai_analyzer_fast", [
+            ("gemini", ROUTING_FAST_MODEL, lambda: self._create_gemini(ROUTING_FAST_MODEL)),
+            ("clova", ROUTING_FAST_CLOVA_MODEL, lambda: self._create_clova(ROUTING_FAST_CLOVA_MODEL)),
+        ])
+
+    @staticmethod
+    def _create_gemini(model: str = LLM_MODEL):
+        """Gemini 클라이언트 (재시도는 resilience 정책에서 처리)"""
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model,
             temperature=LLM_TEMPERATURE,
             api_key=GOOGLE_API_KEY,
+            timeout=get_resilient_client("gemini").read_timeout,
+            max_retries=0,
+        )
+
+    @staticmethod
+    def _create_clova(model: str = CLOVA_MODEL):
+        """Clova 클라이언트 (헤지용)"""
+        from langchain_naver import ChatClovaX
+
+        return ChatClovaX(
+            model=model,
+            temperature=LLM_TEMPERATURE,
+            timeout=get_resilient_client("clova").read_timeout,
+            max_retries=0
         )
-        self.prompts = self._load_prompts()
+
+    @property
+    def prompts(self) -> Dict[str, Any]:
+        """프롬프트 설정 (지연 로드)"""
+        if self._prompts is None:
+            self._prompts = self._load_prompts()
+        return self._prompts
+
+    def warm_up(self) -> None:
+        """클라이언트 생성 및 프롬프트 템플릿 미리 컴파일"""
+        self.hedged.warm_up()
+        self.fast_hedged.warm_up()
+        for prompt_name in self.prompts:
+            self._create_prompt_template(prompt_name)
 
     def _load_prompts(self) -> Dict[str, Any]:
         """YAML 프롬프트 파일 로드"""
@@ -37,48 +107,121 @@ class AIAnalyzer:
             logger.error(f"프롬프트 파일 로드 실패: {e}")
             return {}
 
-    def _create_prompt_template(self, prompt_name: str) -> PromptTemplate:
-        """프롬프트 템플릿 생성"""
+    def _create_prompt_template(self, prompt_name: str):
+        """프롬프트 템플릿 생성 (생성된 템플릿은 재사용)"""
+        if prompt_name in self._templates:
+            return self._templates[prompt_name]
         if prompt_name not in self.prompts:
             raise ValueError(f"프롬프트 '{prompt_name}'을 찾을 수 없습니다.")
-        
+
+        from langchain_core.prompts import PromptTemplate
+
         prompt_config = self.prompts[prompt_name]
-        return PromptTemplate(
+        template = PromptTemplate(
             template=prompt_config['template'],
             input_variables=prompt_config['input_variables']
         )
+        self._templates[prompt_name] = template
+        return template
 
     def analyze_news(self, news_text: str) -> str:
         """개별 뉴스 분석"""
         try:
             prompt_template = self._create_prompt_template('news_analysis')
-            chain = prompt_template | self.llm
-            result = chain.invoke({"news_text": news_text})
+            result = self.hedged.invoke(lambda llm: (prompt_template | llm).invoke({"news_text": news_text}))
             return result.content
         except Exception as e:
             logger.error(f"뉴스 분석 중 오류: {e}")
             return f"❌ 뉴스 분석 중 오류 발생: {str(e)}"
 
-    def verify_rumor(self, rumor_text: str, company_name: str, news_list: str) -> str:
-        """루머 검증 분석"""
-        try:
-            # 개별 뉴스들을 먼저 간단히 분석
-            analysis_details = self._analyze_news_details(news_list)
-
-            prompt_template = self._create_prompt_template('rumor_verification')
-            chain = prompt_template | self.llm
-            result = chain.invoke({
-                "rumor_text": rumor_text,
-                "company_name": company_name,
-                "news_list": news_list,
-                "analysis_details": analysis_details
-            })
-            return result.content
-        except Exception as e:
-            logger.error(f"루머 검증 중 오류: {e}")
-            return f"❌ 루머 검증 중 오류 발생: {str(e)}"
+    @staticmethod
+    def _cached_call(site: str, hedged: HedgedLLM, model: str, prompt: str, call, calls: List[tuple]) -> str:
+        """캐시 경유 호출 (실제로 모델을 호출한 경우만 calls 에 (비용 기준 모델, 프롬프트, 응답) 기록)
 
-    def _analyze_news_details(self, news_list: str) -> str:
+        캐시 키는 hedged 후보 전체이므로 헤지/장애 대응으로 다른 제공자가 답한 응답도 섞이지 않습니다.
+        """
+        def invoke():
+            response = call()
+            calls.append((model, prompt, response))
+            return response
+
+        return get_llm_cache().cached(
+            site, hedged.cache_model, LLM_TEMPERATURE, prompt, invoke, version=VERIFY_PROMPT_VERSION
+        )
+
+    def verify_rumor(
+        self, rumor_text: str, company_name: str, news_list: str, tier: str = DEEP, analysis_details: Optional[str] = None
+    ) -> str:
+        """루머 검증 분석
+
+        tier 는 model_router.route_verification 결과 (deep: 뉴스별 분석 + 판정, standard/fast: 판정 1회)
+        analysis_details 가 주어지면(사전 수집된 기사별 신뢰성 요약) 뉴스별 분석 호출 없이 판정만 합니다.
+        오류는 판정 문구로 바꾸지 않고 그대로 전달합니다 (오류 문구를 판정처럼 반환하면 성공으로 저장/재사용됨,
+        제공자 장애(브레이커 열림 포함)는 엔드포인트에서 503).
+        """
+        started = time.monotonic()
+        calls: List[tuple] = []
+        if not analysis_details:
+            if tier == DEEP:
+                # 개별 뉴스들을 먼저 간단히 분석
+                analysis_details = self._analyze_news_details(news_list, calls)
+            else:
+                analysis_details = SKIPPED_DETAILS
+
+        prompt_template = self._create_prompt_template('rumor_verification')
+        inputs = {
+            "rumor_text": rumor_text,
+            "company_name": company_name,
+            "news_list": news_list,
+            "analysis_details": analysis_details
+        }
+        hedged = self.fast_hedged if tier == FAST else self.hedged
+        result = self._cached_call(
+            "verify_rumor", hedged, TIER_MODELS[tier], prompt_template.format(**inputs),
+            lambda: hedged.invoke(lambda llm: (prompt_template | llm).invoke(inputs)).content,
+            calls
+        )
+        usage = record_verification(tier, time.monotonic() - started, calls)
+        logger.info(f"🧭 검증 단계 {tier}: LLM {len(calls)}회, {usage}")
+        return result
+
+    def summarize_articles(self, news_items: List[Dict[str, Any]]) -> List[str]:
+        """기사별 신뢰성 요약 한 줄씩 (news_items 순서, 요약에 실패한 기사는 빈 문자열)
+
+        형식은 뉴스별 상세 분석과 같은 "[제목 요약] → 신뢰도: .., 출처: .., 검증: .." 입니다.
+        """
+        from langchain_core.output_parsers import JsonOutputParser
+
+        parser = JsonOutputParser()
+        summaries = [""] * len(news_items)
+        for offset in range(0, len(news_items), ARTICLE_SUMMARY_BATCH):
+            batch = news_items[offset:offset + ARTICLE_SUMMARY_BATCH]
+            news_list = "".join(
+                f"{i}. 제목: {item['title']}\n   내용: {item['description']}\n" for i, item in enumerate(batch, 1)
+            )
+            prompt = ARTICLE_SUMMARY_PROMPT.format(news_list=news_list)
+            try:
+                results = get_llm_cache().cached(
+                    "article_credibility", self.hedged.cache_model, LLM_TEMPERATURE, prompt,
+                    lambda: parser.invoke(self.hedged.invoke(lambda llm: llm.invoke(prompt))),
+                    version=VERIFY_PROMPT_VERSION
+                )
+            except Exception as e:
+                logger.error(f"기사 신뢰성 요약 중 오류: {e}")
+                continue
+            for result in results if isinstance(results, list) else []:
+                try:
+                    index = int(result["index"]) - 1
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if 0 <= index < len(batch):
+                    summaries[offset + index] = (
+                        f"[{result.get('summary', batch[index]['title'])}] → 신뢰도: {result.get('credibility', '보통')}, "
+                        f"출처: {result.get('source', '언론')}, 검증: {result.get('verification', '미검증')}"
+                    )
+        return summaries
+
+    def _analyze_news_details(self, news_list: str, calls: List[tuple] = None) -> str:
         """뉴스별 상세 분석 - 루머 검증 관점"""
         try:
             # 루머 검증을 위한 뉴스별 신뢰성 분석 프롬프트
@@ -92,8 +235,14 @@ class AIAnalyzer:
 ...
 """
 
-            result = self.llm.invoke(simple_prompt.format(news_list=news_list))
-            return result.content
+            prompt = simple_prompt.format(news_list=news_list)
+            return self._cached_call(
+                "verify_rumor_details", self.hedged, LLM_MODEL, prompt,
+                lambda: self.hedged.invoke(lambda llm: llm.invoke(prompt)).content,
+                calls if calls is not None else []
+            )
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"뉴스 상세 분석 중 오류: {e}")
             return "뉴스별 신뢰성 분석 진행 중..."
\ No newline at end of file
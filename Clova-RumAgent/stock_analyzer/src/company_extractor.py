@@ -4,38 +4,65 @@
 """
 
 from typing import Dict, Optional
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_naver import ChatClovaX
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
 from dotenv import load_dotenv
 
-from config.settings import GOOGLE_API_KEY, LLM_MODEL, LLM_TEMPERATURE
+from config.settings import CLOVA_MODEL, GOOGLE_API_KEY, LLM_MODEL, LLM_TEMPERATURE
+from src.hedging import HedgedLLM
+from src.llm_cache import get_llm_cache
+from src.resilience import ProviderError, get_resilient_client
 
 load_dotenv()
 
+# 프롬프트/정규화 규칙을 바꾸면 올려서 이전 캐시 응답을 쓰지 않게 함
+EXTRACT_PROMPT_VERSION = 1
+EXTRACT_TEMPERATURE = 0.1
+
 
 class CompanyExtractor:
     """사용자 쿼리에서 회사명을 추출하는 클래스"""
 
     def __init__(self):
-        """초기화"""
-        # Clova HCX-007 사용 (원본 코드와 동일)
-        try:
-            self.llm = ChatClovaX(
-                model="HCX-007",
-                temperature=0.1
-            )
-        except:
-            # Clova 사용 불가시 Google Gemini 백업
-            self.llm = ChatGoogleGenerativeAI(
-                model=LLM_MODEL,
-                temperature=LLM_TEMPERATURE,
-                api_key=GOOGLE_API_KEY,
-            )
+        """초기화 (LLM 클라이언트는 처음 사용할 때 생성)"""
+        # Clova HCX-007 우선, p95 안에 응답이 없거나 실패(생성 실패 포함)하면 Gemini 에도 요청
+        self.hedged = HedgedLLM("company_extractor", [
+            ("clova", CLOVA_MODEL, self._create_clova),
+            ("gemini", LLM_MODEL, self._create_gemini),
+        ])
+
+    @staticmethod
+    def _create_clova():
+        """Clova HCX-007 클라이언트 (재시도는 resilience 정책에서 처리)"""
+        from langchain_naver import ChatClovaX
+
+        return ChatClovaX(
+            model=CLOVA_MODEL,
+            temperature=EXTRACT_TEMPERATURE,
+            timeout=get_resilient_client("clova").read_timeout,
+            max_retries=0
+        )
+
+    @staticmethod
+    def _create_gemini():
+        """Gemini 클라이언트 (헤지/백업용)"""
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=LLM_MODEL,
+            temperature=LLM_TEMPERATURE,
+            api_key=GOOGLE_API_KEY,
+            timeout=get_resilient_client("gemini").read_timeout,
+            max_retries=0,
+        )
+
+    def warm_up(self) -> None:
+        """클라이언트 미리 생성"""
+        self.hedged.warm_up()
 
     def extract_company_from_query(self, query: str) -> Optional[str]:
         """사용자 질문에서 회사명만 추출"""
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.output_parsers import JsonOutputParser
+
         parser = JsonOutputParser()
 
         prompt = ChatPromptTemplate.from_template(
@@ -71,20 +98,30 @@ class CompanyExtractor:
             """
         )
 
-        chain = prompt | self.llm | parser
+        inputs = {
+            "query": query,
+            "format_instructions": parser.get_format_instructions()
+        }
 
         try:
-            result = chain.invoke({
-                "query": query,
-                "format_instructions": parser.get_format_instructions()
-            })
+            result = get_llm_cache().cached(
+                "extract_company_from_query", self.hedged.cache_model, EXTRACT_TEMPERATURE, prompt.format(**inputs),
+                lambda: self.hedged.invoke(lambda llm: (prompt | llm | parser).invoke(inputs)),
+                version=EXTRACT_PROMPT_VERSION
+            )
             return result.get("company_name")
+        except ProviderError:
+            # 제공자 장애는 "회사명 없음"과 구분되도록 그대로 전달 (엔드포인트에서 503)
+            raise
         except Exception as e:
             print(f"회사명 추출 중 오류 발생: {e}")
             return None
 
     def extract_info_from_query(self, query: str) -> Optional[Dict]:
         """사용자 질문에서 회사명, 연도, 분기 추출 (원본 기능)"""
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.output_parsers import JsonOutputParser
+
         parser = JsonOutputParser()
 
         prompt = ChatPromptTemplate.from_template(
@@ -120,14 +157,21 @@ class CompanyExtractor:
             """
         )
 
-        chain = prompt | self.llm | parser
+        inputs = {
+            "query": query,
+            "format_instructions": parser.get_format_instructions()
+        }
 
         try:
-            info = chain.invoke({
-                "query": query,
-                "format_instructions": parser.get_format_instructions()
-            })
+            info = get_llm_cache().cached(
+                "extract_info_from_query", self.hedged.cache_model, EXTRACT_TEMPERATURE, prompt.format(**inputs),
+                lambda: self.hedged.invoke(lambda llm: (prompt | llm | parser).invoke(inputs)),
+                version=EXTRACT_PROMPT_VERSION
+            )
             return info
+        except ProviderError:
+            # 제공자 장애는 "회사명 없음"과 구분되도록 그대로 전달 (엔드포인트에서 503)
+            raise
         except Exception as e:
             print(f"정보 추출 중 오류 발생: {e}")
             return None
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+뉴스 컨텍스트 빌더 모듈
+검증 프롬프트에 들어갈 뉴스 목록을 모델별 토큰 예산에 맞춰 정렬/중복 제거/축약
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+from config.settings import CONTEXT_TOKEN_BUDGETS, DEFAULT_CONTEXT_TOKEN_BUDGET, MAX_DESCRIPTION_CHARS
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (한글 등 비ASCII 1자 ≈ 0.7토큰, ASCII 4자 ≈ 1토큰)"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return math.ceil((len(text) - ascii_chars) * 0.7 + ascii_chars / 4)
+
+
+def token_budget_for(model: str) -> int:
+    """모델별 뉴스 컨텍스트 토큰 예산"""
+    return CONTEXT_TOKEN_BUDGETS.get(model, DEFAULT_CONTEXT_TOKEN_BUDGET)
+
+
+def _bigrams(text: str) -> set:
+    """공백/기호를 제거한 문자 bigram 집합"""
+    compact = _NON_WORD_RE.sub('', text.lower())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _format_entry(index: int, item: Dict[str, Any], description: str) -> str:
+    """프롬프트용 뉴스 한 건 (여러 매체가 보도한 기사는 매체 수 표시)"""
+    outlets = f"   보도 매체 수: {item['outlet_count']}\n" if item.get('outlet_count', 1) > 1 else ""
+    return (
+        f"{index}. 제목: {item['title']}\n"
+        f"   내용: {description}\n"
+        f"   날짜: {item['formatted_date']}\n"
+        f"{outlets}\n"
+    )
+
+
+class NewsContextBuilder:
+    """토큰 예산 기반 뉴스 컨텍스트 빌더"""
+
+    def __init__(self, token_budget: int, max_description_chars: int = MAX_DESCRIPTION_CHARS):
+        """초기화"""
+        self.token_budget = token_budget
+        self.max_description_chars = max_description_chars
+
+    def rank(self, news_items: List[Dict[str, Any]], query: str = "") -> List[Dict[str, Any]]:
+        """질의와의 문자 bigram 겹침 정도, 최신순으로 정렬"""
+        query_grams = _bigrams(query)
+
+        def score(item):
+            overlap = len(query_grams & _bigrams(f"{item['title']} {item['description']}")) if query_grams else 0
+            return (overlap, item.get('formatted_date', ''))
+
+        return sorted(news_items, key=score, reverse=True)
+
+    def deduplicate(self, news_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """정규화한 제목이 같은 기사 제거 (앞선 순위 유지)"""
+        seen = set()
+        unique = []
+        for item in news_items:
+            key = _NON_WORD_RE.sub('', item['title'].lower())
+            if key and key in seen:
+                continue
+            seen.add(key)
+            unique.append(item)
+        return unique
+
+    def truncate(self, description: str) -> str:
+        """본문 요약 길이 제한"""
+        if len(description) <= self.max_description_chars:
+            return description
+        return description[:self.max_description_chars].rstrip() + "..."
+
+    def build(
+        self,
+        news_items: List[Dict[str, Any]],
+        query: str = "",
+        ranked: bool = False
+    ) -> Dict[str, Any]:
+        """토큰 예산 안에서 뉴스 컨텍스트 생성
+
+        Args:
+            news_items: 정규화된 뉴스 레코드 목록
+            query: 순위 산정 기준 (루머 내용)
+            ranked: True 이면 news_items 순서를 그대로 순위로 사용
+
+        Returns:
+            dict: text(프롬프트용 문자열), items(포함된 뉴스), 토큰 통계
+        """
+        # 제한 없이 모두 붙였을 때의 토큰 수 (절감량 계산용)
+        full_tokens = sum(
+            estimate_tokens(_format_entry(i, item, item['description']))
+            for i, item in enumerate(news_items, 1)
+        )
+
+        candidates = news_items if ranked else self.rank(news_items, query)
+        candidates = self.deduplicate(candidates)
+
+        parts: List[str] = []
+        included: List[Dict[str, Any]] = []
+        tokens_used = 0
+        for item in candidates:
+            entry = _format_entry(len(included) + 1, item, self.truncate(item['description']))
+            entry_tokens = estimate_tokens(entry)
+            if tokens_used + entry_tokens > self.token_budget:
+                continue
+            parts.append(entry)
+            included.append(item)
+            tokens_used += entry_tokens
+
+        return {
+            "text": "".join(parts),
+            "items": included,
+            "token_budget": self.token_budget,
+            "tokens_used": tokens_used,
+            "tokens_saved": max(full_tokens - tokens_used, 0),
+            "dropped": len(news_items) - len(included),
+        }
+
+
+def build_news_context(
+    news_items: List[Dict[str, Any]],
+    query: str = "",
+    model: Optional[str] = None,
+    token_budget: Optional[int] = None,
+    ranked: bool = False
+) -> Dict[str, Any]:
+    """모델 예산에 맞춘 뉴스 컨텍스트 생성 (편의 함수)"""
+    budget = token_budget or token_budget_for(model or "")
+    return NewsContextBuilder(budget).build(news_items, query, ranked=ranked)
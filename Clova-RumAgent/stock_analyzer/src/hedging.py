@@ -0,0 +1,206 @@
+"""
+LLM 헤지 호출 모듈
+1순위 제공자가 자기 p95 지연 안에 답하지 않으면 같은 요청을 2순위 제공자에도 보내고, 먼저 온 응답을 사용
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import HEDGE_DEFAULT_DELAYS, HEDGE_ENABLED, HEDGE_MIN_SAMPLES, HEDGE_WINDOW
+from src.resilience import get_resilient_client
+
+logger = logging.getLogger(__name__)
+
+# 헤지 호출은 각 제공자 SDK 의 동기 호출을 스레드에서 실행
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-hedge")
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    """정렬된 값의 백분위 (nearest-rank)"""
+    index = min(int(len(values) * ratio), len(values) - 1)
+    return values[index]
+
+
+class LatencyTracker:
+    """제공자별 최근 성공 호출 지연 (p50/p95/p99)"""
+
+    def __init__(self, window: int = HEDGE_WINDOW):
+        """초기화"""
+        self._samples: Dict[str, deque] = {}
+        self._window = window
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float) -> None:
+        """성공 호출 지연 기록"""
+        with self._lock:
+            self._samples.setdefault(provider, deque(maxlen=self._window)).append(seconds)
+
+    def percentile(self, provider: str, ratio: float) -> Optional[float]:
+        """최근 지연 백분위 (표본이 HEDGE_MIN_SAMPLES 미만이면 None)"""
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return _percentile(samples, ratio)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """/health 노출용 제공자별 지연 (ms)"""
+        with self._lock:
+            samples = {provider: sorted(values) for provider, values in self._samples.items()}
+        return {
+            provider: {
+                "samples": len(values),
+                "p50_ms": round(_percentile(values, 0.50) * 1000, 1),
+                "p95_ms": round(_percentile(values, 0.95) * 1000, 1),
+                "p99_ms": round(_percentile(values, 0.99) * 1000, 1),
+            }
+            for provider, values in sorted(samples.items()) if values
+        }
+
+
+# 제공자별 호출 지연 (헤지 기준), 호출 위치별 최종 응답 지연 (헤지 효과 확인용)
+latency_tracker = LatencyTracker()
+call_site_latency = LatencyTracker()
+
+
+class HedgedLLM:
+    """여러 제공자의 LLM 을 헤지 호출하는 래퍼
+
+    candidates 는 [(제공자 이름, 모델 이름, LLM 생성 함수)] 이고 앞쪽이 우선입니다.
+    - 1순위가 자기 p95(표본이 적으면 HEDGE_DEFAULT_DELAYS) 안에 끝나지 않으면 다음 제공자를 추가로 호출
+    - 호출이 실패하면(서킷 브레이커 열림, 생성 실패 포함) 기다리지 않고 다음 제공자를 호출
+    - 먼저 성공한 응답을 반환하고 나머지는 취소 (이미 실행 중인 동기 호출은 끝까지 실행되지만 결과는 버림)
+    각 제공자 호출에는 해당 제공자의 resilience 정책(타임아웃/재시도/브레이커)이 그대로 적용됩니다.
+    """
+
+    def __init__(self, name: str, candidates: List[Tuple[str, str, Callable[[], Any]]]):
+        """초기화
+
+        Args:
+            name: 호출 위치 이름 (지표 구분용)
+            candidates: [(제공자 이름, 모델 이름, LLM 생성 함수)], 생성 함수는 처음 사용할 때 한 번 호출
+        """
+        self.name = name
+        self.candidates = candidates if HEDGE_ENABLED else candidates[:1]
+        self._llms: Dict[str, Any] = {}
+        self._llm_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {"calls": 0, "hedged": 0, "failovers": 0, "errors": 0, "wins": {}}
+        _hedged_llms[name] = self
+
+    @property
+    def primary(self):
+        """1순위 제공자 LLM"""
+        return self._llm(self.candidates[0])
+
+    @property
+    def cache_model(self) -> str:
+        """응답 캐시 키의 모델 (어느 제공자가 답했는지 모르므로 후보 전체, 예: "clova:HCX-007|gemini:gemini-2.0-flash")"""
+        return "|".join(f"{provider}:{model}" for provider, model, _ in self.candidates)
+
+    def warm_up(self) -> None:
+        """모든 제공자 LLM 미리 생성 (생성에 실패한 제공자는 호출 시 건너뜀)"""
+        for candidate in self.candidates:
+            try:
+                self._llm(candidate)
+            except Exception as e:
+                logger.warning(f"[{self.name}] {candidate[0]} 클라이언트 생성 실패: {e}")
+
+    def _llm(self, candidate):
+        provider, _, factory = candidate
+        with self._llm_lock:
+            if provider not in self._llms:
+                self._llms[provider] = factory()
+            return self._llms[provider]
+
+    @staticmethod
+    def hedge_delay(provider: str) -> float:
+        """다음 제공자를 추가로 호출하기까지 기다릴 시간 (초)"""
+        p95 = latency_tracker.percentile(provider, 0.95)
+        return p95 if p95 is not None else HEDGE_DEFAULT_DELAYS.get(provider, 5.0)
+
+    def _attempt(self, candidate, make_call: Callable[[Any], Any]):
+        """제공자 한 곳 호출 (resilience 정책 적용, 성공 지연 기록)"""
+        provider = candidate[0]
+        started = time.monotonic()
+        result = get_resilient_client(provider).call(make_call, self._llm(candidate))
+        latency_tracker.record(provider, time.monotonic() - started)
+        return result
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _win(self, provider: str) -> None:
+        with self._stats_lock:
+            self.stats["wins"][provider] = self.stats["wins"].get(provider, 0) + 1
+
+    def invoke(self, make_call: Callable[[Any], Any]):
+        """make_call(llm) 을 헤지 호출하여 먼저 성공한 결과 반환 (모두 실패하면 마지막 예외)"""
+        self._count("calls")
+        started = time.monotonic()
+        futures: Dict[concurrent.futures.Future, str] = {}
+        waiting = list(self.candidates)
+        errors = []
+        next_hedge_at = None
+
+        def launch():
+            nonlocal next_hedge_at
+            candidate = waiting.pop(0)
+            future = _executor.submit(self._attempt, candidate, make_call)
+            futures[future] = candidate[0]
+            next_hedge_at = time.monotonic() + self.hedge_delay(candidate[0])
+            return future
+
+        pending = {launch()}
+        while pending:
+            timeout = max(next_hedge_at - time.monotonic(), 0) if waiting else None
+            done, pending = concurrent.futures.wait(pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            if not done:
+                # 먼저 보낸 제공자가 p95 를 넘김 → 다음 제공자에도 같은 요청
+                logger.info(f"[{self.name}] {timeout:.2f}초 안에 응답 없음, {waiting[0][0]} 헤지 호출")
+                self._count("hedged")
+                pending.add(launch())
+                continue
+
+            for future in done:
+                provider = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"[{self.name}] {provider} 호출 실패: {e}")
+                    errors.append(e)
+                    continue
+                for other in pending:
+                    other.cancel()
+                self._win(provider)
+                call_site_latency.record(self.name, time.monotonic() - started)
+                return result
+
+            if waiting:
+                # 실패한 제공자는 기다리지 않고 다음 제공자로
+                self._count("failovers")
+                pending.add(launch())
+
+        self._count("errors")
+        raise errors[-1]
+
+
+_hedged_llms: Dict[str, HedgedLLM] = {}
+
+
+def hedging_stats() -> Dict[str, Any]:
+    """호출 위치별 헤지 통계/최종 응답 지연과 제공자별 지연 백분위"""
+    call_latency = call_site_latency.snapshot()
+    return {
+        "call_sites": {
+            name: dict(hedged.stats, wins=dict(hedged.stats["wins"]), latency=call_latency.get(name))
+            for name, hedged in sorted(_hedged_llms.items())
+        },
+        "providers": latency_tracker.snapshot(),
+    }
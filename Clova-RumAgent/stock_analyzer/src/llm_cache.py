@@ -0,0 +1,189 @@
+"""
+LLM 응답 캐시 모듈
+(모델, temperature, 렌더링된 프롬프트, 프롬프트 버전)이 같은 결정적 호출의 결과를 재사용
+메모리 LRU → SQLite 순서로 조회하고, 호출 위치별 TTL 과 적중률을 관리합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import (
+    LLM_CACHE_DEFAULT_TTL,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_TEMPERATURE,
+    LLM_CACHE_MEMORY_ITEMS,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTLS,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    site TEXT NOT NULL,
+    value BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS llm_responses_expires ON llm_responses (expires_at);
+"""
+
+
+def cache_key(model: str, temperature: float, prompt: Any, version: Any) -> str:
+    """(모델, temperature, 렌더링된 프롬프트, 프롬프트 버전) 해시"""
+    if not isinstance(prompt, str):
+        prompt = json.dumps(prompt, ensure_ascii=False, sort_keys=True)
+    data = json.dumps([model, float(temperature), prompt, str(version)], ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """메모리 LRU + SQLite 2계층 LLM 응답 캐시 (값은 JSON 직렬화 가능한 값)"""
+
+    def __init__(self, path: Optional[str] = LLM_CACHE_PATH, max_items: int = LLM_CACHE_MEMORY_ITEMS):
+        """초기화 (path 가 비어 있으면 메모리만 사용)"""
+        self.path = path or None
+        self.max_items = max_items
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with closing(self._connect()) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                conn.commit()
+
+    def _connect(self):
+        """호출마다 새 연결 (요청이 여러 스레드에서 처리됨)"""
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _count(self, site: str, key: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(site, {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0})
+            stats[key] += 1
+
+    def _remember(self, key: str, data: str, expires_at: float) -> None:
+        """메모리 계층 저장 (호출자가 반환값을 수정해도 캐시가 바뀌지 않도록 JSON 문자열로 보관)"""
+        with self._lock:
+            self._memory[key] = (data, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def get(self, site: str, key: str):
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                else:
+                    del self._memory[key]
+                    entry = None
+        if entry is not None:
+            self._count(site, "memory_hits")
+            return json.loads(entry[0])
+
+        if self.path:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM llm_responses WHERE key=? AND expires_at>?", (key, now)
+                ).fetchone()
+            if row:
+                data = zlib.decompress(row[0]).decode("utf-8")
+                self._remember(key, data, row[1])
+                self._count(site, "disk_hits")
+                return json.loads(data)
+
+        self._count(site, "misses")
+        return None
+
+    def put(self, site: str, key: str, value: Any, ttl: float) -> None:
+        """캐시 저장"""
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        self._remember(key, data, now + ttl)
+        if self.path:
+            payload = zlib.compress(data.encode("utf-8"), 6)
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?)",
+                    (key, site, payload, now, now + ttl)
+                )
+                conn.commit()
+        self._count(site, "stores")
+
+    def cached(self, site: str, model: str, temperature: float, prompt: Any, call: Callable[[], Any], version: Any = 1):
+        """캐시에 있으면 반환, 없으면 call() 결과를 저장 후 반환
+
+        call() 이 예외를 내면 저장하지 않고 그대로 전달합니다.
+        temperature 가 LLM_CACHE_MAX_TEMPERATURE 보다 높으면 캐시하지 않습니다.
+        """
+        if temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return call()
+
+        key = cache_key(model, temperature, prompt, version)
+        value = self.get(site, key)
+        if value is not None:
+            return value
+
+        value = call()
+        if value is not None:
+            self.put(site, key, value, LLM_CACHE_TTLS.get(site, LLM_CACHE_DEFAULT_TTL))
+        return value
+
+    def purge_expired(self) -> int:
+        """만료 항목 삭제 (삭제 수 반환)"""
+        now = time.time()
+        with self._lock:
+            for key in [key for key, (_, expires_at) in self._memory.items() if expires_at <= now]:
+                del self._memory[key]
+        if not self.path:
+            return 0
+        with closing(self._connect()) as conn:
+            deleted = conn.execute("DELETE FROM llm_responses WHERE expires_at<=?", (now,)).rowcount
+            conn.commit()
+        return deleted
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """호출 위치별 적중 통계 (이 프로세스 기준)"""
+        with self._lock:
+            stats = {site: dict(values) for site, values in self._stats.items()}
+        for values in stats.values():
+            lookups = values["memory_hits"] + values["disk_hits"] + values["misses"]
+            values["hit_rate"] = round((values["memory_hits"] + values["disk_hits"]) / lookups, 3) if lookups else 0.0
+        return dict(sorted(stats.items()))
+
+
+class _DisabledCache:
+    """LLM_CACHE_ENABLED=false 일 때 사용 (항상 호출)"""
+
+    @staticmethod
+    def cached(site, model, temperature, prompt, call, version=1):
+        return call()
+
+    @staticmethod
+    def stats():
+        return {}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """프로세스 공유 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache() if LLM_CACHE_ENABLED else _DisabledCache()
+        return _cache
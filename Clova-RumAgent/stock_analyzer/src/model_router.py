@@ -0,0 +1,182 @@
+"""
+난이도 기반 검증 모델 라우팅 모듈
+뉴스 수, 뉴스 간 일치도(제목 유사도, 보도 매체 수, 부인/해명 표현), 질문 유형으로 난이도를 계산해
+- fast: 빠른 모델로 판정 1회
+- standard: 기본 모델로 판정 1회 (뉴스별 분석 생략)
+- deep: 뉴스별 신뢰성 분석 + 판정 2회 (기존 방식)
+단계별 호출 수, 지연, 토큰, 추정 비용은 routing_stats() 로 확인합니다.
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Any, Dict, List
+
+from config.settings import (
+    LLM_MODEL,
+    MODEL_COSTS,
+    ROUTING_EASY_MAX_SCORE,
+    ROUTING_ENABLED,
+    ROUTING_FAST_MODEL,
+    ROUTING_HARD_MIN_SCORE,
+)
+from src.context_builder import estimate_tokens
+
+FAST = "fast"
+STANDARD = "standard"
+DEEP = "deep"
+TIERS = [FAST, STANDARD, DEEP]
+
+# 단계별 판정 모델
+TIER_MODELS = {FAST: ROUTING_FAST_MODEL, STANDARD: LLM_MODEL, DEEP: LLM_MODEL}
+
+# 신호 가중치 (뉴스 수, 뉴스 간 불일치, 질문 유형)
+DOCUMENT_WEIGHT = 0.3
+DISAGREEMENT_WEIGHT = 0.35
+QUERY_WEIGHT = 0.35
+STATS_WINDOW = 200
+
+# 질문 유형 (인과/비교 > 사실 확인 > 전망/현황)
+_CAUSAL_RE = re.compile(r"왜|이유|원인|영향|때문|탓|덕분|비교|차이|관계|분석")
+_FACT_RE = re.compile(r"사실|진짜|정말|루머|맞아|맞나|했다는|했대|한대|확인")
+_OUTLOOK_RE = re.compile(r"어떻게 될|전망|오를까|내릴까|떨어질까|살까|팔까|주가|현황|얼마")
+QUERY_TYPE_SCORES = {"causal": 1.0, "fact": 0.5, "other": 0.5, "outlook": 0.2}
+# 출처 간 다툼을 나타내는 표현
+_CONFLICT_RE = re.compile(r"부인|사실무근|해명|반박|정정|의혹|논란|엇갈")
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _bigrams(text: str) -> set:
+    """공백/기호를 제거한 문자 bigram 집합"""
+    compact = _NON_WORD_RE.sub('', str(text).lower())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _dice(a: set, b: set) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+def query_type(text: str) -> str:
+    """질문 유형 (causal / fact / outlook / other)"""
+    if _CAUSAL_RE.search(text):
+        return "causal"
+    if _FACT_RE.search(text):
+        return "fact"
+    if _OUTLOOK_RE.search(text):
+        return "outlook"
+    return "other"
+
+
+def _document_score(news_items: List[Dict[str, Any]]) -> float:
+    """뉴스 수 (근거가 적을수록 판정이 어려움, 유사 중복으로 묶인 기사는 보도 매체 수만큼 셈)"""
+    count = sum(item.get('outlet_count', 1) for item in news_items)
+    if count < 3:
+        return 1.0
+    return min(count / 20, 0.5)
+
+
+def _disagreement(news_items: List[Dict[str, Any]]) -> float:
+    """뉴스 간 불일치 (부인/해명 표현이 있거나 제목 유사도가 낮으면 높음, 여러 매체 보도는 일치로 봄)"""
+    if any(_CONFLICT_RE.search(f"{item.get('title', '')} {item.get('description', '')}") for item in news_items):
+        return 1.0
+    if len(news_items) < 2:
+        return 0.5
+    grams = [_bigrams(item.get('title', '')) for item in news_items]
+    pairs = [(i, j) for i in range(len(grams)) for j in range(i + 1, len(grams))]
+    similarity = sum(_dice(grams[i], grams[j]) for i, j in pairs) / len(pairs)
+    # 제목 유사도 0.4 이상이면 같은 내용을 보도한 것으로 보고 불일치 0
+    disagreement = max(0.0, 1.0 - similarity / 0.4)
+    if max(item.get('outlet_count', 1) for item in news_items) >= 3:
+        disagreement *= 0.5
+    return disagreement
+
+
+def route_verification(rumor_text: str, news_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """검증 단계(tier)와 난이도 신호"""
+    signals = {
+        "documents": round(_document_score(news_items), 3),
+        "disagreement": round(_disagreement(news_items), 3),
+        "query_type": query_type(rumor_text),
+    }
+    score = (
+        DOCUMENT_WEIGHT * signals["documents"]
+        + DISAGREEMENT_WEIGHT * signals["disagreement"]
+        + QUERY_WEIGHT * QUERY_TYPE_SCORES[signals["query_type"]]
+    )
+    if not ROUTING_ENABLED or score >= ROUTING_HARD_MIN_SCORE:
+        tier = DEEP
+    elif score < ROUTING_EASY_MAX_SCORE:
+        tier = FAST
+    else:
+        tier = STANDARD
+    return {"tier": tier, "difficulty": round(score, 3), "signals": signals}
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """추정 비용 (USD)"""
+    input_price, output_price = MODEL_COSTS.get(model, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class TierStats:
+    """단계별 호출 수, 지연, 토큰, 추정 비용"""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        """초기화"""
+        self._lock = threading.Lock()
+        self._window = window
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, tier: str, seconds: float, input_tokens: int, output_tokens: int, cost: float) -> None:
+        """검증 1회 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(tier, {
+                "calls": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0,
+                "latencies": deque(maxlen=self._window),
+            })
+            stats["calls"] += 1
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+            stats["cost_usd"] += cost
+            stats["latencies"].append(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """/health 노출용 단계별 통계 (지연 ms)"""
+        with self._lock:
+            stats = {tier: dict(values, latencies=sorted(values["latencies"])) for tier, values in self._stats.items()}
+        result = {}
+        for tier in TIERS:
+            if tier not in stats:
+                continue
+            values = stats[tier]
+            latencies = values.pop("latencies")
+            result[tier] = dict(
+                values,
+                model=TIER_MODELS[tier],
+                cost_usd=round(values["cost_usd"], 6),
+                avg_cost_usd=round(values["cost_usd"] / values["calls"], 6),
+                p50_ms=round(latencies[min(int(len(latencies) * 0.50), len(latencies) - 1)] * 1000, 1),
+                p95_ms=round(latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1000, 1),
+            )
+        return result
+
+
+tier_stats = TierStats()
+
+
+def record_verification(tier: str, seconds: float, calls: List[tuple]) -> Dict[str, Any]:
+    """검증 1회 기록 (calls: 이번 검증의 LLM 호출별 (모델, 프롬프트, 응답)), 토큰/추정 비용 반환"""
+    input_tokens = output_tokens = 0
+    cost = 0.0
+    for model, prompt, response in calls:
+        call_input, call_output = estimate_tokens(prompt), estimate_tokens(response)
+        input_tokens += call_input
+        output_tokens += call_output
+        cost += estimate_cost(model, call_input, call_output)
+    tier_stats.record(tier, seconds, input_tokens, output_tokens, cost)
+    return {"input_tokens": input_tokens, "output_tokens": output_tokens, "estimated_cost_usd": round(cost, 6)}
+
+
+def routing_stats() -> Dict[str, Dict[str, Any]]:
+    """단계별 호출 수, 지연(p50/p95), 토큰, 추정 비용"""
+    return tier_stats.snapshot()
@@ -0,0 +1,106 @@
+"""
+뉴스 유사 중복 클러스터링 모듈
+여러 매체가 같은 통신사 기사를 재송출한 경우를 MinHash LSH로 묶어 대표 기사만 남김
+"""
+
+import re
+import zlib
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+SHINGLE_SIZE = 3
+NUM_BINS = 32        # one-permutation MinHash 서명 길이
+ROWS_PER_BAND = 4    # LSH 밴드당 행 수 (8밴드 → 자카드 약 0.6 이상이 후보가 될 확률이 높음)
+SIMILARITY_THRESHOLD = 0.5
+
+
+def minhash_signature(text: str) -> List[Optional[int]]:
+    """공백/기호를 제거한 문자 3-gram 기반 one-permutation MinHash 서명
+
+    shingle 해시 한 번으로 NUM_BINS 개 구간의 최솟값을 구하므로 shingle 수에 선형입니다.
+    비어 있는 구간은 None 입니다.
+    """
+    compact = _NON_WORD_RE.sub('', text.lower())
+    signature: List[Optional[int]] = [None] * NUM_BINS
+    for i in range(max(len(compact) - SHINGLE_SIZE + 1, 1)):
+        h = zlib.crc32(compact[i:i + SHINGLE_SIZE].encode('utf-8'))
+        bin_index, value = h % NUM_BINS, h // NUM_BINS
+        current = signature[bin_index]
+        if current is None or value < current:
+            signature[bin_index] = value
+    return signature
+
+
+def estimate_similarity(a: List[Optional[int]], b: List[Optional[int]]) -> float:
+    """두 서명의 자카드 유사도 추정치"""
+    compared = matched = 0
+    for x, y in zip(a, b):
+        if x is None and y is None:
+            continue
+        compared += 1
+        matched += x == y
+    return matched / compared if compared else 0.0
+
+
+def _outlet(item: Dict) -> str:
+    """매체 식별자 (원문 링크의 호스트)"""
+    link = item.get('original_link') or item.get('originallink') or item.get('link', '')
+    return urlparse(link).netloc or link
+
+
+def cluster_near_duplicates(news_items: List[Dict], threshold: float = SIMILARITY_THRESHOLD) -> List[Dict]:
+    """유사 중복 기사를 묶어 클러스터별 대표 기사 목록 반환
+
+    LSH 밴드 버킷마다 처음 들어온 기사 하나만 두고 새 기사는 그 기사와만 비교하므로,
+    한 기사가 수백 매체에 재송출되어도 아이템 수에 대해 선형 시간(기사당 최대 밴드 수만큼 비교)에 동작합니다.
+    대표 기사는 클러스터에서 가장 먼저 나온 기사이며, 다음 필드가 추가됩니다.
+    - outlet_count: 같은 기사를 보도한 매체 수
+    - duplicate_links: 대표 기사 외 중복 기사 링크
+
+    Args:
+        news_items: 정규화된 뉴스 레코드 목록 (title, description, link)
+        threshold: 같은 기사로 볼 최소 자카드 유사도 추정치
+    """
+    # 본문이 완전히 같은 기사는 서명을 재사용
+    signature_cache: Dict[str, List[Optional[int]]] = {}
+    signatures = []
+    for item in news_items:
+        text = f"{item.get('title', '')} {item.get('description', '')}"
+        if text not in signature_cache:
+            signature_cache[text] = minhash_signature(text)
+        signatures.append(signature_cache[text])
+
+    parent = list(range(len(news_items)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: Dict[tuple, int] = {}  # 밴드 키 → 그 키로 처음 들어온 기사
+    for i, signature in enumerate(signatures):
+        for start in range(0, NUM_BINS, ROWS_PER_BAND):
+            key = (start, *signature[start:start + ROWS_PER_BAND])
+            j = buckets.setdefault(key, i)
+            if j == i:
+                continue
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j and estimate_similarity(signature, signatures[j]) >= threshold:
+                # 먼저 나온 기사를 대표로 유지
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(news_items)):
+        clusters.setdefault(find(i), []).append(i)
+
+    representatives = []
+    for root in sorted(clusters):
+        members = clusters[root]
+        representative = dict(news_items[root])
+        representative['outlet_count'] = len({_outlet(news_items[i]) for i in members})
+        representative['duplicate_links'] = [news_items[i].get('link', '') for i in members if i != root]
+        representatives.append(representative)
+    return representatives
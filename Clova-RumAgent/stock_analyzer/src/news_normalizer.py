@@ -0,0 +1,70 @@
+"""
+뉴스 아이템 일괄 정규화 모듈
+네이버 뉴스 API 아이템의 HTML 태그/엔티티 제거와 pubDate 포맷팅을 빠르게 처리
+"""
+
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Dict, Iterable, List
+
+from dateutil import parser
+
+# 미리 컴파일한 패턴
+_TAG_RE = re.compile(r'<[^>]+>')
+_TIME_RE = re.compile(r'^\d{2}:\d{2}')
+
+# RFC-822 월 약어 (로케일과 무관하게 처리)
+_MONTHS = {
+    "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04", "May": "05", "Jun": "06",
+    "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
+}
+
+
+def clean_text(text: str) -> str:
+    """HTML 태그 제거 후 엔티티(&quot; 등) 디코딩"""
+    if not text:
+        return ""
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+    if '&' in text:
+        text = unescape(text)
+    return text.strip()
+
+
+@lru_cache(maxsize=4096)
+def format_pub_date(date_str: str) -> str:
+    """pubDate를 'YYYY-MM-DD HH:MM' 으로 변환
+
+    네이버 pubDate 고정 형식("Wed, 01 Oct 2025 16:54:00 +0900")은 문자열 분해로 처리하고,
+    그 외 형식만 dateutil 로 파싱합니다. 같은 시각의 기사가 많아 결과를 메모이즈합니다.
+    """
+    if not date_str:
+        return ""
+    parts = date_str.split()
+    if len(parts) == 6 and parts[2] in _MONTHS and _TIME_RE.match(parts[4]):
+        day, month, year, time_str = parts[1], _MONTHS[parts[2]], parts[3], parts[4]
+        if day.isdigit() and year.isdigit():
+            return f"{year}-{month}-{day.zfill(2)} {time_str[:5]}"
+    try:
+        return parser.parse(date_str).strftime("%Y-%m-%d %H:%M")
+    except (ValueError, OverflowError):
+        return date_str
+
+
+def normalize_news_item(item: Dict) -> Dict:
+    """뉴스 아이템 하나를 정규화된 레코드로 변환"""
+    pub_date = item.get('pubDate', '')
+    return {
+        'title': clean_text(item.get('title', '')),
+        'description': clean_text(item.get('description', '')),
+        'link': item.get('link', ''),
+        'original_link': item.get('originallink', ''),
+        'pub_date': pub_date,
+        'formatted_date': format_pub_date(pub_date)
+    }
+
+
+def normalize_news_items(items: Iterable[Dict]) -> List[Dict]:
+    """뉴스 아이템 목록 일괄 정규화"""
+    return [normalize_news_item(item) for item in items]
@@ -0,0 +1,247 @@
+"""
+관심 종목 뉴스 사전 수집 모듈
+PREFETCH_WATCHLIST 종목의 뉴스를 주기적으로 검색/정규화/유사 중복 제거하고 기사별 신뢰성 요약을 미리 계산해 둡니다.
+관심 종목 검증 요청은 네트워크 검색과 뉴스별 분석 호출 없이 최종 판정 호출만 합니다.
+여러 워커가 떠 있으면 파일 잠금을 잡은 워커 하나(리더)만 갱신하고, 나머지 워커는 공유 파일에서 다이제스트를 읽습니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config.settings import (
+    PREFETCH_INTERVAL_SECONDS,
+    PREFETCH_MAX_AGE_SECONDS,
+    PREFETCH_NEWS_COUNT,
+    PREFETCH_SHARED_PATH,
+    PREFETCH_STOP_TIMEOUT_SECONDS,
+    PREFETCH_WATCHLIST,
+)
+from src.news_dedup import cluster_near_duplicates
+from src.news_normalizer import normalize_news_items
+from src.result_storage import atomic_write_json
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl 미지원 환경 (모든 워커가 각자 갱신)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _company_key(name: str) -> str:
+    """종목명 비교 키 (대소문자/공백/기호 무시)"""
+    return _NON_WORD_RE.sub('', name.lower())
+
+
+class NewsPrefetcher:
+    """관심 종목 뉴스 다이제스트 (정리된 뉴스 + 기사별 신뢰성 요약) 주기 갱신"""
+
+    def __init__(
+        self,
+        news_searcher,
+        ai_analyzer,
+        watchlist: List[str] = PREFETCH_WATCHLIST,
+        interval: float = PREFETCH_INTERVAL_SECONDS,
+        shared_path: Optional[str] = PREFETCH_SHARED_PATH
+    ):
+        """초기화 (shared_path 가 None 이면 워커 간 공유 없이 이 프로세스에서만 갱신)"""
+        self.news_searcher = news_searcher
+        self.ai_analyzer = ai_analyzer
+        self.watchlist = list(watchlist)
+        self.interval = interval
+        self.shared_path = Path(shared_path) if shared_path else None
+        self._digests: Dict[str, Dict[str, Any]] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._leader_file = None  # 리더 잠금을 잡고 있는 파일 (프로세스가 끝나면 OS 가 잠금 해제)
+        self._loaded_mtime: Optional[int] = None
+        if self.shared_path:
+            self.shared_path.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def is_leader(self) -> bool:
+        """이 프로세스가 갱신을 맡는지 여부"""
+        return self.shared_path is None or fcntl is None or self._leader_file is not None
+
+    def _try_become_leader(self) -> bool:
+        """리더 잠금을 기다리지 않고 시도 (이미 리더면 True)"""
+        if self.is_leader:
+            return True
+        lock_file = open(f"{self.shared_path}.lock", 'a')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._leader_file = lock_file
+        logger.info("뉴스 사전 수집 리더로 선출됨 (이 워커가 갱신)")
+        return True
+
+    def _release_leadership(self) -> None:
+        if self._leader_file is not None:
+            self._leader_file.close()
+            self._leader_file = None
+
+    def _save_shared(self) -> None:
+        """리더의 다이제스트를 공유 파일에 저장"""
+        if self.shared_path is None:
+            return
+        with self._lock:
+            data = {"digests": dict(self._digests), "errors": dict(self._errors)}
+        atomic_write_json(self.shared_path, data)
+
+    def _load_shared(self, force: bool = False) -> None:
+        """리더가 아니면 공유 파일이 바뀌었을 때만 다시 읽음 (force: 리더로 넘겨받을 때 한 번 읽음)"""
+        if self.shared_path is None or (self.is_leader and not force):
+            return
+        try:
+            mtime = os.stat(self.shared_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        try:
+            with open(self.shared_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"공유 뉴스 다이제스트 로드 실패: {e}")
+            return
+        with self._lock:
+            self._digests = data.get("digests", {})
+            self._errors = data.get("errors", {})
+            self._loaded_mtime = mtime
+
+    def refresh(self, company: str) -> Dict[str, Any]:
+        """종목 하나의 다이제스트 갱신 (이전 갱신에서 요약한 기사는 다시 요약하지 않음)"""
+        started = time.perf_counter()
+        results = self.news_searcher.recent_stock_news(company, display=PREFETCH_NEWS_COUNT, use_corpus=False)
+        items = cluster_near_duplicates(normalize_news_items(results.get('items', [])))
+        search_seconds = time.perf_counter() - started
+
+        previous = self.get_digest(company, max_age=None)
+        summaries = dict(previous["summaries"]) if previous else {}
+        new_items = [item for item in items if not summaries.get(item['link'])]
+        if new_items:
+            for item, summary in zip(new_items, self.ai_analyzer.summarize_articles(new_items)):
+                if summary:
+                    summaries[item['link']] = summary
+        # 더 이상 검색되지 않는 기사의 요약은 버림
+        links = {item['link'] for item in items}
+        summaries = {link: summary for link, summary in summaries.items() if link in links}
+
+        digest = {
+            "company": company,
+            "items": items,
+            "summaries": summaries,
+            "fetched_at": time.time(),
+            "search_ms": round(search_seconds * 1000, 1),
+            "summarize_ms": round((time.perf_counter() - started - search_seconds) * 1000, 1),
+            "new_items": len(new_items),
+        }
+        with self._lock:
+            self._digests[_company_key(company)] = digest
+            self._errors.pop(company, None)
+        logger.info(
+            f"📥 {company} 뉴스 사전 수집: {len(items)}건 (신규 요약 {len(new_items)}건), "
+            f"검색 {digest['search_ms']}ms, 요약 {digest['summarize_ms']}ms"
+        )
+        return digest
+
+    def refresh_all(self) -> None:
+        """관심 종목 전체 갱신 (종목별 실패는 기록만 하고 계속, 종목마다 공유 파일에 반영)"""
+        for company in self.watchlist:
+            if self._stop.is_set():
+                return
+            try:
+                self.refresh(company)
+            except Exception as e:
+                logger.warning(f"{company} 뉴스 사전 수집 실패: {e}")
+                with self._lock:
+                    self._errors[company] = str(e)
+            try:
+                self._save_shared()
+            except OSError as e:
+                logger.warning(f"공유 뉴스 다이제스트 저장 실패: {e}")
+
+    def _run(self) -> None:
+        # 리더가 아니면 주기마다 리더 잠금만 다시 시도 (리더 워커가 종료되면 넘겨받음)
+        took_over = False
+        try:
+            while not self._stop.is_set():
+                if self._try_become_leader():
+                    if not took_over:
+                        # 이전 리더가 요약한 기사를 다시 요약하지 않도록 마지막 공유 결과에서 시작
+                        self._load_shared(force=True)
+                        took_over = True
+                    self.refresh_all()
+                self._stop.wait(self.interval)
+        finally:
+            # 마지막 저장까지 끝난 뒤에만 잠금을 놓아 다음 리더와 동시에 쓰지 않게 함
+            self._release_leadership()
+
+    def start(self) -> None:
+        """백그라운드 갱신 스레드 시작"""
+        if self._thread is not None or not self.watchlist:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="news-prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = PREFETCH_STOP_TIMEOUT_SECONDS) -> None:
+        """백그라운드 갱신 중지
+
+        진행 중인 갱신이 끝날 때까지 timeout 초 기다립니다. 리더 잠금은 갱신 스레드가 끝나면서 놓으며,
+        그 안에 끝나지 않으면 잠금을 쥔 채로 두어 (스레드 종료나 프로세스 종료 시 해제) 다른 워커와 동시에 쓰지 않습니다.
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"뉴스 사전 수집 스레드가 {timeout}초 안에 끝나지 않음 (종료 후 리더 잠금 해제)")
+
+    def get_digest(self, company: str, max_age: Optional[float] = PREFETCH_MAX_AGE_SECONDS) -> Optional[Dict[str, Any]]:
+        """사전 수집된 다이제스트 (관심 종목이 아니거나 max_age 초보다 오래되었으면 None)"""
+        self._load_shared()
+        with self._lock:
+            digest = self._digests.get(_company_key(company))
+        if digest is None:
+            return None
+        if max_age is not None and time.time() - digest["fetched_at"] > max_age:
+            return None
+        return digest
+
+    def status(self) -> Dict[str, Any]:
+        """/health 노출용 종목별 갱신 상태"""
+        self._load_shared()
+        with self._lock:
+            digests = dict(self._digests)
+            errors = dict(self._errors)
+        return {
+            "watchlist": self.watchlist,
+            "interval_seconds": self.interval,
+            "role": "leader" if self.is_leader else "follower",
+            "companies": {
+                digest["company"]: {
+                    "items": len(digest["items"]),
+                    "summaries": len(digest["summaries"]),
+                    "fetched_at": datetime.fromtimestamp(digest["fetched_at"]).isoformat(),
+                    "search_ms": digest["search_ms"],
+                    "summarize_ms": digest["summarize_ms"],
+                }
+                for digest in digests.values()
+            },
+            "errors": errors,
+        }
@@ -2,18 +2,23 @@
 네이버 뉴스 검색 모듈
 """
 
-import requests
+import logging
 import urllib.parse
-import re
-from datetime import datetime
-from typing import Dict, List
-from dateutil import parser
+from typing import Dict, List, Optional
+
+import requests
 
+from src.news_corpus import get_news_corpus, ingest
+from src.news_store import get_news_store
+from src.resilience import ProviderError, get_resilient_client
+from src.news_normalizer import clean_text, format_pub_date, normalize_news_item, normalize_news_items
 from config.settings import (
     NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, NAVER_NEWS_API_URL,
     DEFAULT_DISPLAY, DEFAULT_SORT
 )
 
+logger = logging.getLogger(__name__)
+
 
 class NewsSearcher:
     """네이버 뉴스 검색 클래스"""
@@ -33,7 +38,7 @@ class NewsSearcher:
         start: int = 1, 
         sort: str = DEFAULT_SORT
     ) -> Dict:
-        """뉴스 검색"""
+        """뉴스 검색 (타임아웃/재시도/서킷 브레이커 적용, 실패 시 ProviderError)"""
         encoded_query = urllib.parse.quote(query)
         url = f"{NAVER_NEWS_API_URL}?query={encoded_query}&display={display}&start={start}&sort={sort}"
         
@@ -44,16 +49,50 @@ class NewsSearcher:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = get_resilient_client("naver_news").request("GET", url, headers=headers)
             response.raise_for_status()
-            return response.json()
+            results = response.json()
         except requests.exceptions.RequestException as e:
-            raise Exception(f"뉴스 검색 중 오류 발생: {e}")
+            raise ProviderError("naver_news", f"뉴스 검색 중 오류 발생: {e}")
+        # 받은 기사는 모두 로컬 코퍼스에 색인
+        ingest(results)
+        return results
+
+    def _search_local(self, keyword: str, display: int, sort: str, start: int = 1) -> Optional[Dict]:
+        """로컬 코퍼스 검색 (시간 창 안의 기사가 부족하면 None)"""
+        corpus = get_news_corpus()
+        items = corpus.search(keyword, display + start - 1, sort) if corpus else None
+        if items is None:
+            return None
+        logger.info(f"🗃️ '{keyword}' 로컬 코퍼스 응답 ({display}건, 네이버 호출 생략)")
+        return {"items": items[start - 1:]}
+
+    def search_stock_news(self, stock_name: str, display: int = DEFAULT_DISPLAY, sort: str = DEFAULT_SORT, start: int = 1) -> Dict:
+        """주식 종목 뉴스 검색 (로컬 코퍼스에 시간 창 안의 기사가 충분하면 네이버 호출 생략)"""
+        local = self._search_local(stock_name, display, sort, start)
+        if local is not None:
+            return local
+        search_query = f"{stock_name} 주식"
+        return self.search_news(search_query, display, start=start, sort=sort)
+
+    def recent_stock_news(self, stock_name: str, display: int = DEFAULT_DISPLAY, use_corpus: bool = True) -> Dict:
+        """주식 종목 최신 뉴스
 
-    def search_stock_news(self, stock_name: str, display: int = DEFAULT_DISPLAY, sort: str = DEFAULT_SORT) -> Dict:
-        """주식 종목 뉴스 검색"""
+        로컬 코퍼스로 응답할 수 없으면 누적 뉴스 저장소에서 새 기사만 증분으로 받아 최신순 반환합니다.
+        주기적으로 새 기사를 받아야 하는 사전 수집은 use_corpus=False 로 호출합니다.
+        """
+        local = self._search_local(stock_name, display, "date") if use_corpus else None
+        if local is not None:
+            return local
         search_query = f"{stock_name} 주식"
-        return self.search_news(search_query, display, sort=sort)
+        store = get_news_store()
+        if store is None:
+            return self.search_news(search_query, display, sort="date")
+        return store.recent(
+            search_query,
+            lambda start, size: self.search_news(search_query, size, start=start, sort="date"),
+            display
+        )
 
     def search_market_news(self, display: int = 30) -> Dict:
         """전체 주식 시장 뉴스 검색"""
@@ -62,31 +101,20 @@ class NewsSearcher:
 
     @staticmethod
     def clean_html_tags(text: str) -> str:
-        """HTML 태그 제거"""
-        if not text:
-            return ""
-        cleaned = re.sub(r'<[^>]+>', '', text)
-        return cleaned.strip()
+        """HTML 태그 및 엔티티 제거"""
+        return clean_text(text)
 
     @staticmethod
     def format_news_item(item: Dict) -> Dict:
         """뉴스 아이템 포맷팅"""
-        return {
-            'title': NewsSearcher.clean_html_tags(item.get('title', '')),
-            'description': NewsSearcher.clean_html_tags(item.get('description', '')),
-            'link': item.get('link', ''),
-            'original_link': item.get('originallink', ''),
-            'pub_date': item.get('pubDate', ''),
-            'formatted_date': NewsSearcher.format_date(item.get('pubDate', ''))
-        }
+        return normalize_news_item(item)
+
+    @staticmethod
+    def format_news_items(items: List[Dict]) -> List[Dict]:
+        """뉴스 아이템 목록 일괄 포맷팅"""
+        return normalize_news_items(items)
 
     @staticmethod
     def format_date(date_str: str) -> str:
         """날짜 포맷팅"""
-        if not date_str:
-            return ""
-        try:
-            dt = parser.parse(date_str)
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            return date_str
\ No newline at end of file
+        return format_pub_date(date_str)
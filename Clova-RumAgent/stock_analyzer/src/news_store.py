@@ -0,0 +1,200 @@
+"""
+검색어별 누적 뉴스 저장소 모듈
+검색어마다 네이버 뉴스를 sort=date 로 가져와 SQLite 에 누적하고, 다음 동기화 때는 마지막으로 본 기사(워터마크:
+링크/발행 시각)에 닿을 때까지만 가져옵니다. 반복되는 전체 검색이 새 기사만 받는 작은 증분 요청으로 바뀝니다.
+보관 기간(NEWS_STORE_MAX_AGE_DAYS)이 지난 기사는 동기화할 때 삭제합니다 (검색어별 최신 NEWS_STORE_KEEP_LATEST 건은 유지).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import (
+    MAX_DISPLAY,
+    NEWS_STORE_ENABLED,
+    NEWS_STORE_KEEP_LATEST,
+    NEWS_STORE_MAX_AGE_DAYS,
+    NEWS_STORE_MAX_PAGES,
+    NEWS_STORE_MIN_POLL_SECONDS,
+    NEWS_STORE_PATH,
+    NEWS_STORE_POLL_DISPLAY,
+)
+
+logger = logging.getLogger(__name__)
+
+# 네이버 검색 start 파라미터 최대값
+MAX_START = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_items (
+    key TEXT NOT NULL,
+    link TEXT NOT NULL,
+    pub_ts REAL NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (key, link)
+);
+CREATE INDEX IF NOT EXISTS news_items_recent ON news_items (key, pub_ts DESC);
+CREATE TABLE IF NOT EXISTS watermarks (
+    key TEXT PRIMARY KEY,
+    link TEXT,
+    pub_ts REAL,
+    synced_at REAL NOT NULL
+);
+"""
+
+# fetch_page(start, display) → 네이버 뉴스 API 응답 (dict, 'items' 포함)
+FetchPage = Callable[[int, int], Dict[str, Any]]
+
+
+def pub_timestamp(item: Dict[str, Any]) -> float:
+    """pubDate 를 epoch 초로 (파싱 실패 시 0)"""
+    try:
+        return parsedate_to_datetime(item.get('pubDate', '')).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class NewsStore:
+    """워터마크 기반 증분 동기화 뉴스 저장소 (항목은 네이버 API 원본 아이템)"""
+
+    def __init__(self, path: str = NEWS_STORE_PATH, max_age_days: int = NEWS_STORE_MAX_AGE_DAYS):
+        """초기화"""
+        self.path = path
+        self.max_age = max_age_days * 24 * 3600
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {"syncs": 0, "skipped_syncs": 0, "requests": 0, "fetched": 0, "added": 0, "evicted": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        """호출마다 새 연결 (요청이 여러 스레드에서 처리됨)"""
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _count(self, **values: int) -> None:
+        with self._lock:
+            for name, value in values.items():
+                self._stats[name] += value
+
+    def _watermark(self, conn, key: str) -> Optional[tuple]:
+        return conn.execute("SELECT link, pub_ts, synced_at FROM watermarks WHERE key=?", (key,)).fetchone()
+
+    def sync(self, key: str, fetch_page: FetchPage, min_interval: float = NEWS_STORE_MIN_POLL_SECONDS) -> int:
+        """워터마크까지 새 기사만 가져와 저장 (추가된 기사 수 반환)
+
+        처음 동기화하는 검색어는 한 페이지(MAX_DISPLAY)만 가져오고, 이후에는 NEWS_STORE_POLL_DISPLAY 건부터
+        워터마크(마지막으로 본 링크 또는 그보다 오래된 발행 시각)에 닿을 때까지 페이지를 넘깁니다.
+        """
+        with self._key_lock(key):
+            now = time.time()
+            with closing(self._connect()) as conn:
+                watermark = self._watermark(conn, key)
+            if watermark and now - watermark[2] < min_interval:
+                self._count(skipped_syncs=1)
+                return 0
+
+            new_items: List[tuple] = []
+            start, display = 1, NEWS_STORE_POLL_DISPLAY if watermark else MAX_DISPLAY
+            requests = fetched = 0
+            for _ in range(NEWS_STORE_MAX_PAGES):
+                items = fetch_page(start, display).get('items', [])
+                requests += 1
+                fetched += len(items)
+                reached = False
+                for item in items:
+                    pub_ts = pub_timestamp(item)
+                    if watermark and (item.get('link') == watermark[0] or pub_ts < watermark[1]):
+                        reached = True
+                        break
+                    new_items.append((key, item.get('link', ''), pub_ts, json.dumps(item, ensure_ascii=False)))
+                # 처음 동기화는 한 페이지만, 이후에는 워터마크에 닿거나 결과가 끝날 때까지
+                if reached or not watermark or len(items) < display:
+                    break
+                start += display
+                display = MAX_DISPLAY
+                if start > MAX_START:
+                    break
+
+            with closing(self._connect()) as conn:
+                before = conn.total_changes
+                conn.executemany("INSERT OR IGNORE INTO news_items VALUES (?, ?, ?, ?)", new_items)
+                added = conn.total_changes - before
+                newest = max(new_items, key=lambda row: row[2]) if new_items else None
+                if newest:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)", (key, newest[1], newest[2], now)
+                    )
+                elif watermark:
+                    conn.execute("UPDATE watermarks SET synced_at=? WHERE key=?", (now, key))
+                else:
+                    conn.execute("INSERT OR REPLACE INTO watermarks VALUES (?, NULL, 0, ?)", (key, now))
+                evicted = self._evict(conn, now)
+                conn.commit()
+
+        self._count(syncs=1, requests=requests, fetched=fetched, added=added, evicted=evicted)
+        logger.info(f"🗄️ 뉴스 저장소 '{key}' 동기화: 요청 {requests}회, 수신 {fetched}건, 추가 {added}건, 만료 삭제 {evicted}건")
+        return added
+
+    def _evict(self, conn, now: float) -> int:
+        """보관 기간이 지난 기사 삭제 (검색어별 최신 NEWS_STORE_KEEP_LATEST 건 제외), 삭제 수 반환"""
+        return conn.execute(
+            """
+            DELETE FROM news_items WHERE pub_ts<? AND rowid NOT IN (
+                SELECT latest.rowid FROM news_items AS latest
+                WHERE latest.key=news_items.key ORDER BY latest.pub_ts DESC LIMIT ?
+            )
+            """,
+            (now - self.max_age, NEWS_STORE_KEEP_LATEST)
+        ).rowcount
+
+    def items(self, key: str, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """저장된 기사 최신순"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT item FROM news_items WHERE key=? ORDER BY pub_ts DESC LIMIT ? OFFSET ?",
+                (key, limit, offset)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def recent(self, key: str, fetch_page: FetchPage, limit: int, offset: int = 0) -> Dict[str, Any]:
+        """증분 동기화 후 최신 기사 (네이버 검색 응답과 같은 {'items': [...]} 형식)"""
+        self.sync(key, fetch_page)
+        return {"items": self.items(key, limit, offset)}
+
+    def stats(self) -> Dict[str, Any]:
+        """/health 노출용 동기화 통계 (이 프로세스 기준)와 검색어별 보관 기사 수"""
+        with self._lock:
+            stats = dict(self._stats)
+        with closing(self._connect()) as conn:
+            stats["keys"] = {
+                key: count for key, count in conn.execute("SELECT key, COUNT(*) FROM news_items GROUP BY key")
+            }
+        return stats
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_news_store() -> Optional[NewsStore]:
+    """프로세스 공유 저장소 (NEWS_STORE_ENABLED=false 면 None)"""
+    global _store
+    if not NEWS_STORE_ENABLED:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = NewsStore()
+        return _store
@@ -0,0 +1,81 @@
+"""
+뉴스 관련도 재정렬 모듈
+한국어 문자 n-gram BM25로 후보 뉴스를 루머 내용 기준으로 정렬 (외부 모델/네트워크 호출 없음)
+"""
+
+import math
+from typing import Any, Dict, List, Tuple
+
+
+def _compact(text: str) -> str:
+    """소문자화 후 공백 제거 (한국어 띄어쓰기 차이를 무시)"""
+    return "".join(text.lower().split())
+
+
+class BM25Reranker:
+    """문자 n-gram BM25 재정렬기"""
+
+    def __init__(self, ngram: int = 2, k1: float = 1.2, b: float = 0.75, title_weight: int = 2):
+        """초기화
+
+        Args:
+            ngram: 문자 n-gram 길이 (한국어는 2가 조사/어미 변화에 강함)
+            k1, b: BM25 파라미터
+            title_weight: 제목을 본문보다 가중하기 위해 반복하는 횟수
+        """
+        self.ngram = ngram
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+
+    def _query_terms(self, query: str) -> List[str]:
+        """질의의 고유 n-gram 목록"""
+        compact = _compact(query)
+        return list(dict.fromkeys(compact[i:i + self.ngram] for i in range(len(compact) - self.ngram + 1)))
+
+    def score(self, query: str, news_items: List[Dict[str, Any]]) -> List[float]:
+        """뉴스별 BM25 점수
+
+        질의 n-gram만 문서 문자열에서 직접 세므로(str.count) 문서별 토큰화 비용이 없습니다.
+        """
+        terms = self._query_terms(query)
+        if not terms or not news_items:
+            return [0.0] * len(news_items)
+
+        docs = [
+            _compact(f"{item.get('title', '')} " * self.title_weight + item.get('description', ''))
+            for item in news_items
+        ]
+        lengths = [max(len(doc) - self.ngram + 1, 1) for doc in docs]
+        avg_length = sum(lengths) / len(lengths)
+        counts = [[doc.count(term) for term in terms] for doc in docs]
+
+        n_docs = len(docs)
+        idf = []
+        for t in range(len(terms)):
+            df = sum(1 for row in counts if row[t])
+            idf.append(math.log(1 + (n_docs - df + 0.5) / (df + 0.5)))
+
+        scores = []
+        for row, length in zip(counts, lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+            scores.append(sum(
+                idf[t] * tf * (self.k1 + 1) / (tf + norm)
+                for t, tf in enumerate(row) if tf
+            ))
+        return scores
+
+    def rerank(
+        self,
+        query: str,
+        news_items: List[Dict[str, Any]],
+        top_k: int = None
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """점수 내림차순 (동점이면 최신순) 상위 top_k 반환"""
+        scores = self.score(query, news_items)
+        ranked = sorted(
+            zip(news_items, scores),
+            key=lambda pair: (pair[1], pair[0].get('formatted_date', '')),
+            reverse=True
+        )
+        return ranked[:top_k] if top_k else ranked
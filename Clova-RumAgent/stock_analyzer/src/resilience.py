@@ -0,0 +1,243 @@
+"""
+외부 호출 복원력 모듈
+제공자(provider)별 타임아웃, 지수 백오프(지터) 재시도, 서킷 브레이커를 한 곳에서 적용
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from config.settings import DEFAULT_PROVIDER_POLICY, PROVIDER_POLICIES
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 (일시적 장애/속도 제한)
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+# 여러 번 보내도 결과가 같은 HTTP 메서드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# LLM SDK 예외 중 일시적 장애로 볼 이름 (SDK마다 예외 계층이 달라 이름으로 판별)
+_TRANSIENT_NAME_HINTS = (
+    "timeout", "connection", "ratelimit", "unavailable", "overloaded",
+    "resourceexhausted", "internalserver", "serviceunavailable", "protocolerror",
+)
+
+
+class ProviderError(Exception):
+    """외부 제공자 호출 실패"""
+
+    def __init__(self, provider: str, message: str, retryable: bool = False):
+        super().__init__(f"[{provider}] {message}")
+        self.provider = provider
+        self.retryable = retryable
+
+
+class CircuitOpenError(ProviderError):
+    """서킷 브레이커가 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, provider: str, retry_after: float):
+        super().__init__(provider, f"일시적으로 사용할 수 없습니다 ({retry_after:.0f}초 후 재시도)", retryable=True)
+        self.retry_after = retry_after
+
+
+def is_retryable(error: Exception) -> bool:
+    """일시적 장애(타임아웃, 연결 실패, 5xx, 속도 제한) 여부"""
+    if isinstance(error, ProviderError):
+        return error.retryable
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        return response is not None and response.status_code in RETRYABLE_STATUS
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int) and status in RETRYABLE_STATUS:
+        return True
+    name = type(error).__name__.lower()
+    return any(hint in name for hint in _TRANSIENT_NAME_HINTS)
+
+
+class CircuitBreaker:
+    """연속 실패가 임계치를 넘으면 일정 시간 호출을 막는 서킷 브레이커
+
+    closed → (연속 실패 failure_threshold회) → open → (recovery_timeout 경과) → half_open
+    half_open 에서는 시험 호출 한 건만 허용하고, 성공하면 closed, 실패하면 다시 open 입니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """초기화"""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 이 복구 시간을 넘겼으면 half_open 으로 표시)"""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def retry_after(self) -> float:
+        """다시 호출을 시도할 수 있을 때까지 남은 시간 (초)"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(self.recovery_timeout - (self._clock() - self._opened_at), 0.0)
+
+    def record_success(self) -> None:
+        """호출 성공 (제공자가 응답함)"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Exception = None) -> None:
+        """일시적 장애로 인한 호출 실패"""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if error is not None:
+                self._last_error = f"{type(error).__name__}: {error}"[:200]
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """/health 노출용 상태"""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after(), 1) if state == self.OPEN else 0.0,
+            "last_error": self._last_error,
+        }
+
+
+class ResilientClient:
+    """제공자별 타임아웃/재시도/서킷 브레이커를 적용하는 호출 래퍼"""
+
+    def __init__(
+        self,
+        provider: str,
+        timeout: Any = 10.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """초기화
+
+        Args:
+            provider: 제공자 이름 (로그, /health 표시용)
+            timeout: 요청 타임아웃 (초, HTTP는 (연결, 읽기) 튜플 가능)
+            max_retries: 멱등 호출의 최대 재시도 횟수
+            backoff_base, backoff_max: 지수 백오프 기준/최대 대기 시간 (초)
+            failure_threshold, recovery_timeout: 서킷 브레이커 설정
+        """
+        self.provider = provider
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = CircuitBreaker(failure_threshold, recovery_timeout)
+        self._sleep = sleep
+
+    @property
+    def read_timeout(self) -> float:
+        """LLM 클라이언트에 넘길 단일 타임아웃 값"""
+        return self.timeout[-1] if isinstance(self.timeout, tuple) else self.timeout
+
+    def backoff_delay(self, attempt: int) -> float:
+        """full jitter 지수 백오프 대기 시간"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def call(self, func: Callable, *args, idempotent: bool = True, **kwargs):
+        """func 호출 (멱등 호출만 재시도, 브레이커가 열려 있으면 CircuitOpenError)
+
+        일시적 장애가 재시도 후에도 계속되면 ProviderError(retryable=True)를 발생시킵니다.
+        그 밖의 예외(잘못된 요청, 응답 파싱 실패 등)는 제공자가 응답한 것으로 보고 그대로 전달합니다.
+        """
+        attempts = 1 + (self.max_retries if idempotent else 0)
+        for attempt in range(attempts):
+            if not self.breaker.allow():
+                raise CircuitOpenError(self.provider, self.breaker.retry_after())
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure(e)
+                if attempt + 1 >= attempts:
+                    raise ProviderError(self.provider, f"{type(e).__name__}: {e}", retryable=True) from e
+                delay = self.backoff_delay(attempt)
+                logger.warning(f"[{self.provider}] 호출 실패 ({e}), {delay:.2f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                self._sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """HTTP 요청 (기본 타임아웃 적용, 재시도 대상 상태 코드는 예외로 변환)"""
+        kwargs.setdefault("timeout", self.timeout)
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        def send():
+            response = requests.request(method, url, **kwargs)
+            if response.status_code in RETRYABLE_STATUS:
+                response.close()
+                response.raise_for_status()
+            return response
+
+        return self.call(send, idempotent=idempotent)
+
+
+_clients: Dict[str, ResilientClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_resilient_client(provider: str) -> ResilientClient:
+    """제공자별 공유 클라이언트 (프로세스당 하나, 브레이커 상태 공유)"""
+    with _clients_lock:
+        if provider not in _clients:
+            policy = {**DEFAULT_PROVIDER_POLICY, **PROVIDER_POLICIES.get(provider, {})}
+            _clients[provider] = ResilientClient(provider, **policy)
+        return _clients[provider]
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """사용된 제공자들의 서킷 브레이커 상태"""
+    with _clients_lock:
+        clients = dict(_clients)
+    return {provider: client.breaker.snapshot() for provider, client in sorted(clients.items())}
@@ -3,29 +3,88 @@
 """
 
 import json
+import os
 import uuid
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Any
 from pathlib import Path
 import logging
 
+from config.settings import RUMOR_SIMILAR_MIN_SCORE, RUMOR_SIMILAR_TOP_K
+from src.rumor_index import get_rumor_index
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl 미지원 환경
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def file_lock(lock_path: Path):
+    """프로세스 간 배타적 파일 잠금 (fcntl 미지원 환경에서는 잠금 없이 진행)"""
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def is_successful_verdict(final_result: str) -> bool:
+    """판정 문구가 실제 판정인지 (빈 문자열이나 "❌ ..." 오류 문구가 아님)"""
+    return bool(final_result) and not final_result.lstrip().startswith("❌")
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 저장"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 class ResultStorage:
     """루머 검증 결과 저장 클래스"""
 
     def __init__(self, storage_dir: str = "verification_results"):
         """초기화"""
         self.storage_dir = Path(storage_dir)
-        self.storage_dir.mkdir(exist_ok=True)
-
-        # 날짜별 폴더 생성
-        today = datetime.now().strftime("%Y-%m-%d")
-        self.daily_dir = self.storage_dir / today
-        self.daily_dir.mkdir(exist_ok=True)
-
-        logger.info(f"결과 저장 디렉토리: {self.daily_dir}")
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.storage_dir / "index.json"
+        self.lock_file = self.storage_dir / ".index.lock"
+        self.rumor_index = get_rumor_index()
+
+        logger.info(f"결과 저장 디렉토리: {self.storage_dir}")
+
+    def warm_up(self) -> None:
+        """유사 루머 색인 로드"""
+        if self.rumor_index:
+            self.rumor_index.load()
+
+    def _daily_dir(self, now: datetime) -> Path:
+        """저장 시점 기준 날짜별 폴더 (자정 이후에도 새 날짜 폴더에 저장)"""
+        daily_dir = self.storage_dir / now.strftime("%Y-%m-%d")
+        daily_dir.mkdir(exist_ok=True)
+        return daily_dir
+
+    def _load_index(self) -> Dict[str, Any]:
+        """인덱스 파일 로드 (원자적 교체로 저장되므로 잠금 없이 읽기 가능)"""
+        if not self.index_file.exists():
+            return {"verifications": []}
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
 
     def save_verification_result(
         self,
@@ -35,13 +94,15 @@ class ResultStorage:
         news_data: List[Dict[str, Any]],
         analysis_details: str,
         final_result: str,
-        status: str
+        status: str,
+        metadata: Dict[str, Any] = None
     ) -> str:
-        """루머 검증 결과 저장"""
+        """루머 검증 결과 저장 (metadata는 기본 메타데이터에 병합)"""
         try:
             # 고유 ID 생성
             verification_id = str(uuid.uuid4())[:8]
-            timestamp = datetime.now().isoformat()
+            now = datetime.now()
+            timestamp = now.isoformat()
 
             # 저장할 데이터 구조
             result_data = {
@@ -58,22 +119,29 @@ class ResultStorage:
                 "status": status,
                 "metadata": {
                     "total_news_found": len(news_data),
-                    "processing_time": timestamp
+                    "processing_time": timestamp,
+                    **(metadata or {})
                 }
             }
 
             # 파일명 생성 (회사명_시간_ID.json)
             safe_company_name = "".join(c for c in company_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            time_str = datetime.now().strftime("%H%M%S")
+            time_str = now.strftime("%H%M%S")
             filename = f"{safe_company_name}_{time_str}_{verification_id}.json"
 
-            # 파일 저장
-            file_path = self.daily_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, ensure_ascii=False, indent=2)
+            # 파일 저장 (저장 시점의 날짜 폴더)
+            file_path = self._daily_dir(now) / filename
+            atomic_write_json(file_path, result_data)
 
             # 인덱스 파일 업데이트
-            self._update_index(verification_id, rumor_text, company_name, timestamp, filename)
+            self._update_index(verification_id, rumor_text, company_name, timestamp, filename, now)
+
+            # 성공한 검증만 유사 루머 색인에 추가 (실패한 검증은 status="error" 로 기록만)
+            if status == "success" and is_successful_verdict(final_result) and self.rumor_index:
+                try:
+                    self.rumor_index.add(verification_id, company_name, rumor_text, final_result, news_count)
+                except Exception as e:
+                    logger.error(f"유사 루머 색인 추가 중 오류: {e}")
 
             logger.info(f"결과 저장 완료: {file_path}")
             return str(file_path)
@@ -82,36 +150,36 @@ class ResultStorage:
             logger.error(f"결과 저장 중 오류: {e}")
             return ""
 
-    def _update_index(self, verification_id: str, rumor_text: str, company_name: str, timestamp: str, filename: str):
-        """인덱스 파일 업데이트 (검색용)"""
+    def _update_index(
+        self,
+        verification_id: str,
+        rumor_text: str,
+        company_name: str,
+        timestamp: str,
+        filename: str,
+        now: datetime
+    ):
+        """인덱스 파일 업데이트 (검색용, 여러 워커 프로세스에서 동시에 호출 가능)"""
         try:
-            index_file = self.storage_dir / "index.json"
-
-            # 기존 인덱스 로드
-            if index_file.exists():
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    index_data = json.load(f)
-            else:
-                index_data = {"verifications": []}
-
-            # 새 항목 추가
+            # 새 항목
             index_entry = {
                 "id": verification_id,
                 "timestamp": timestamp,
                 "rumor_text": rumor_text[:100] + "..." if len(rumor_text) > 100 else rumor_text,
                 "company_name": company_name,
                 "filename": filename,
-                "date": datetime.now().strftime("%Y-%m-%d")
+                "date": now.strftime("%Y-%m-%d")
             }
 
-            index_data["verifications"].append(index_entry)
+            # 읽기-수정-쓰기 구간을 프로세스 간 잠금으로 보호
+            with file_lock(self.lock_file):
+                index_data = self._load_index()
+                index_data["verifications"].append(index_entry)
 
-            # 최근 100개만 유지
-            index_data["verifications"] = index_data["verifications"][-100:]
+                # 최근 100개만 유지
+                index_data["verifications"] = index_data["verifications"][-100:]
 
-            # 인덱스 파일 저장
-            with open(index_file, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, ensure_ascii=False, indent=2)
+                atomic_write_json(self.index_file, index_data)
 
         except Exception as e:
             logger.error(f"인덱스 업데이트 중 오류: {e}")
@@ -119,13 +187,7 @@ class ResultStorage:
     def get_recent_verifications(self, limit: int = 10) -> List[Dict[str, Any]]:
         """최근 검증 결과 목록 조회"""
         try:
-            index_file = self.storage_dir / "index.json"
-
-            if not index_file.exists():
-                return []
-
-            with open(index_file, 'r', encoding='utf-8') as f:
-                index_data = json.load(f)
+            index_data = self._load_index()
 
             # 최근 순으로 정렬하여 반환
             recent = sorted(
@@ -144,13 +206,7 @@ class ResultStorage:
         """ID로 특정 검증 결과 조회"""
         try:
             # 인덱스에서 파일명 찾기
-            index_file = self.storage_dir / "index.json"
-
-            if not index_file.exists():
-                return {}
-
-            with open(index_file, 'r', encoding='utf-8') as f:
-                index_data = json.load(f)
+            index_data = self._load_index()
 
             for verification in index_data.get("verifications", []):
                 if verification["id"] == verification_id:
@@ -171,13 +227,7 @@ class ResultStorage:
     def search_verifications(self, company_name: str = None, keyword: str = None) -> List[Dict[str, Any]]:
         """회사명이나 키워드로 검색"""
         try:
-            index_file = self.storage_dir / "index.json"
-
-            if not index_file.exists():
-                return []
-
-            with open(index_file, 'r', encoding='utf-8') as f:
-                index_data = json.load(f)
+            index_data = self._load_index()
 
             results = []
             for verification in index_data.get("verifications", []):
@@ -197,4 +247,22 @@ class ResultStorage:
 
         except Exception as e:
             logger.error(f"검증 결과 검색 중 오류: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def find_similar_verifications(
+        self,
+        company_name: str,
+        rumor_text: str,
+        limit: int = RUMOR_SIMILAR_TOP_K,
+        min_score: float = RUMOR_SIMILAR_MIN_SCORE
+    ) -> List[Dict[str, Any]]:
+        """같은 회사의 유사 루머 검증 결과 (유사도 높은 순, 색인이 꺼져 있으면 빈 목록)"""
+        if not self.rumor_index:
+            return []
+        try:
+            similar = self.rumor_index.similar(company_name, rumor_text, top_k=limit, min_score=min_score)
+        except Exception as e:
+            logger.error(f"유사 루머 검색 중 오류: {e}")
+            return []
+        # 오류 문구가 판정으로 저장되던 이전 버전의 항목 제외
+        return [entry for entry in similar if is_successful_verdict(entry["final_result"])]
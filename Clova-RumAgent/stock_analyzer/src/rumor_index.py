@@ -0,0 +1,225 @@
+"""
+유사 루머 색인 모듈
+저장된 검증 결과의 rumor_text 를 해시 문자 n-gram(단어별 2~3자) TF-IDF 벡터로 만들어 종목별 NumPy 행렬에 쌓고,
+새 루머와 코사인 유사도가 높은 과거 검증을 찾습니다 (외부 임베딩 모델 없음).
+검증 결과는 SQLite(RUMOR_INDEX_PATH)에 기록하고, 각 프로세스는 조회할 때(최대 1초 간격) 다른 워커가 추가한 행을 이어서 색인합니다.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import RUMOR_INDEX_DIMS, RUMOR_INDEX_ENABLED, RUMOR_INDEX_PATH
+
+NGRAM_SIZES = (2, 3)
+INITIAL_CAPACITY = 64
+# 조회 때 다른 워커가 추가한 루머를 확인하는 최소 간격 (초)
+CATCH_UP_INTERVAL = 1.0
+# 전체 문서 수가 마지막 가중치 계산 때의 이 배수가 되면 저장된 벡터의 IDF 가중치를 다시 계산
+REWEIGHT_GROWTH = 2.0
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+_WORD_RE = re.compile(r'[0-9a-z가-힣]+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rumors (
+    id INTEGER PRIMARY KEY,
+    verification_id TEXT NOT NULL,
+    company_key TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    rumor_text TEXT NOT NULL,
+    final_result TEXT NOT NULL,
+    news_count INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def company_key(name: str) -> str:
+    """종목명 비교 키 (대소문자/공백/기호 무시)"""
+    return _NON_WORD_RE.sub('', name.lower())
+
+
+def term_counts(text: str, dims: int = RUMOR_INDEX_DIMS) -> np.ndarray:
+    """단어별 문자 n-gram 을 dims 차원으로 해시한 로그 빈도 벡터 (단어 경계를 넘는 n-gram 은 띄어쓰기에 따라 달라져 제외)"""
+    counts = np.zeros(dims, dtype=np.float32)
+    for word in _WORD_RE.findall(text.lower()):
+        for size in NGRAM_SIZES:
+            for i in range(len(word) - size + 1):
+                counts[zlib.crc32(word[i:i + size].encode()) % dims] += 1
+    np.log1p(counts, out=counts)
+    return counts
+
+
+def _weigh(counts: np.ndarray, idf: np.ndarray) -> tuple:
+    """TF-IDF 가중 후 L2 정규화한 벡터와 정규화 전 크기"""
+    weighted = counts * idf
+    norms = np.maximum(np.linalg.norm(weighted, axis=-1, keepdims=True), 1e-12)
+    return weighted / norms, norms
+
+
+class _Partition:
+    """종목 하나의 정규화된 벡터 행렬 (용량을 두 배씩 늘려 추가를 상수 시간에 처리)
+
+    빈도 벡터는 따로 두지 않고 정규화 전 크기(norms)만 보관해, IDF 가 바뀌면 벡터 × 크기 / 이전 IDF 로 복원합니다.
+    """
+
+    def __init__(self, dims: int):
+        self.vectors = np.zeros((INITIAL_CAPACITY, dims), dtype=np.float32)
+        self.norms = np.zeros((INITIAL_CAPACITY, 1), dtype=np.float32)
+        self.entries: List[Dict[str, Any]] = []
+
+    def append(self, vector: np.ndarray, norm: np.ndarray, entry: Dict[str, Any]) -> None:
+        size = len(self.entries)
+        if size == len(self.vectors):
+            self.vectors = np.concatenate([self.vectors, np.zeros_like(self.vectors)])
+            self.norms = np.concatenate([self.norms, np.zeros_like(self.norms)])
+        self.vectors[size] = vector
+        self.norms[size] = norm
+        self.entries.append(entry)
+
+    def reweight(self, old_idf: np.ndarray, new_idf: np.ndarray) -> None:
+        size = len(self.entries)
+        counts = self.vectors[:size] * self.norms[:size] / old_idf
+        self.vectors[:size], self.norms[:size] = _weigh(counts, new_idf)
+
+
+class RumorIndex:
+    """종목별 유사 루머 색인"""
+
+    def __init__(self, path: str = RUMOR_INDEX_PATH, dims: int = RUMOR_INDEX_DIMS):
+        """초기화 (저장된 루머는 첫 조회/추가 때 색인)"""
+        self.path = path
+        self.dims = dims
+        self._partitions: Dict[str, _Partition] = {}
+        self._doc_freq = np.zeros(dims, dtype=np.float64)
+        self._docs = 0
+        self._weighted_docs = 0
+        self._idf = np.ones(dims, dtype=np.float32)
+        self._last_id = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        """호출마다 새 연결 (요청이 여러 스레드에서 처리됨)"""
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _reweight(self) -> None:
+        """현재 문서 빈도로 IDF 와 저장된 벡터 전체 재계산"""
+        old_idf = self._idf
+        self._idf = (np.log((1 + self._docs) / (1 + self._doc_freq)) + 1).astype(np.float32)
+        for partition in self._partitions.values():
+            partition.reweight(old_idf, self._idf)
+        self._weighted_docs = self._docs
+
+    def _catch_up(self) -> None:
+        """SQLite 에 새로 기록된 루머(다른 워커 포함)를 색인에 추가 (잠금 안에서 호출)"""
+        self._checked_at = time.monotonic()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, verification_id, company_key, company_name, rumor_text, final_result, news_count, created_at "
+                "FROM rumors WHERE id>? ORDER BY id",
+                (self._last_id,)
+            ).fetchall()
+        if not rows:
+            return
+        for row_id, verification_id, key, company_name, rumor_text, final_result, news_count, created_at in rows:
+            counts = term_counts(rumor_text, self.dims)
+            self._doc_freq += counts > 0
+            self._docs += 1
+            partition = self._partitions.setdefault(key, _Partition(self.dims))
+            vector, norm = _weigh(counts, self._idf)
+            partition.append(vector, norm, {
+                "verification_id": verification_id,
+                "company_name": company_name,
+                "rumor_text": rumor_text,
+                "final_result": final_result,
+                "news_count": news_count,
+                "timestamp": datetime.fromtimestamp(created_at).isoformat(),
+                "created_at": created_at,
+            })
+            self._last_id = row_id
+        if self._docs >= max(self._weighted_docs * REWEIGHT_GROWTH, 1):
+            self._reweight()
+
+    def add(self, verification_id: str, company_name: str, rumor_text: str, final_result: str, news_count: int) -> None:
+        """검증 결과 하나를 기록하고 색인에 추가"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO rumors (verification_id, company_key, company_name, rumor_text, final_result, news_count, "
+                "created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (verification_id, company_key(company_name), company_name, rumor_text, final_result, news_count, time.time())
+            )
+            conn.commit()
+        with self._lock:
+            self._catch_up()
+
+    def similar(self, company_name: str, rumor_text: str, top_k: int, min_score: float) -> List[Dict[str, Any]]:
+        """같은 종목의 유사 루머 (유사도 높은 순, score 는 코사인 유사도)"""
+        with self._lock:
+            if time.monotonic() - self._checked_at >= CATCH_UP_INTERVAL:
+                self._catch_up()
+            partition = self._partitions.get(company_key(company_name))
+            if partition is None or not partition.entries:
+                return []
+            size = len(partition.entries)
+            query, _ = _weigh(term_counts(rumor_text, self.dims), self._idf)
+            scores = partition.vectors[:size] @ query
+            entries = partition.entries
+        if top_k < size:
+            top = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top = np.arange(size)
+        top = top[np.argsort(-scores[top])]
+        return [
+            dict(entries[i], score=round(float(scores[i]), 3))
+            for i in top
+            if scores[i] >= min_score
+        ]
+
+    def load(self) -> None:
+        """저장된 루머를 미리 색인 (서버 워밍업 때 호출)"""
+        with self._lock:
+            self._catch_up()
+
+    def stats(self) -> Dict[str, Any]:
+        """/health 노출용 색인 규모"""
+        with self._lock:
+            partitions = list(self._partitions.values())
+            sizes = [len(partition.entries) for partition in partitions]
+            nbytes = sum(partition.vectors.nbytes + partition.norms.nbytes for partition in partitions)
+        return {
+            "entries": sum(sizes),
+            "companies": len(sizes),
+            "largest_partition": max(sizes, default=0),
+            "dims": self.dims,
+            "matrix_mb": round(nbytes / 1e6, 2),
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_rumor_index() -> Optional[RumorIndex]:
+    """프로세스 공유 색인 (RUMOR_INDEX_ENABLED=false 면 None)"""
+    global _index
+    if not RUMOR_INDEX_ENABLED:
+        return None
+    with _index_lock:
+        if _index is None:
+            _index = RumorIndex()
+        return _index
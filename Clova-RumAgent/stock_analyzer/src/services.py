@@ -0,0 +1,129 @@
+"""
+서비스 클라이언트 컨테이너 모듈
+FastAPI lifespan / CLI에서 공통으로 사용하는 지연 초기화 및 준비 상태 관리
+"""
+
+import time
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """지연 초기화되는 서비스 클라이언트 모음"""
+
+    CLIENT_NAMES = ("news_searcher", "ai_analyzer", "result_storage", "company_extractor")
+
+    def __init__(self):
+        """초기화 (실제 클라이언트 생성은 initialize()에서 수행)"""
+        self.news_searcher = None
+        self.ai_analyzer = None
+        self.result_storage = None
+        self.company_extractor = None
+        self.news_prefetcher = None  # 관심 종목 뉴스 사전 수집 (start_prefetch() 후 사용)
+
+        self.client_status: Dict[str, str] = {name: "pending" for name in self.CLIENT_NAMES}
+        self.client_errors: Dict[str, str] = {}
+        self.warmed_up = False
+        self._started_at: Optional[float] = None
+        self._ready_at: Optional[float] = None
+        self._ready_timestamp: Optional[str] = None
+
+    def initialize(self) -> None:
+        """클라이언트 생성 (네트워크 호출 없이 가벼운 객체만 생성)"""
+        from src.news_searcher import NewsSearcher
+        from src.ai_analyzer import AIAnalyzer
+        from src.result_storage import ResultStorage
+        from src.company_extractor import CompanyExtractor
+
+        self._started_at = time.perf_counter()
+        factories = {
+            "news_searcher": NewsSearcher,
+            "ai_analyzer": AIAnalyzer,
+            "result_storage": ResultStorage,
+            "company_extractor": CompanyExtractor,
+        }
+        for name, factory in factories.items():
+            try:
+                setattr(self, name, factory())
+                self.client_status[name] = "initialized"
+            except Exception as e:
+                self.client_status[name] = "failed"
+                self.client_errors[name] = str(e)
+                logger.error(f"{name} 초기화 실패: {e}")
+
+    def warm_up(self) -> None:
+        """LLM 클라이언트 생성 및 프롬프트 로드 (서버 기동 후 백그라운드 실행)"""
+        for name in ("ai_analyzer", "company_extractor"):
+            client = getattr(self, name)
+            if client is None:
+                continue
+            try:
+                client.warm_up()
+                self.client_status[name] = "ready"
+            except Exception as e:
+                self.client_status[name] = "failed"
+                self.client_errors[name] = str(e)
+                logger.error(f"{name} 워밍업 실패: {e}")
+
+        if self.result_storage is not None:
+            try:
+                self.result_storage.warm_up()
+            except Exception as e:
+                logger.error(f"유사 루머 색인 로드 실패: {e}")
+
+        for name in ("news_searcher", "result_storage"):
+            if self.client_status[name] == "initialized":
+                self.client_status[name] = "ready"
+
+        self.warmed_up = True
+        self._ready_at = time.perf_counter()
+        self._ready_timestamp = datetime.now().isoformat()
+        logger.info(f"서비스 준비 완료 ({self.time_to_ready:.3f}s)")
+
+    def start_prefetch(self) -> None:
+        """관심 종목 뉴스 사전 수집 시작 (뉴스 검색/AI 분석 클라이언트가 없으면 생략)"""
+        from src.news_prefetcher import NewsPrefetcher
+
+        if self.news_searcher is None or self.ai_analyzer is None:
+            logger.warning("뉴스 사전 수집 생략: 뉴스 검색/AI 분석 클라이언트 없음")
+            return
+        self.news_prefetcher = NewsPrefetcher(self.news_searcher, self.ai_analyzer)
+        self.news_prefetcher.start()
+
+    def stop_prefetch(self) -> None:
+        """관심 종목 뉴스 사전 수집 중지"""
+        if self.news_prefetcher is not None:
+            self.news_prefetcher.stop()
+
+    def require(self, name: str) -> Any:
+        """초기화된 클라이언트 반환, 없으면 RuntimeError"""
+        client = getattr(self, name, None)
+        if client is None:
+            reason = self.client_errors.get(name, "초기화되지 않음")
+            raise RuntimeError(f"{name} 사용 불가: {reason}")
+        return client
+
+    @property
+    def ready(self) -> bool:
+        """모든 클라이언트가 준비되었는지 여부"""
+        return self.warmed_up and all(status == "ready" for status in self.client_status.values())
+
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        """initialize() 시작부터 워밍업 완료까지 걸린 시간(초)"""
+        if self._started_at is None or self._ready_at is None:
+            return None
+        return self._ready_at - self._started_at
+
+    def readiness(self) -> Dict[str, Any]:
+        """준비 상태 요약"""
+        return {
+            "ready": self.ready,
+            "clients": dict(self.client_status),
+            "errors": dict(self.client_errors),
+            "time_to_ready": round(self.time_to_ready, 4) if self.time_to_ready is not None else None,
+            "ready_at": self._ready_timestamp,
+        }